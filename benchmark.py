@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+if __name__ == "__main__":
+    import argparse
+    import datetime
+    import json
+    import platform
+    import subprocess
+    import sys
+
+    import numpy as np
+    import pandas as pd
+
+    from src.benchmark.Benchmark import Benchmark
+    from src.benchmark.DatasetGenerator import DatasetGenerator
+    from src.config import ConfigBenchmark as Cfg
+
+    parser = argparse.ArgumentParser(description="Measure the hot paths of the application on generated datasets.")
+    parser.add_argument("-r", "--rows", type=int, nargs="+", default=Cfg.ROWS, help="numbers of rows")
+    parser.add_argument("-d", "--depth", type=int, nargs="+", default=Cfg.DEPTHS,
+                        help="lengths of the derivative chains")
+    parser.add_argument("-a", "--alternatives", type=int, nargs="+", default=Cfg.ALTERNATIVES,
+                        help="numbers of alternatives")
+    parser.add_argument("-n", "--repeat", type=int, default=Cfg.REPEAT, help="measurements of each stage")
+    parser.add_argument("-s", "--seed", type=int, default=Cfg.SEED, help="seed of the generated datasets")
+    parser.add_argument("-e", "--estimate", action="store_true", help="also measure the estimation")
+    parser.add_argument("-o", "--output", default=None, help="path of the json result file (default: standard output)")
+    args = parser.parse_args()
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    benchmark = Benchmark(DatasetGenerator(args.seed), args.repeat)
+    results = []
+    for rows in args.rows:
+        for depth in args.depth:
+            for alternatives in args.alternatives:
+                for result in benchmark.run(rows, depth, alternatives, args.estimate):
+                    print(Cfg.RESULT_FORMAT % (result["stage"], rows, depth, alternatives, result["min"],
+                                               result["median"]), file=sys.stderr)
+                    results.append(result)
+
+    report = json.dumps({
+        "commit": commit,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "seed": args.seed,
+        "results": results,
+    }, indent=2)
+    if args.output is None:
+        print(report)
+    else:
+        with open(args.output, "w") as file:
+            file.write(report)
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    from src.config import ConfigBatchEstimation as Cfg
+    from src.config import ConfigProcessing
+    from src.controller.calculation.BatchEstimationController import BatchEstimationController
+    from src.model.SnapshotError import SnapshotError
+
+    parser = argparse.ArgumentParser(description="Estimate a saved project without the graphical user interface.")
+    parser.add_argument("project", help="directory or packed project file of the saved project")
+    parser.add_argument("-o", "--output", default=None,
+                        help="path of the evaluation csv file (default: evaluation file of the project)")
+    parser.add_argument("-c", "--config", type=int, default=None,
+                        help="index of the processing configuration (default: selected configuration of the project)")
+    parser.add_argument("-w", "--warm-start", action="store_true",
+                        help="start from the estimated values of the evaluation saved in the project")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="maximum number of processes estimating in parallel, 1 estimates in this process "
+                             "(default: %d)" % ConfigProcessing.MAX_WORKERS)
+    args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("the number of workers has to be at least 1")
+
+    controller = BatchEstimationController()
+    try:
+        timings = controller.run(args.project, args.output, args.config, args.warm_start, args.workers)
+    except Exception as e:
+        error = e.parent if isinstance(e, SnapshotError) else e
+        print(f"{type(error).__name__}: {error}", file=sys.stderr)
+        sys.exit(1)
+
+    for phase, duration in timings.items():
+        print(Cfg.TIMING_FORMAT % (phase, duration))
+    iterations, saved_iterations = controller.get_iterations()
+    print(Cfg.ITERATIONS_FORMAT % (Cfg.UNKNOWN if iterations is None else iterations,
+                                   Cfg.UNKNOWN if saved_iterations is None else saved_iterations))
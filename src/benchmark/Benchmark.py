@@ -0,0 +1,184 @@
+"""This module contains only one class with the same name."""
+
+from __future__ import annotations
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable
+
+import pandas as pd
+
+from src.benchmark.DatasetGenerator import DatasetGenerator
+from src.config import ConfigBenchmark as Cfg
+from src.controller.ProjectManager import ProjectManager
+from src.model.ProjectSnapshot import ProjectSnapshot
+from src.model.data.Data import Data
+from src.model.data.Model import Model
+from src.model.data.functions.FunctionalExpression import FunctionalExpression
+from src.model.processing.SingleLogitBiogemeConfig import SingleLogitBiogemeConfig
+
+
+class Benchmark:
+    """
+    Measures the durations of the hot paths of the application without graphical user interface:
+    validation of all expressions, calculation of the derivatives (complete and after a change of one derivative),
+    row by row evaluation of all derivatives (and the per row evaluation through apply as baseline), saving and
+    opening a project as directory and as packed project file and the estimation.
+    Each stage is measured with cold caches.
+
+    Attributes:
+        generator: Generator of the benchmark datasets and models.
+        :type generator: DatasetGenerator
+        repeat: Number of measurements of each stage.
+        :type repeat: int
+    """
+
+    def __init__(self, generator: DatasetGenerator, repeat: int = Cfg.REPEAT):
+        self.generator = generator
+        self.repeat = repeat
+
+    def run(self, rows: int, depth: int, alternatives: int, estimate: bool) -> list[dict[str, object]]:
+        """
+        Measures all stages on a generated dataset and model.
+        :param rows: Number of rows of the dataset.
+        :type rows: int
+        :param depth: Length of the derivative chains.
+        :type depth: int
+        :param alternatives: Number of alternatives.
+        :type alternatives: int
+        :param estimate: Whether the estimation is measured.
+        :type estimate: bool
+        :return: One result per stage with the parameters, all measured durations in seconds, their minimum and median.
+        :rtype: list[dict[str, object]]
+        """
+        raw_data = self.generator.raw_data(rows, alternatives)
+        derivatives = DatasetGenerator.derivatives(alternatives, depth)
+        model = Model(Data(raw_data, None, derivatives), DatasetGenerator.alternatives(alternatives, depth),
+                      DatasetGenerator.choice())
+
+        stages: dict[str, Callable[[], Callable[[], object]]] = {
+            Cfg.STAGE_VALIDATION: lambda: self.__validation(model),
+            Cfg.STAGE_COMPLETE_DATA: lambda: self.__complete_data(raw_data, derivatives),
+            Cfg.STAGE_INCREMENTAL_COMPLETE_DATA: lambda: self.__incremental_complete_data(raw_data, derivatives),
+            Cfg.STAGE_ROW_WISE: lambda: self.__row_wise(raw_data, derivatives),
+            Cfg.STAGE_ROW_WISE_APPLY: lambda: self.__row_wise_apply(raw_data, derivatives),
+        }
+        if estimate:
+            stages[Cfg.STAGE_ESTIMATION] = lambda: self.__estimation(model)
+
+        results = [self.__result(stage, rows, depth, alternatives, [self.__measure(prepare) for _ in range(self.repeat)])
+                   for stage, prepare in stages.items()]
+
+        with tempfile.TemporaryDirectory() as directory:
+            raw_data_path = os.path.join(directory, Cfg.RAW_DATA_FILE)
+            raw_data.to_csv(raw_data_path, sep=';', index=False)
+            for project_path, save_stage, open_stage in [
+                (os.path.join(directory, Cfg.PROJECT_DIRECTORY), Cfg.STAGE_SAVE, Cfg.STAGE_OPEN),
+                (os.path.join(directory, Cfg.PACKED_PROJECT_FILE), Cfg.STAGE_SAVE_PACKED, Cfg.STAGE_OPEN_PACKED)
+            ]:
+                save_durations, open_durations = [], []
+                for _ in range(self.repeat):
+                    self.__prepare_project(raw_data_path, derivatives, model)
+                    save_durations.append(self.__measure(lambda: lambda: ProjectManager().save(project_path)))
+                    open_durations.append(self.__measure(lambda: lambda: ProjectManager().open(project_path)))
+                results.append(self.__result(save_stage, rows, depth, alternatives, save_durations))
+                results.append(self.__result(open_stage, rows, depth, alternatives, open_durations))
+        return results
+
+    @staticmethod
+    def __measure(prepare: Callable[[], Callable[[], object]]) -> float:
+        """
+        Prepares a stage without measuring and measures its execution.
+        :param prepare: Returns the function executing the stage.
+        :return: Duration of the execution in seconds.
+        """
+        execute = prepare()
+        start = time.perf_counter()
+        execute()
+        return time.perf_counter() - start
+
+    @staticmethod
+    def __result(stage: str, rows: int, depth: int, alternatives: int, durations: list[float]) -> dict[str, object]:
+        return {
+            'stage': stage,
+            'rows': rows,
+            'depth': depth,
+            'alternatives': alternatives,
+            'seconds': durations,
+            'min': min(durations),
+            'median': statistics.median(durations)
+        }
+
+    @staticmethod
+    def __validation(model: Model) -> Callable[[], object]:
+        FunctionalExpression.clear_validation_cache()
+        snapshot = ProjectSnapshot(model=Model(Data(model.data.raw_data, None, model.data.derivatives),
+                                               model.alternatives, model.choice))
+
+        def __execute():
+            for label in snapshot.get_derivatives():
+                snapshot.get_derivative_error_report(label)
+            for label in snapshot.get_alternatives():
+                snapshot.get_alternative_error_report(label)
+                snapshot.get_availability_condition_error_report(label)
+            snapshot.get_choice_error_report()
+
+        return __execute
+
+    @staticmethod
+    def __complete_data(raw_data: pd.DataFrame, derivatives: dict[str, FunctionalExpression]) -> Callable[[], object]:
+        data = Data(raw_data, None, derivatives)
+        return lambda: data.complete_data
+
+    @staticmethod
+    def __incremental_complete_data(raw_data: pd.DataFrame,
+                                    derivatives: dict[str, FunctionalExpression]) -> Callable[[], object]:
+        data = Data(raw_data, None, derivatives)
+        data.complete_data
+        # change the last derivative, no other derivative depends on it
+        label = list(derivatives.keys())[-1]
+        changed = data.set_derivative(label, FunctionalExpression(f'{derivatives[label].expression} + 0'))
+        return lambda: changed.complete_data
+
+    @staticmethod
+    def __row_wise(raw_data: pd.DataFrame, derivatives: dict[str, FunctionalExpression]) -> Callable[[], object]:
+        complete_data = Data(raw_data, None, derivatives).complete_data
+
+        def __execute():
+            # the way derivatives are calculated, which can not be evaluated on whole columns
+            for expression in derivatives.values():
+                expression.eval_rows(len(complete_data), **{label: complete_data[label].tolist()
+                                                            for label in expression.variables})
+
+        return __execute
+
+    @staticmethod
+    def __row_wise_apply(raw_data: pd.DataFrame,
+                         derivatives: dict[str, FunctionalExpression]) -> Callable[[], object]:
+        complete_data = Data(raw_data, None, derivatives).complete_data
+
+        def __execute():
+            # baseline: one call of eval per row with the row as keyword arguments
+            for expression in derivatives.values():
+                rows = pd.Series(complete_data[sorted(expression.variables)].to_dict(orient='records'),
+                                 index=complete_data.index, dtype=object)
+                rows.apply(lambda row: expression.eval(**row))
+
+        return __execute
+
+    @staticmethod
+    def __estimation(model: Model) -> Callable[[], object]:
+        SingleLogitBiogemeConfig.clear_database_cache()
+        model.data.complete_data
+        return lambda: SingleLogitBiogemeConfig().process(model)
+
+    @staticmethod
+    def __prepare_project(raw_data_path: str, derivatives: dict[str, FunctionalExpression], model: Model):
+        project_manager = ProjectManager()
+        project_manager.new()
+        project_manager.import_raw_data(raw_data_path)
+        project = project_manager.get_project()
+        project.set_derivatives(**derivatives)
+        project.set_alternatives(**model.alternatives)
+        project.set_choice(model.choice)
@@ -0,0 +1,123 @@
+"""This module contains only one class with the same name."""
+
+from __future__ import annotations
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.config import ConfigBenchmark as Cfg
+from src.model.data.Alternative import Alternative
+from src.model.data.functions.FunctionalExpression import FunctionalExpression
+
+
+class DatasetGenerator:
+    """
+    Synthesizes datasets and models shaped like the swissmetro example for benchmarks.
+    Rows are resampled from the swissmetro data. The first three alternatives use the travel time, cost and
+    availability of train, swissmetro and car, further alternatives use perturbed copies of them. The choice is
+    simulated with a logit model, so the generated models can be estimated.
+
+    Attributes:
+        seed: Seed of the random number generator. Equal seeds generate equal datasets.
+        :type seed: int
+    """
+
+    __SWISSMETRO_PATH = f'{os.path.dirname(__file__)}/../test/resources/swissmetro.csv'
+    __MODES = ['TRAIN', 'SM', 'CAR']
+
+    def __init__(self, seed: int = Cfg.SEED):
+        self.seed = seed
+        self.__swissmetro = pd.read_csv(DatasetGenerator.__SWISSMETRO_PATH, sep='\t')
+
+    def raw_data(self, rows: int, alternatives: int) -> pd.DataFrame:
+        """
+        Generates raw data.
+        :param rows: Number of rows.
+        :type rows: int
+        :param alternatives: Number of alternatives, at least one.
+        :type alternatives: int
+        :return: Generated raw data with the columns ALT<k>_TT, ALT<k>_CO and ALT<k>_AV for each alternative k,
+        the socio-economic columns of the swissmetro data and the simulated CHOICE.
+        :rtype: pd.DataFrame
+        """
+        if alternatives < 1:
+            raise ValueError('at least one alternative is required')
+        generator = np.random.default_rng(self.seed)
+        sample = self.__swissmetro.iloc[generator.integers(0, len(self.__swissmetro), rows)].reset_index(drop=True)
+        data = sample.drop(columns=[c for c in sample.columns if c.split('_')[0] in DatasetGenerator.__MODES
+                                    or c == 'CHOICE'])
+
+        utilities = np.empty((rows, alternatives))
+        for k in range(1, alternatives + 1):
+            mode = DatasetGenerator.__MODES[(k - 1) % len(DatasetGenerator.__MODES)]
+            scale = 1 if k <= len(DatasetGenerator.__MODES) else generator.uniform(0.8, 1.2, rows)
+            data[f'ALT{k}_TT'] = np.round(sample[f'{mode}_TT'].to_numpy() * scale)
+            data[f'ALT{k}_CO'] = np.round(sample[f'{mode}_CO'].to_numpy() * scale)
+            # the first alternative is always available, so every row has an available alternative
+            data[f'ALT{k}_AV'] = 1 if k == 1 else sample[f'{mode}_AV'].to_numpy()
+            utilities[:, k - 1] = Cfg.ASC * (k > 1) + Cfg.B_TIME * data[f'ALT{k}_TT'] / 100 \
+                + Cfg.B_COST * data[f'ALT{k}_CO'] / 100 + generator.gumbel(size=rows)
+            utilities[data[f'ALT{k}_AV'].to_numpy() == 0, k - 1] = -np.inf
+        data['CHOICE'] = utilities.argmax(axis=1) + 1
+        return data
+
+    @staticmethod
+    def derivatives(alternatives: int, depth: int) -> dict[str, FunctionalExpression]:
+        """
+        Generates derivatives scaling travel time and cost of each alternative. Each scaled value is calculated through
+        a chain of depth derivatives, each depending on the previous one.
+        :param alternatives: Number of alternatives.
+        :type alternatives: int
+        :param depth: Length of the derivative chains, at least one.
+        :type depth: int
+        :return: Generated derivatives.
+        :rtype: dict[str, FunctionalExpression]
+        """
+        derivatives = {}
+        for k in range(1, alternatives + 1):
+            for attribute in ('TT', 'CO'):
+                previous = f'ALT{k}_{attribute}'
+                for level in range(depth):
+                    label = DatasetGenerator.__derivative_label(k, attribute, level)
+                    if level == 0:
+                        expression = f'{previous} / 100'
+                    elif level % 2 == 1:
+                        expression = f'{previous} * (1 + 0 * (PURPOSE in [1, 3]))'
+                    else:
+                        expression = f'max({previous}, 0) + (GA == 2)'
+                    derivatives[label] = FunctionalExpression(expression)
+                    previous = label
+        return derivatives
+
+    @staticmethod
+    def alternatives(alternatives: int, depth: int) -> dict[str, Alternative]:
+        """
+        Generates logit alternatives using the last derivative of each chain.
+        :param alternatives: Number of alternatives.
+        :type alternatives: int
+        :param depth: Length of the derivative chains.
+        :type depth: int
+        :return: Generated alternatives.
+        :rtype: dict[str, Alternative]
+        """
+        result = {}
+        for k in range(1, alternatives + 1):
+            asc = f'ASC_{k} + ' if k > 1 else ''
+            time = DatasetGenerator.__derivative_label(k, 'TT', depth - 1)
+            cost = DatasetGenerator.__derivative_label(k, 'CO', depth - 1)
+            result[f'alt{k}'] = Alternative(FunctionalExpression(f'{asc}B_TIME * {time} + B_COST * {cost}'),
+                                            FunctionalExpression(f'ALT{k}_AV'), k)
+        return result
+
+    @staticmethod
+    def choice() -> FunctionalExpression:
+        """
+        :return: Choice variable of the generated models.
+        :rtype: FunctionalExpression
+        """
+        return FunctionalExpression('CHOICE')
+
+    @staticmethod
+    def __derivative_label(alternative: int, attribute: str, level: int) -> str:
+        return f'ALT{alternative}_{attribute}_D{level}'
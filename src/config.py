@@ -1,3 +1,4 @@
+import os
 import platform
 """Module containing all the hardcoded variables"""
 
@@ -15,6 +16,8 @@ class ConfigErrorMessages:
     ERROR_MSG_CANT_SELECT_RAW_DATA = "Non derived data can not be edited."
     ERROR_MSG_FUNCTION_NOT_EXISTENT = "The selected derivative or alternative does not exist."
     ERROR_MSG_CHOICE_INDEX_NOT_INTEGER = "The choice index needs to be an integer."
+    ERROR_MSG_OUTDATED_EVALUATION = "The model or the processing configuration has been changed during the " \
+                                    "calculation. The evaluation has been discarded, please calculate it again."
 
 
 class ConfigExpressionErrors:
@@ -31,6 +34,19 @@ class ConfigExpressionErrors:
     ERROR_INVALID_VARIABLE = "Variable '{0}' is not valid."
 
 
+class ConfigCaches:
+    """Configuration of cache sizes"""
+    VALIDATION_CACHE_SIZE = 4096
+    DATABASE_CACHE_SIZE = 2
+
+
+class ConfigHistory:
+    """Configuration of the undo history of a project"""
+    MAX_SNAPSHOTS = 100  # number of versions of the project which are kept for undo and redo
+    MAX_MEMORY = 4 * 1024 ** 3  # bytes of the tables held by all kept versions
+    MAX_CHANGES = 100  # number of recorded changes, views displaying an older version are refreshed completely
+
+
 class ConfigRegexPatterns:
     """Configuration of used regex patterns"""
     PATTERN_FUNCTION_LABEL = "^[a-zA-Z]+[a-zA-Z0-9_]*$"
@@ -44,6 +60,12 @@ class ConfigFiles:
     POSSIBLE_SEPARATORS = [";", ",", "\t"]
     DEFAULT_DECIMAL_POINT = ","
     POSSIBLE_DECIMAL_POINTS = [",", "."]
+    CSV_SNIFF_SIZE = 1 << 20  # characters of a csv file used to detect its format and the text columns
+    CSV_CHUNK_ROWS = 100_000  # rows of a csv file parsed at once
+    PARQUET_EXTENSION = ".parquet"
+    FEATHER_EXTENSIONS = (".feather", ".arrow")
+    NUMPY_EXTENSION = ".npy"
+    FINGERPRINT_ATTRIBUTE = "fingerprint"  # attribute of imported tables identifying the version of their source file
 
 
 class ConfigModelWidget:
@@ -112,9 +134,11 @@ class ConfigFileMenu:
     SAVE_PROJECT_DIALOG_TITLE = 'Save Project'
     SAVE_PROJECT_AS_DIALOG_TITLE = 'Save Project As'
     IMPORT_DATA_DIALOG_TITLE = 'Import Data'
+    IMPORT_DATA_PROGRESS_TEXT = 'Importing data...'
+    IMPORT_DATA_PROGRESS_DELAY = 500  # milliseconds before the progress of an import is shown
     EXPORT_DATA_DIALOG_TITLE = 'Export To'
     DIRECTORY_FILE_FORMAT = 'Directory (*.dir)'
-    CSV_FILE_FORMAT = 'CSV File (*.csv)'
+    DATA_FILE_FORMATS = 'CSV File (*.csv);;Parquet File (*.parquet);;Feather File (*.feather *.arrow)'
     WARNING_DIALOG_TITLE = 'Warning!'
     MESSAGE_DIALOG_SAVE_BEFORE_NEW = 'Do you wish to save the project before opening a new one?'
     MESSAGE_DIALOG_SAVE_BEFORE_OTHER = 'Do you wish to save the project before opening another one?'
@@ -126,8 +150,10 @@ class ConfigFileMenu:
 class ConfigEvaluationWidget:
     """Configuration of the EvaluationWidget"""
     EXPORT_DIALOG_TITLE = 'Export File'
-    CSV_FILE_FORMAT = 'CSV File (*.csv)'
+    EXPORT_FILE_FORMATS = 'CSV File (*.csv);;Parquet File (*.parquet);;Feather File (*.feather *.arrow)'
     TEXT_CALCULATION = "Calculating..."
+    TEXT_PROGRESS = "Calculating... (%d of %d estimations finished)"
+    TEXT_CANCEL = "Cancel"
 
 
 class ConfigThresholdWindow:
@@ -153,9 +179,65 @@ class ConfigProjectManager:
     DERIVATIVES = "derivatives"
     THRESHOLDS = "thresholds"
     PROCESSING_CONFIGS = "processing_configs"
+    PACKED_EXTENSION = ".dcproj"  # projects saved to a path with this extension are packed into a single file
+    PACKED_FORMAT = "discrete-choice-project"
+    PACKED_VERSION = 1
+    AUTOSAVE_DELAY = 0.5  # seconds without changes before the project is saved automatically
+    DERIVATIVE_CACHE = "derivative_cache"  # directory of the calculated derivative columns inside the project directory
+    DERIVATIVE_CACHE_INDEX = "index.json"
     USER_MANUAL_NAME = "user_manual.pdf"
 
 
+class ConfigProcessing:
+    """Configuration of the processing configurations"""
+    # number of processes estimating the components of a varied configuration, 1 runs them in-process
+    MAX_WORKERS = min(os.cpu_count() or 1, 8)
+    WORKER_START_METHOD = "spawn"
+    BIOGEME_PARAMETER_FILE = "biogeme.toml"
+    VALUE_COLUMN = "Value"  # column of the estimated parameter values in a result
+    ITERATIONS_MESSAGE = "Number of iterations"
+
+
+class ConfigBatchEstimation:
+    """Configuration of the estimation without graphical user interface"""
+    PHASE_DATA_LOAD = "data load"
+    PHASE_DERIVATIVES = "derivatives"
+    PHASE_ESTIMATION = "estimation"
+    PHASE_EXPORT = "export"
+    TIMING_FORMAT = "%-12s %10.3f s"
+    ITERATIONS_FORMAT = "iterations: %s (saved by warm start: %s)"
+    UNKNOWN = "unknown"
+    ERROR_PROJECT_NOT_FOUND = "Project '%s' does not exist."
+    ERROR_PROJECT_NOT_OPENED = "Project '%s' could not be opened."
+    ERROR_RAW_DATA_NOT_FOUND = "Raw data file '%s' of the project does not exist."
+
+
+class ConfigBenchmark:
+    """Configuration of the benchmark suite"""
+    SEED = 0
+    ASC = -0.5  # coefficients of the simulated choice
+    B_TIME = -1.2
+    B_COST = -1.0
+    ROWS = [10_000, 100_000, 1_000_000]
+    DEPTHS = [1, 8]
+    ALTERNATIVES = [3]
+    REPEAT = 3
+    RAW_DATA_FILE = "raw_data.csv"
+    PROJECT_DIRECTORY = "project"
+    PACKED_PROJECT_FILE = "project.dcproj"
+    STAGE_VALIDATION = "validation"
+    STAGE_COMPLETE_DATA = "complete data"
+    STAGE_INCREMENTAL_COMPLETE_DATA = "incremental complete data"
+    STAGE_ROW_WISE = "row-wise evaluation"
+    STAGE_ROW_WISE_APPLY = "row-wise apply (baseline)"
+    STAGE_SAVE = "save"
+    STAGE_OPEN = "open"
+    STAGE_SAVE_PACKED = "save packed"
+    STAGE_OPEN_PACKED = "open packed"
+    STAGE_ESTIMATION = "estimation"
+    RESULT_FORMAT = "%-26s rows=%-8d depth=%-3d alternatives=%-3d min %10.3f s  median %10.3f s"
+
+
 class ConfigProcessingWidget:
     HEADERS = ['Variable', 'Value']
     CHOICE = "$CHOICE"
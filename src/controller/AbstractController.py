@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from src.model.Project import Project
+from src.model.ProjectChange import ProjectChange
 from src.controller.ProjectManager import ProjectManager
 
 
@@ -24,6 +25,25 @@ class AbstractController:
         """
         return self.__project_manager.get_project()
 
+    def get_version(self) -> int:
+        """Accessor method for the version of the current project. Every change of the project leads to a new version.
+
+        Returns:
+            int: The current version.
+        """
+        return self.__project_manager.get_version()
+
+    def get_changes(self, since: int | None) -> ProjectChange | None:
+        """Accessor method for the changes of the project since a version, so views only refresh the affected entries.
+
+        Args:
+            since (int | None): Version returned by get_version before. None if nothing has been displayed yet.
+
+        Returns:
+            ProjectChange | None: The changes since the version. None if everything has to be refreshed.
+        """
+        return self.__project_manager.get_changes(since)
+
     def save(self):
         """
         Method used to initiate the saving process in a different thread after every step that changes the model.
@@ -0,0 +1,113 @@
+"""This module contains only one class with the same name."""
+
+from __future__ import annotations
+import atexit
+import threading
+import time
+from typing import Callable
+
+
+class AutosaveScheduler:
+    """Runs a save function on a single long-lived worker thread, after changes have stopped for a while.
+    Every scheduled save is coalesced with the following ones into one save, which runs once no save has been
+    scheduled for the delay. A save scheduled while a save runs is not skipped but runs afterwards, so the latest state
+    is always written eventually. Pending saves are flushed when the interpreter exits.
+
+    Attributes:
+        delay: Quiet period in seconds after the last scheduled save, before the save runs.
+        :type delay: float
+    """
+
+    def __init__(self, save: Callable[[], object], delay: float):
+        """Initializes a scheduler. The worker thread is started by the first scheduled save.
+
+        Args:
+            save (Callable[[], object]): Function saving the current state. Errors it raises are kept as last error.
+            delay (float): Quiet period in seconds after the last scheduled save, before the save runs.
+        """
+        self.delay = delay
+        self.__save = save
+        self.__condition = threading.Condition()
+        self.__worker: threading.Thread | None = None
+        self.__pending = False  # whether a save is scheduled and has not started yet
+        self.__saving = False
+        self.__flushing = 0  # number of threads waiting for a flush, the quiet period is skipped while positive
+        self.__last_schedule = 0.0
+        self.__last_error: Exception | None = None
+
+    def schedule(self):
+        """Schedules a save. It runs after no save has been scheduled for the delay."""
+        with self.__condition:
+            self.__pending = True
+            self.__last_schedule = time.monotonic()
+            if self.__worker is None:
+                self.__worker = threading.Thread(target=self.__run, daemon=True)
+                self.__worker.start()
+                atexit.register(self.flush)
+            self.__condition.notify_all()
+
+    def flush(self, timeout: float = None) -> bool:
+        """Runs a scheduled save immediately and waits until all saves have finished.
+
+        Args:
+            timeout (float): Maximum time to wait in seconds. Waits without limit if None.
+
+        Returns:
+            bool: True if no save is pending or running anymore. Else False.
+        """
+        with self.__condition:
+            self.__flushing += 1
+            self.__condition.notify_all()
+            try:
+                return self.__condition.wait_for(lambda: not self.__pending and not self.__saving, timeout)
+            finally:
+                self.__flushing -= 1
+
+    def cancel(self):
+        """Discards a scheduled save, which has not started yet. A running save is not interrupted."""
+        with self.__condition:
+            self.__pending = False
+            self.__condition.notify_all()
+
+    def is_pending(self) -> bool:
+        """
+        Returns:
+            bool: Whether a save is scheduled or running.
+        """
+        with self.__condition:
+            return self.__pending or self.__saving
+
+    def get_last_error(self) -> Exception | None:
+        """
+        Returns:
+            Exception | None: Error raised by the last save, None if it succeeded or no save has run yet.
+        """
+        with self.__condition:
+            return self.__last_error
+
+    def __run(self):
+        """Loop of the worker thread. Waits for scheduled saves and runs them after the quiet period."""
+        while True:
+            with self.__condition:
+                while True:
+                    if not self.__pending:
+                        self.__condition.wait()
+                        continue
+                    remaining = self.__last_schedule + self.delay - time.monotonic()
+                    if remaining > 0 and self.__flushing == 0:
+                        self.__condition.wait(remaining)
+                        continue
+                    break
+                self.__pending = False
+                self.__saving = True
+
+            error = None
+            try:
+                self.__save()
+            except Exception as e:
+                error = e
+
+            with self.__condition:
+                self.__saving = False
+                self.__last_error = error
+                self.__condition.notify_all()
@@ -1,43 +1,87 @@
 from __future__ import annotations
+import io
 import json
+import os
+import tempfile
+from typing import Callable
 import pandas as pd
 import numpy as np
 
-from src.config import ConfigFiles
+from src.config import ConfigFiles, ConfigProjectManager
 
 
 class FileManager:
     """Interface that takes care of reading in files and making files for the export."""
 
     @staticmethod
-    def export(path: str, file_content: object = None) -> bool:
+    def export(path: str, file_content: object = None, atomic: bool = False) -> bool:
         """Method responsible for the export of general files.
         Currently implemented for JSON files.
 
         Args:
             path (str): The path where the file should be added, containing the filename.
             file_content (object): The content to be written in the file.
+            atomic (bool): Whether an existing file is replaced atomically. The content is written into a temporary
+                file in the same directory first, which then replaces the file. So the file is never left partially
+                written.
 
         Returns:
             bool: True if export was successful. Else an error is raised.
         """
         try:
-            if path.endswith("json"):
-                FileManager.__write_string_file(path, file_content)
-            elif path.endswith("csv"):
-                FileManager.__write_csv_file(path, file_content)
+            if not atomic:
+                FileManager.__write_file(path, file_content)
+                return True
+
+            directory, name = os.path.split(path)
+            handle, temporary_path = tempfile.mkstemp(suffix=os.path.splitext(name)[1], prefix=f'.{name}.',
+                                                      dir=directory if directory else None)
+            os.close(handle)
+            try:
+                FileManager.__write_file(temporary_path, file_content)
+                os.replace(temporary_path, path)
+            except BaseException:
+                os.remove(temporary_path)
+                raise
             return True
 
         except OSError as error:
             return error
 
     @staticmethod
-    def import_(path: str) -> object:
+    def __write_file(path: str, file_content: object):
+        """Writes a file of the format given by the extension of the path.
+
+        Args:
+            path (str): full path to file.
+            file_content (object): The content to be written in the file.
+        """
+        if path.endswith("json") or path.endswith(ConfigProjectManager.PACKED_EXTENSION):
+            FileManager.__write_string_file(path, file_content)
+        elif path.endswith(ConfigFiles.PARQUET_EXTENSION):
+            file_content.to_parquet(path)
+        elif path.endswith(ConfigFiles.NUMPY_EXTENSION):
+            np.save(path, file_content, allow_pickle=False)
+        elif path.endswith(ConfigFiles.FEATHER_EXTENSIONS):
+            FileManager.__write_feather_file(path, file_content)
+        elif path.endswith("csv"):
+            if isinstance(file_content, str):
+                FileManager.__write_string_file(path, file_content)  # csv text, e.g. of an unpacked project
+            else:
+                FileManager.__write_csv_file(path, file_content)
+
+    @staticmethod
+    def import_(path: str, progress: Callable[[int, int], None] = None, columns: set[str] = None) -> object:
         """Function that deals with reading the files to be imported from the specified path. 
-        Currently supports: JSON
+        Currently supports: JSON, CSV, Parquet, Feather, NumPy arrays and packed projects, which are returned as text.
+        Parquet and Feather files require pyarrow.
 
         Args:
             path (str): Path to the file to be imported.
+            progress (Callable[[int, int], None]): Called with the number of bytes read and the size of the file while
+                a CSV file is read.
+            columns (set[str]): Columns read from a CSV, Parquet or Feather file, names which are no column of the
+                file are ignored. Defaults to all columns.
 
         Returns:
             object: The content of the file.
@@ -53,7 +97,41 @@ class FileManager:
             except Exception as error:
                 raise error
         elif path.endswith('.csv'):
-            return FileManager.__read_csv_file(path)
+            return FileManager.__read_csv_file(path, progress, columns)
+        elif path.endswith(ConfigFiles.PARQUET_EXTENSION):
+            try:
+                if columns is not None:
+                    from pyarrow import parquet  # optional dependency, only required for Parquet files
+                    columns = [column for column in parquet.read_schema(path).names if column in columns]
+                return pd.read_parquet(path, columns=columns)
+            except OSError as error:
+                return error
+        elif path.endswith(ConfigFiles.FEATHER_EXTENSIONS):
+            return FileManager.__read_feather_file(path, columns)
+        elif path.endswith(ConfigFiles.NUMPY_EXTENSION):
+            try:
+                return np.load(path, allow_pickle=False)
+            except OSError as error:
+                return error
+        elif path.endswith(ConfigProjectManager.PACKED_EXTENSION):
+            with open(path, "r", encoding="utf-8") as file:
+                return file.read()
+
+    @staticmethod
+    def fingerprint(path: str) -> str | None:
+        """Identifies the version of a file by its size and modification time, without reading it.
+
+        Args:
+            path (str): Path to the file.
+
+        Returns:
+            str | None: The fingerprint of the file, None if the file does not exist.
+        """
+        try:
+            status = os.stat(path)
+        except OSError:
+            return None
+        return f"{status.st_size}-{status.st_mtime_ns}"
 
     @staticmethod
     def __write_string_file(full_path: str, file_content: str):
@@ -78,22 +156,188 @@ class FileManager:
     
     
     @staticmethod
-    def __read_csv_file(path: str) -> pd.DataFrame:
-        """Reads csv files into a pandas Dataframe. 
-        To find the correct decimal points and cell separators the options are counted and the most popular one is chosen.
+    def __write_feather_file(full_path: str, file_content: pd.DataFrame):
+        """Export a pandas Dataframe into an uncompressed Feather file with a single record batch, so that it can be
+        memory mapped without copies when it is read. An index, which is not the default one, is exported as column.
+
+        Args:
+            full_path (str): full path to file.
+            file_content (pd.DataFrame): the pandas Dataframe containing the data to be exported.
+        """
+        if not file_content.index.equals(pd.RangeIndex(len(file_content))):
+            file_content = file_content.reset_index()
+        file_content.to_feather(full_path, compression="uncompressed", chunksize=max(len(file_content), 1))
+
+    @staticmethod
+    def __read_feather_file(path: str, columns: set[str] = None) -> pd.DataFrame:
+        """Reads a Feather file into a pandas Dataframe. The file is memory mapped, so only the pages of the read
+        columns are loaded, and columns of uncompressed files without missing values are not copied.
+
+        Args:
+            path (str): Path to the chosen file.
+            columns (set[str]): Columns to be read, names which are no column of the file are ignored. Defaults to
+                all columns.
+
+        Returns:
+            pd.DataFrame: The pandas dataframe containing the data from the Feather file.
+        """
+        from pyarrow import feather  # optional dependency, only required for Feather files
+
+        try:
+            table = feather.read_table(path, memory_map=True)
+        except OSError as error:
+            return error
+        if columns is not None:
+            table = table.select([column for column in table.column_names if column in columns])
+        return table.to_pandas(split_blocks=True)
+
+    @staticmethod
+    def __read_csv_file(path: str, progress: Callable[[int, int], None] = None,
+                        columns: set[str] = None) -> pd.DataFrame:
+        """Reads csv files into a pandas Dataframe in a single streaming pass.
+        The decimal points and cell separators are detected on a prefix of the file, so the file is never held in memory
+        as text. The file is then parsed in chunks of rows, the columns recognized as text in the prefix are read as
+        text in all chunks. Each chunk is copied into the columns of the result and released, so the rows are not held
+        twice. Columns, which are numeric in some chunks and text in others, cost a second pass over the file, in which
+        only these columns are read as text.
 
         Args:
             path (str): Path to the chosen file.
+            progress (Callable[[int, int], None]): Called with the number of bytes read and the size of the file after
+                each chunk.
+            columns (set[str]): Columns to be read, names which are no column of the file are ignored. Defaults to all
+                columns.
 
         Returns:
             pd.DataFrame: The pandas dataframe containing the data from the csv file.
         """
         try:
             with open(path, "r", encoding="utf-8") as file:
-                temp_string = file.read()
+                prefix = file.read(ConfigFiles.CSV_SNIFF_SIZE)
+            separator, decimal_point = FileManager.__sniff_csv(prefix)
+            dtypes = FileManager.__sample_text_columns(prefix, separator, decimal_point)
+            size = os.path.getsize(path) if progress is not None else 0
+
+            result = FileManager.__ChunkColumns()
+            with open(path, "rb") as file:
+                reader = FileManager.__CountingReader(file)
+                usecols = (lambda column: column in columns) if columns is not None else None
+                for chunk in pd.read_csv(reader, sep=separator, decimal=decimal_point, dtype=dtypes, usecols=usecols,
+                                         encoding="utf-8", chunksize=ConfigFiles.CSV_CHUNK_ROWS):
+                    result.append(chunk)
+                    del chunk
+                    if progress is not None:
+                        progress(reader.count, size)
+            if not result.mixed:
+                return result.frame()
+            # read the mixed columns again as text, as if the file had been read at once, their parsed numbers are not
+            # converted back to text, since this would change their formatting
+            text = pd.read_csv(path, sep=separator, decimal=decimal_point, dtype=str, usecols=result.mixed,
+                               encoding="utf-8")
+            return result.frame({column: text[column].to_numpy(dtype=object) for column in result.mixed})
         except OSError as error:
             return error
-        
+
+    class __CountingReader:
+        """File like object counting the bytes read from a file."""
+
+        def __init__(self, file):
+            self.__file = file
+            self.count = 0
+
+        def read(self, size: int = -1):
+            data = self.__file.read(size)
+            self.count += len(data)
+            return data
+
+    class __ChunkColumns:
+        """Collects the chunks of a csv file in one growing array per column.
+        Numeric columns take the common type of their chunks. Columns, which are numeric in some chunks and text in
+        others, are dropped and listed as mixed.
+        """
+
+        __GROWTH = 1.5  # factor the capacity of the arrays grows by, when a chunk does not fit anymore
+
+        def __init__(self):
+            self.__first = None  # a single chunk is returned without copying
+            self.__columns = None
+            self.__arrays = {}
+            self.__rows = 0
+            self.mixed = []
+
+        def append(self, chunk: pd.DataFrame):
+            """Copies the rows of a chunk to the end of the columns.
+
+            Args:
+                chunk (pd.DataFrame): The next chunk of the file.
+            """
+            if self.__columns is None:
+                self.__first = chunk
+                self.__columns = chunk.columns
+                return
+            if self.__first is not None:
+                first, self.__first = self.__first, None
+                self.__arrays = {column: np.empty(0, dtype=first[column].dtype) for column in self.__columns}
+                self.__copy(first)
+            self.__copy(chunk)
+
+        def __copy(self, chunk: pd.DataFrame):
+            rows = self.__rows + len(chunk)
+            for column in list(self.__arrays):
+                array = self.__arrays[column]
+                values = chunk[column].to_numpy()
+                dtype = self.__common_type(array.dtype, values.dtype)
+                if dtype is None:
+                    del self.__arrays[column]
+                    self.mixed.append(column)
+                    continue
+                if len(array) < rows or array.dtype != dtype:
+                    grown = np.empty(max(rows, int(len(array) * self.__GROWTH)), dtype=dtype)
+                    grown[:self.__rows] = array[:self.__rows]
+                    self.__arrays[column] = array = grown
+                array[self.__rows:rows] = values
+            self.__rows = rows
+
+        @staticmethod
+        def __common_type(current: np.dtype, dtype: np.dtype) -> np.dtype | None:
+            if current == dtype:
+                return current
+            if current.kind in "iuf" and dtype.kind in "iuf":
+                return np.result_type(current, dtype)
+            return None
+
+        def frame(self, replaced: dict[str, np.ndarray] = None) -> pd.DataFrame:
+            """Builds the dataframe of all rows in the order of the file without copying the filled columns. Unused
+            capacity is released column by column.
+
+            Args:
+                replaced (dict[str, np.ndarray]): Values of the mixed columns.
+
+            Returns:
+                pd.DataFrame: The pandas dataframe containing all rows.
+            """
+            if self.__columns is None:
+                return pd.DataFrame()
+            if self.__first is not None:
+                return self.__first
+            arrays = dict(replaced or {})
+            for column in self.__columns:
+                if column in self.__arrays:
+                    array = self.__arrays.pop(column)
+                    arrays[column] = array if len(array) == self.__rows else array[:self.__rows].copy()
+            return pd.DataFrame({column: arrays[column] for column in self.__columns}, copy=False)
+
+    @staticmethod
+    def __sniff_csv(temp_string: str) -> tuple[str, str]:
+        """Finds the cell separator and decimal point of csv text.
+        The options are counted and the most popular one is chosen.
+
+        Args:
+            temp_string (str): The csv text or a prefix of it.
+
+        Returns:
+            tuple[str, str]: The cell separator and the decimal point.
+        """
         separator_counts = []
         for sep in ConfigFiles.POSSIBLE_SEPARATORS:
              separator_counts.append(temp_string.count(sep))
@@ -104,4 +348,38 @@ class FileManager:
                 
         separator = ConfigFiles.POSSIBLE_SEPARATORS[separator_counts.index(max(separator_counts))]
         decimal_point = ConfigFiles.POSSIBLE_DECIMAL_POINTS[decimal_counts.index(max(decimal_counts))]
-        return pd.read_csv(path, sep=separator, decimal=decimal_point)
\ No newline at end of file
+        return separator, decimal_point
+
+    @staticmethod
+    def __sample_text_columns(prefix: str, separator: str, decimal_point: str) -> dict[str, type]:
+        """Infers which columns contain text from the complete lines of a prefix of csv text.
+
+        Args:
+            prefix (str): Prefix of the csv text.
+            separator (str): The cell separator.
+            decimal_point (str): The decimal point.
+
+        Returns:
+            dict[str, type]: object for each text column, keyed by the column name.
+        """
+        if len(prefix) == ConfigFiles.CSV_SNIFF_SIZE:
+            prefix = prefix[:prefix.rfind("\n") + 1]  # the last line may be incomplete
+        try:
+            sample = pd.read_csv(io.StringIO(prefix), sep=separator, decimal=decimal_point)
+        except (ValueError, pd.errors.ParserError):
+            return {}  # no complete line, the types are inferred while reading
+        return {column: object for column, dtype in sample.dtypes.items() if dtype == object}
+
+    @staticmethod
+    def parse_csv(temp_string: str) -> pd.DataFrame:
+        """Reads csv text into a pandas Dataframe.
+        To find the correct decimal points and cell separators the options are counted and the most popular one is chosen.
+
+        Args:
+            temp_string (str): The csv text.
+
+        Returns:
+            pd.DataFrame: The pandas dataframe containing the data from the csv text.
+        """
+        separator, decimal_point = FileManager.__sniff_csv(temp_string)
+        return pd.read_csv(io.StringIO(temp_string), sep=separator, decimal=decimal_point)
@@ -0,0 +1,80 @@
+"""This module contains only one class with the same name."""
+
+from __future__ import annotations
+import io
+import json
+import os
+
+import pandas as pd
+
+from src.config import ConfigFiles
+from src.config import ConfigProjectManager as Cfg
+
+
+class PackedProject:
+    """Converts between the files of a project and a packed project, which stores all of them in a single file.
+    A packed project is a JSON lines text: the first line identifies the format, each further line contains the path of
+    one file relative to the project directory and its content. So a packed project is written and read with a single
+    sequential access instead of one access per file, and it can be converted to a project directory without loss.
+    """
+
+    @staticmethod
+    def is_packed(path: str) -> bool:
+        """Checks whether a project path refers to a packed project.
+
+        Args:
+            path (str): Path of the project.
+
+        Returns:
+            bool: True if the path has the extension of packed projects. Else False.
+        """
+        return path.endswith(Cfg.PACKED_EXTENSION)
+
+    @staticmethod
+    def pack(files: dict[str, object]) -> str:
+        """Packs the files of a project.
+
+        Args:
+            files (dict[str, object]): Content of each file, keyed by the path relative to the project directory.
+                Tables are packed as csv text, the same way they are exported into a file.
+
+        Returns:
+            str: The packed project.
+        """
+        lines = [json.dumps({"format": Cfg.PACKED_FORMAT, "version": Cfg.PACKED_VERSION})]
+        for file, content in files.items():
+            if isinstance(content, pd.DataFrame):
+                content = content.to_csv(sep=ConfigFiles.DEFAULT_SEPARATOR_CSV)
+            lines.append(json.dumps({"file": file.replace(os.sep, "/"), "content": content}))
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def unpack(packed: str) -> dict[str, str]:
+        """Unpacks the files of a project.
+
+        Args:
+            packed (str): The packed project.
+
+        Returns:
+            dict[str, str]: Text of each file, keyed by the path relative to the project directory.
+
+        Raises:
+            ValueError: The text is not a packed project of a supported version.
+        """
+        lines = io.StringIO(packed)
+        try:
+            header = json.loads(lines.readline())
+            if not isinstance(header, dict) or header.get("format") != Cfg.PACKED_FORMAT \
+                    or header.get("version") != Cfg.PACKED_VERSION:
+                raise ValueError("not a packed project of version %d" % Cfg.PACKED_VERSION)
+            files = {}
+            for line in lines:
+                if line.strip():
+                    entry = json.loads(line)
+                    file = os.path.normpath(entry["file"])
+                    if os.path.isabs(file) or file.split(os.sep)[0] == os.pardir:
+                        raise ValueError("file '%s' outside of the project in packed project" % entry["file"])
+                    files[file] = str(entry["content"])
+            return files
+        except (KeyError, TypeError) as error:
+            raise ValueError("invalid entry in packed project") from error
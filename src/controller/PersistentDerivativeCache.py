@@ -0,0 +1,147 @@
+"""This module contains only one class with the same name."""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.config import ConfigFiles
+from src.config import ConfigProjectManager as Cfg
+from src.controller.FileManager import FileManager
+from src.model.data.Data import Data
+from src.model.data.EvaluationMethod import EvaluationMethod
+
+
+class PersistentDerivativeCache:
+    """Stores calculated derivative columns in a directory inside the project directory, so opening a project does not
+    calculate them again. Each column is stored as binary NumPy file and keyed by a hash of the signature of the
+    derivative, which covers its expression and the expressions it depends on, and the fingerprint of the raw data
+    file. A stored column is only loaded while its key matches, otherwise the derivative is calculated again.
+    The key is part of the file name of a column, so an index can never refer to the content of another key.
+    Columns of Python objects are not stored.
+    """
+
+    __KEY_LENGTH = 16  # characters of the key in the file name of a column
+
+    @staticmethod
+    def key(signature: str, fingerprint: str) -> str:
+        """Calculates the key of a stored column.
+
+        Args:
+            signature (str): Signature of the derivative.
+            fingerprint (str): Fingerprint of the raw data file the column has been calculated from.
+
+        Returns:
+            str: The key of the column.
+        """
+        return hashlib.sha256(f"{signature}:{fingerprint}".encode()).hexdigest()
+
+    @staticmethod
+    def load(path: str, data: Data) -> set[str]:
+        """Loads the stored columns of all derivatives, whose key is still valid, into the derivative cache of the data.
+
+        Args:
+            path (str): Path of the project directory.
+            data (Data): Data of the opened project. Its raw data has to carry the fingerprint of its file.
+
+        Returns:
+            set[str]: Labels of the loaded derivatives.
+        """
+        fingerprint = data.raw_data.attrs.get(ConfigFiles.FINGERPRINT_ATTRIBUTE)
+        if fingerprint is None:
+            return set()
+        directory = os.path.join(path, Cfg.DERIVATIVE_CACHE)
+        index = PersistentDerivativeCache.__read_index(directory)
+        loaded = set()
+        for label, signature in data.get_derivative_signatures().items():
+            entry = index.get(label)
+            key = PersistentDerivativeCache.key(signature, fingerprint)
+            if entry is None or entry["key"] != key or entry["file"] != PersistentDerivativeCache.__file(label, key):
+                continue
+            values = FileManager.import_(os.path.join(directory, entry["file"]))
+            if not isinstance(values, np.ndarray) or values.ndim != 1 or len(values) != len(data.raw_data):
+                continue
+            values.flags.writeable = False
+            column = pd.Series(values, index=data.raw_data.index, copy=False)
+            data.derivative_cache.put(label, signature, column, EvaluationMethod(entry["method"]))
+            loaded.add(label)
+        return loaded
+
+    @staticmethod
+    def save(path: str, derivatives: dict[str, tuple[str, pd.Series, EvaluationMethod]], labels: set[str],
+             fingerprint: str | None):
+        """Stores calculated derivative columns. Only columns whose key changed are written. Stored columns of removed
+        derivatives are deleted, stored columns of derivatives which have not been calculated again are kept.
+        New columns are written before the index and superseded columns are deleted after it, so an interrupted save
+        leaves the previous index and its columns intact.
+
+        Args:
+            path (str): Path of the project directory.
+            derivatives (dict[str, tuple[str, pd.Series, EvaluationMethod]]): Signature, column and evaluation method
+                of each calculated derivative.
+            labels (set[str]): Labels of all derivatives of the project.
+            fingerprint (str | None): Fingerprint of the raw data file. Nothing is stored if None.
+
+        Raises:
+            OSError: A file can not be written.
+        """
+        if fingerprint is None:
+            return
+        directory = os.path.join(path, Cfg.DERIVATIVE_CACHE)
+        index = PersistentDerivativeCache.__read_index(directory)
+        new_index = {label: entry for label, entry in index.items() if label in labels}
+        for label, (signature, column, method) in derivatives.items():
+            key = PersistentDerivativeCache.key(signature, fingerprint)
+            entry = new_index.get(label)
+            if entry is not None and entry["key"] == key \
+                    and os.path.isfile(os.path.join(directory, entry["file"])):
+                continue
+            new_index.pop(label, None)
+            if not isinstance(column.dtype, np.dtype) or column.dtype == object:
+                continue
+            file = PersistentDerivativeCache.__file(label, key)
+            os.makedirs(directory, exist_ok=True)
+            PersistentDerivativeCache.__export(os.path.join(directory, file), column.to_numpy())
+            new_index[label] = {"key": key, "file": file, "method": method.value}
+
+        if new_index != index:
+            os.makedirs(directory, exist_ok=True)
+            PersistentDerivativeCache.__export(os.path.join(directory, Cfg.DERIVATIVE_CACHE_INDEX),
+                                               json.dumps(new_index))
+
+        # superseded columns and columns left by an interrupted save
+        files = {entry["file"] for entry in new_index.values()}
+        for file in os.listdir(directory) if os.path.isdir(directory) else []:
+            if file.endswith(ConfigFiles.NUMPY_EXTENSION) and file not in files:
+                try:
+                    os.remove(os.path.join(directory, file))
+                except FileNotFoundError:
+                    pass
+
+    @staticmethod
+    def __file(label: str, key: str) -> str:
+        """Name of the file of a stored column."""
+        return f"{label}-{key[:PersistentDerivativeCache.__KEY_LENGTH]}{ConfigFiles.NUMPY_EXTENSION}"
+
+    @staticmethod
+    def __read_index(directory: str) -> dict[str, dict[str, str]]:
+        """Reads the index of the stored columns. A missing or damaged index is read as empty index."""
+        try:
+            index = FileManager.import_(os.path.join(directory, Cfg.DERIVATIVE_CACHE_INDEX))
+        except (OSError, KeyError):
+            return {}
+        if not isinstance(index, dict):
+            return {}
+        methods = {method.value for method in EvaluationMethod}
+        return {label: entry for label, entry in index.items()
+                if isinstance(entry, dict) and {"key", "file", "method"} <= entry.keys()
+                and entry["method"] in methods and os.path.basename(str(entry["file"])) == entry["file"]}
+
+    @staticmethod
+    def __export(path: str, content: object):
+        result = FileManager.export(path, content, atomic=True)
+        if isinstance(result, OSError):
+            raise result
@@ -2,16 +2,17 @@ from __future__ import annotations
 
 import json
 import os
-import shutil
 import subprocess
 from pathlib import Path
 import threading
+from typing import Callable
 
 import pandas as pd
 from pandas import DataFrame
 
 from src.config import ConfigFiles, ConfigProjectManager
 from src.model.Project import Project
+from src.model.ProjectChange import ProjectChange
 from src.model.ProjectSnapshot import ProjectSnapshot
 from src.model.data.Alternative import Alternative
 from src.model.data.Data import Data
@@ -20,14 +21,20 @@ from src.model.data.functions.FunctionalExpression import FunctionalExpression
 from src.model.ProxyProject import ProxyProject
 from src.model.processing.Threshold import Threshold
 from src.model.processing.Evaluation import Evaluation
+from src.model.processing.SingleLogitBiogemeConfig import SingleLogitBiogemeConfig
+from src.controller.AutosaveScheduler import AutosaveScheduler
 from src.controller.FileManager import FileManager
+from src.controller.PackedProject import PackedProject
+from src.controller.PersistentDerivativeCache import PersistentDerivativeCache
 from src.config import ConfigProjectManager as Cfg
 
 
 class ProjectManager:
     """class that manages changes regarding the project and is responsible for creating, saving and opening projects."""
     __instance: Project = None
-    __saving_thread = None
+    __saving_lock = threading.Lock()
+    __saved_path: str | None = None  # project directory of the last save, None if unknown
+    __saved_files: dict[str, object] = {}  # content of the files written by the last save, keyed by relative path
 
     def __init__(self):
         """__init__ must be empty because it's called automatically after __new__, even if the instance already initialized."""
@@ -39,6 +46,7 @@ class ProjectManager:
 
         pm = FileManager.__new__(cls)
         pm.__project = None
+        pm.__autosave = AutosaveScheduler(pm.save, ConfigProjectManager.AUTOSAVE_DELAY)
         ProjectManager.__instance = pm
         pm.new()
         return pm
@@ -59,17 +67,29 @@ class ProjectManager:
 
     def new(self):
         """
-        Creates a new project.
+        Creates a new project. Pending automatic saves of the current project are finished first.
         """
+        self.flush_saving_process()
+        FunctionalExpression.clear_validation_cache()
+        SingleLogitBiogemeConfig.clear_database_cache()
+        self.__forget_saved_files()
         self.__project = ProxyProject()
 
-    def open(self, path: str):
+    def open(self, path: str, used_columns_only: bool = False):
         """
         Opens a project. All relevant files are getting imported and stored from the given path. A new ProxyProject is
         created with a new ProjectSnapshot, which includes the imported data.
-        :param path: path to the project that should be opened.
+        :param path: path to the project that should be opened, a project directory or a packed project file.
+        :param used_columns_only: whether only the columns of the raw data, which the alternatives, availability
+        conditions and the choice depend on, are imported. Other columns are missing in the project.
+        Pending automatic saves of the current project are finished first.
         """
+        self.flush_saving_process()
         try:
+            FunctionalExpression.clear_validation_cache()
+            SingleLogitBiogemeConfig.clear_database_cache()
+            self.__forget_saved_files()
+            files = ProjectManager.__read_files(path)
             evaluation = None
             selected_config_index = 0
             alternatives = {}
@@ -78,77 +98,169 @@ class ProjectManager:
             choice = FunctionalExpression("")
             raw_data_path = ""
             raw_data = pd.DataFrame()
-            if os.path.isfile(os.path.join(path, ConfigProjectManager.EVALUATION)):
-                eval_table: pd.DataFrame = FileManager.import_(os.path.join(path, ConfigProjectManager.EVALUATION))
-                eval_table = eval_table.set_index(eval_table.columns[0])
-                evaluation = Evaluation(eval_table)
-            if os.path.isfile(os.path.join(path, ConfigProjectManager.CONFIG)):
-                selected_config_index = int(FileManager.import_(os.path.join(path, ConfigProjectManager.CONFIG)))
-            if os.path.isdir(os.path.join(path, ConfigProjectManager.ALTERNATIVES)):
-                alternatives = self._import_alternatives(os.path.join(path, ConfigProjectManager.ALTERNATIVES))
-            if os.path.isdir(os.path.join(path, ConfigProjectManager.DERIVATIVES)):
-                derivatives = self._import_derivatives(os.path.join(path, ConfigProjectManager.DERIVATIVES))
-            if os.path.isdir(os.path.join(path, ConfigProjectManager.THRESHOLDS)):
-                thresholds = self._import_thresholds(os.path.join(path, ConfigProjectManager.THRESHOLDS))
-            if os.path.isfile(os.path.join(path, ConfigProjectManager.CHOICE)):
-                choice = FunctionalExpression(FileManager.import_(os.path.join(path, ConfigProjectManager.CHOICE))["functional_expression"]["expression"])
-            if os.path.isfile(os.path.join(path, ConfigProjectManager.RAW_DATA_PATH)):
-                raw_data_path = str(FileManager.import_(os.path.join(path, ConfigProjectManager.RAW_DATA_PATH))["raw_data_path"])
-                if os.path.isfile(raw_data_path):
-                    raw_data = FileManager.import_(raw_data_path)
             processing_configs = {}
-            if os.path.isdir(os.path.join(path, ConfigProjectManager.PROCESSING_CONFIGS)):
-                for entry in os.scandir(os.path.join(path, ConfigProjectManager.PROCESSING_CONFIGS)):
-                    if os.path.isdir(entry.path):
-                        try:
-                            idx = int(entry.name)
-                        except ValueError:
-                            continue
-                        processing_configs[idx] = self._import_processing_config(entry.path)
+            for file, content in files.items():
+                directory, name = os.path.split(file)
+                if file == ConfigProjectManager.EVALUATION:
+                    eval_table = FileManager.parse_csv(content)
+                    evaluation = Evaluation(eval_table.set_index(eval_table.columns[0]))
+                elif file == ConfigProjectManager.CONFIG:
+                    selected_config_index = int(ProjectManager.__parse_json(content))
+                elif file == ConfigProjectManager.CHOICE:
+                    choice = FunctionalExpression(
+                        ProjectManager.__parse_json(content)["functional_expression"]["expression"])
+                elif file == ConfigProjectManager.RAW_DATA_PATH:
+                    raw_data_path = str(ProjectManager.__parse_json(content)["raw_data_path"])
+                elif not name.endswith(".json"):
+                    continue
+                elif directory == ConfigProjectManager.ALTERNATIVES:
+                    alternative = ProjectManager.__parse_json(content)
+                    alternatives[alternative["label"]] = Alternative(
+                        FunctionalExpression(alternative["function"]["expression"]),
+                        FunctionalExpression(alternative["availability_condition"]["expression"]),
+                        int(alternative["choice_idx"]))
+                elif directory == ConfigProjectManager.DERIVATIVES:
+                    derivative = ProjectManager.__parse_json(content)
+                    derivatives[derivative["label"]] = FunctionalExpression(
+                        derivative["functional_expression"]["expression"])
+                elif directory == ConfigProjectManager.THRESHOLDS:
+                    threshold = ProjectManager.__parse_json(content)
+                    thresholds[threshold["label"]] = Threshold(float(threshold["threshold"]))
+                elif os.path.dirname(directory) == ConfigProjectManager.PROCESSING_CONFIGS:
+                    try:
+                        idx = int(os.path.basename(directory))
+                    except ValueError:
+                        continue
+                    processing_config = ProjectManager.__parse_json(content)
+                    processing_configs.setdefault(idx, {})[processing_config["variable"]] = FunctionalExpression(
+                        processing_config["functional_expression"]["expression"])
+            if raw_data_path and os.path.isfile(raw_data_path):
+                columns = Model(Data(raw_data, None, derivatives), alternatives, choice).used_variables \
+                    if used_columns_only else None
+                fingerprint = FileManager.fingerprint(raw_data_path)
+                raw_data = FileManager.import_(raw_data_path, columns=columns)
+                if isinstance(raw_data, pd.DataFrame):
+                    raw_data.attrs[ConfigFiles.FINGERPRINT_ATTRIBUTE] = fingerprint
             data = Data(raw_data, raw_data_path, derivatives)
+            if not PackedProject.is_packed(path):
+                PersistentDerivativeCache.load(path, data)  # calculated columns saved with the project
             model = Model(data, alternatives, choice)
 
             ps = ProjectSnapshot(path, None, None, model, None, selected_config_index, evaluation,
                                  thresholds)
             self.__project = ProxyProject(ps)
-            for idx, p_c in processing_configs.items():
+            for idx, p_c in sorted(processing_configs.items()):
                 self.get_project().set_config_settings(idx, p_c)
         except ValueError as v_e:
             return v_e
 
+    def convert(self, source: str, target: str):
+        """
+        Converts a saved project between the directory layout and the packed layout, without opening it. Either path
+        may be a project directory or a packed project file, the layout is chosen by the extension of the path.
+        :param source: path of the saved project.
+        :param target: path the converted project is written to. Stale project files in a target directory are deleted.
+        :raises: ValueError if the source is no valid packed project, OSError if the target can not be written.
+        """
+        files = ProjectManager.__read_files(source)
+        with self.__saving_lock:
+            if self.__saved_path == os.path.abspath(target):
+                self.__saved_path = None  # the files of the last save are replaced
+                self.__saved_files = {}
+            if PackedProject.is_packed(target):
+                ProjectManager.__write_packed(target, files)
+            else:
+                ProjectManager.__write_directory(target, files, ProjectManager.__existing_files(target))
+
+    @staticmethod
+    def __read_files(path: str) -> dict[str, str]:
+        """
+        Reads the files of a saved project. A packed project is read at once, a project directory file by file.
+        :param path: path of the project directory or of the packed project file.
+        :return: Text of each file, keyed by the path of the file relative to the project directory.
+        :raises: ValueError if the packed project is invalid.
+        """
+        if PackedProject.is_packed(path):
+            if not os.path.isfile(path):
+                return {}
+            packed = FileManager.import_(path)
+            return PackedProject.unpack(packed)
+
+        files = {}
+        for file in ProjectManager.__existing_files(path):
+            with open(os.path.join(path, file), "r", encoding="utf-8") as handle:
+                files[file] = handle.read()
+        return files
+
+    @staticmethod
+    def __parse_json(content: str) -> object:
+        try:
+            return json.loads(content)
+        except json.decoder.JSONDecodeError as json_error:
+            raise KeyError from json_error  # same error as for an invalid json file imported by the FileManager
+
+    def __forget_saved_files(self):
+        """
+        Forgets the files written by the last save, so the next save compares against the files on disk.
+        """
+        with self.__saving_lock:
+            self.__saved_path = None
+            self.__saved_files = {}
+
     def start_saving_process(self):
         """
-        Method used to initiate the saving process in a different thread after every step that changes the model.
+        Method used to schedule the saving process after every step that changes the model. The project is saved on a
+        background thread, once it has not been changed for a short time. So a series of changes is saved only once,
+        and the last change is always saved.
         """
-        if self.__saving_thread is not None and self.__saving_thread.is_alive():
-            return  # skip autosave if autosave thread is still running
+        self.__autosave.schedule()
 
-        self.__saving_thread = threading.Thread(target=self.save, args=(), daemon=False)
-        self.__saving_thread.start()
+    def flush_saving_process(self, timeout: float = None) -> bool:
+        """
+        Saves the project immediately, if an automatic save is scheduled, and waits until saving has finished.
+        Has to be called before the project is closed.
+        :param timeout: maximum time to wait in seconds, None waits without limit.
+        :return: True if all scheduled saves have finished. Else False.
+        """
+        return self.__autosave.flush(timeout)
 
     def save(self, path: str = None):
         """
-        Saves a project. Collects all the data from the project and exports them in separate files.
+        Saves a project. Collects all the data from the project and exports them in separate files, or into a single
+        packed project file if the path has the packed project extension.
+        Only files which changed since the last save to the same directory are written.
         :param path: path to where the project should be saved.
         """
         try:
-            evaluation = self.get_project().get_evaluation()
-            config_index = self.get_project().get_selected_config_index()
             if path is None:
                 path = self.get_project().path
             if path is None:
                 return
             self._export(path)
-            if evaluation is not None:
-                FileManager.export(os.path.join(path, ConfigProjectManager.EVALUATION), evaluation)
-            if config_index is not None:
-                FileManager.export(os.path.join(path, ConfigProjectManager.CONFIG), str(config_index))
 
         except KeyError as k_e:
             return k_e
         except ValueError as v_e:
             return v_e
 
+    def get_version(self) -> int:
+        """
+        Version of the current project, which changes with every change of the project.
+        :return: Current version.
+        """
+        return self.__project.get_version()
+
+    def get_changes(self, since: int | None) -> ProjectChange | None:
+        """
+        Changes of the current project since a version.
+        :param since: Version returned by get_version before. None if nothing has been displayed yet.
+        :return: Changes since the version. None if everything has to be refreshed, e.g. because another project
+        has been opened since.
+        """
+        if since is None:
+            return None
+        return self.__project.get_changes(since)
+
     def can_undo(self) -> bool:
         return self.__project.can_undo()
 
@@ -181,212 +293,184 @@ class ProjectManager:
 
     def _export(self, path: str) -> bool | OSError:
         """
-        Function to export choice variable, raw_data_path and all alternatives, derivatives, thresholds and
-        processing configs. Clears the directory before storing, if already exists.
+        Function to export choice variable, raw_data_path, evaluation, selected config index and all alternatives,
+        derivatives, thresholds and processing configs.
+        A packed project is written at once and replaced atomically. In a project directory only files whose content
+        changed since the last export to the same path are written, each file is replaced atomically. Files of removed
+        entries are deleted, other files in the directory are kept. If the directory has not been exported to before,
+        all files are written and the stale entries found in it are deleted. Calculated derivative columns are stored
+        in the project directory as well, so they are not calculated again after opening the project.
         :param path: Path to where the data is exported.
         :return: True if export was successful. Else False.
         :raises: OSError
         """
-        try:
-            alternatives = self.get_project().get_alternatives()
-            derivatives = self.get_project().get_derivatives()
-            thresholds = self.get_project().get_thresholds()
-            processing_configs = self.get_project().get_config_settings()
-            choice = self.get_project().get_choice()
-            raw_data_path = self.get_project().get_raw_data_path()
-            if os.path.exists(path):
-                shutil.rmtree(path)
-            os.mkdir(path)
-
-            if choice is not None:
-                json_choice = json.dumps(
-                    {
-                        "functional_expression": {
-                            "expression": choice.expression
-                        }
-                    }
-                )
-                FileManager.export(os.path.join(path, ConfigProjectManager.CHOICE), file_content=json_choice)
-            if raw_data_path is not None:
-                json_raw_data_path = json.dumps(
-                    {"raw_data_path": raw_data_path}
-                )
-                FileManager.export(os.path.join(path, ConfigProjectManager.RAW_DATA_PATH), file_content=json_raw_data_path)
-            if len(alternatives) != 0:
-                os.mkdir(os.path.join(path, ConfigProjectManager.ALTERNATIVES))
-                for key in alternatives:
-                    self._export_alternative(alternatives, key, os.path.join(path, ConfigProjectManager.ALTERNATIVES))
-            if len(derivatives) != 0:
-                os.mkdir(os.path.join(path, ConfigProjectManager.DERIVATIVES))
-                for key in derivatives:
-                    self._export_derivative(derivatives, key, os.path.join(path, ConfigProjectManager.DERIVATIVES))
-            if len(thresholds) != 0:
-                os.mkdir(os.path.join(path, ConfigProjectManager.THRESHOLDS))
-                for key in thresholds:
-                    self._export_thresholds(thresholds, key, os.path.join(path, ConfigProjectManager.THRESHOLDS))
-            if processing_configs:
-                os.mkdir(os.path.join(path, ConfigProjectManager.PROCESSING_CONFIGS))
-                for idx, p_c in enumerate(processing_configs):
-                    os.mkdir(os.path.join(path, ConfigProjectManager.PROCESSING_CONFIGS) + "/" + str(idx))
-                    for key in p_c:
-                        self._export_processing_configs(p_c, key, os.path.join(path, ConfigProjectManager.PROCESSING_CONFIGS) + "/" + str(idx))
+        with self.__saving_lock:
+            files = self.__project_files()
+            if PackedProject.is_packed(path):
+                ProjectManager.__write_packed(path, files)
+                return True
+
+            if self.__saved_path != os.path.abspath(path):
+                self.__saved_files = self.__existing_files(path)
+                self.__saved_path = os.path.abspath(path)
+            ProjectManager.__write_directory(path, files, self.__saved_files)
+            project = self.get_project()
+            PersistentDerivativeCache.save(path, project.get_cached_derivatives(), set(project.get_derivatives()),
+                                           project.get_raw_data().attrs.get(ConfigFiles.FINGERPRINT_ATTRIBUTE))
             return True
 
-        except OSError as os_e:
-            raise os_e
-
-    def _import_alternatives(self, path: str) -> dict[str, Alternative]:
-        """
-        Imports all alternatives.
-        :param path: path where alternatives are stored.
-        :return: Dictionary with labels and Alternatives
-        """
-        alternatives = {}
-        for entry in os.scandir(path):
-            if os.path.isfile(entry.path) and entry.path.endswith(".json"):
-                alternative = FileManager.import_(entry.path)
-                alternatives[alternative["label"]] = Alternative(FunctionalExpression(alternative["function"]["expression"]),
-                                                                 FunctionalExpression(alternative["availability_condition"]["expression"]),
-                                                                 int(alternative["choice_idx"]))
-        return alternatives
-
-    def _import_derivatives(self, path: str) -> dict[str, FunctionalExpression]:
-        """
-        Imports all derivatives.
-        :param path: path where derivatives are stored.
-        :return: Dictionary with labels and FunctionalExpressions
-        """
-        derivatives = {}
-        for entry in os.scandir(path):
-            if os.path.isfile(entry.path) and entry.path.endswith(".json"):
-                derivative = FileManager.import_(entry.path)
-                derivatives[derivative["label"]] = FunctionalExpression(derivative["functional_expression"]["expression"])
-        return derivatives
-
-    def _import_thresholds(self, path: str) -> dict[str, Threshold]:
-        """
-        Imports all thresholds.
-        :param path: path where thresholds are stored.
-        :return: Dictionary with labels and Thresholds
-        """
-        thresholds = {}
-        for entry in os.scandir(path):
-            if os.path.isfile(entry.path) and entry.path.endswith(".json"):
-                threshold = FileManager.import_(entry.path)
-                thresholds[threshold["label"]] = Threshold(float(threshold["threshold"]))
-        return thresholds
-
-    def _import_processing_config(self, path: str) -> dict[str, object]:
+    @staticmethod
+    def __write_packed(path: str, files: dict[str, object]):
         """
-        Imports all processing_configs.
-        :param path: path where processing_configs are stored.
-        :return: Dictionary with labels and objects
+        Writes a packed project file with a single write, replacing the file atomically.
+        :param path: Path of the packed project file.
+        :param files: Content of each file, keyed by the path of the file relative to the project directory.
+        :raises: OSError
         """
-        processing_configs = {}
-        for entry in os.scandir(path):
-            if os.path.isfile(entry.path) and entry.path.endswith(".json"):
-                processing_config = FileManager.import_(entry.path)
-                processing_configs[processing_config["variable"]] = FunctionalExpression(processing_config["functional_expression"]["expression"])
-        return processing_configs
+        result = FileManager.export(path, PackedProject.pack(files), atomic=True)
+        if isinstance(result, OSError):
+            raise result
 
-    def _export_alternative(self, alternatives: dict[str, Alternative], key: str, path: str):
+    @staticmethod
+    def __write_directory(path: str, files: dict[str, object], saved_files: dict[str, object]):
         """
-        Exports an alternative as a json file.
-        :param alternatives: all alternatives.
-        :param key: key to get the one to be exported.
-        :param path: path where the alternative should be exported to.
+        Writes the files of a project into a project directory. Only files whose content differs from the saved files
+        are written, saved files which are not part of the project anymore are deleted.
+        :param path: Path of the project directory, its parent directory has to exist.
+        :param files: Content of each file, keyed by the path of the file relative to the project directory.
+        :param saved_files: Content of the files in the directory, None if unknown. Updated to the written files.
+        :raises: OSError
         """
-        try:
-            item = alternatives[key]
-            json_file = json.dumps(
+        if not os.path.isdir(path):
+            os.mkdir(path)  # the parent directory has to exist
+        for file, content in files.items():
+            if file in saved_files and ProjectManager.__equal_content(saved_files[file], content):
+                continue
+            os.makedirs(os.path.dirname(os.path.join(path, file)), exist_ok=True)
+            result = FileManager.export(os.path.join(path, file), content, atomic=True)
+            if isinstance(result, OSError):
+                raise result
+            saved_files[file] = content
+
+        for file in [file for file in saved_files if file not in files]:
+            try:
+                os.remove(os.path.join(path, file))
+            except FileNotFoundError:
+                pass
+            del saved_files[file]
+            ProjectManager.__remove_empty_directories(path, os.path.dirname(file))
+
+    def __project_files(self) -> dict[str, object]:
+        """
+        Collects the content of all files of the current project.
+        :return: Content of each file, keyed by the path of the file relative to the project directory.
+        """
+        project = self.get_project()
+        files = {}
+        choice = project.get_choice()
+        if choice is not None:
+            files[ConfigProjectManager.CHOICE] = json.dumps({"functional_expression": {"expression": choice.expression}})
+        raw_data_path = project.get_raw_data_path()
+        if raw_data_path is not None:
+            files[ConfigProjectManager.RAW_DATA_PATH] = json.dumps({"raw_data_path": raw_data_path})
+        for key, alternative in project.get_alternatives().items():
+            files[ConfigFiles.PATH_JSON_FILE % (ConfigProjectManager.ALTERNATIVES, key)] = json.dumps(
                 {
                     "label": key,
                     "function": {
-                        "expression": item.function.expression
+                        "expression": alternative.function.expression
                     },
                     "availability_condition": {
-                        "expression": item.availability_condition.expression
+                        "expression": alternative.availability_condition.expression
                     },
-                    "choice_idx": str(item.choice_idx)
+                    "choice_idx": str(alternative.choice_idx)
                 }
             )
-            FileManager.export(ConfigFiles.PATH_JSON_FILE % (path, key), file_content=json_file)
-        except KeyError as error:
-            return error
-        except OSError as os_e:
-            return os_e
-
-    def _export_derivative(self, derivatives: dict[str, FunctionalExpression], key: str, path: str):
-        """
-        Exports a derivative as a json file.
-        :param derivatives: all derivatives.
-        :param key: key to get the one to be exported.
-        :param path: path where the derivative should be exported to.
-        """
-        try:
-            derivative = derivatives[key]
-            json_file = json.dumps(
+        for key, derivative in project.get_derivatives().items():
+            files[ConfigFiles.PATH_JSON_FILE % (ConfigProjectManager.DERIVATIVES, key)] = json.dumps(
                 {
                     "label": key,
                     "functional_expression": {
                         "expression": derivative.expression}
                 }
             )
-            FileManager.export(ConfigFiles.PATH_JSON_FILE % (path, key), file_content=json_file)
-        except KeyError as error:
-            return error
-        except OSError as os_e:
-            return os_e
-
-    def _export_thresholds(self, thresholds: dict[str, Threshold], key: str, path: str):
-        """
-        Exports a threshold as a json file.
-        :param thresholds: all thresholds.
-        :param key: key to get the one to be exported.
-        :param path: path where the threshold should be exported to.
-        """
-        try:
-            threshold = thresholds[key]
-            json_file = json.dumps(
+        for key, threshold in project.get_thresholds().items():
+            files[ConfigFiles.PATH_JSON_FILE % (ConfigProjectManager.THRESHOLDS, key)] = json.dumps(
                 {
                     "label": key,
                     "threshold": str(threshold.value)
                 }
             )
-            FileManager.export(ConfigFiles.PATH_JSON_FILE % (path, key), file_content=json_file)
-        except KeyError as error:
-            return error
-        except OSError as os_e:
-            return os_e
+        for idx, p_c in enumerate(project.get_config_settings()):
+            directory = os.path.join(ConfigProjectManager.PROCESSING_CONFIGS, str(idx))
+            for key, config_setting in p_c.items():
+                files[ConfigFiles.PATH_JSON_FILE % (directory, key)] = json.dumps(
+                    {
+                        "variable": key,
+                        "functional_expression": {
+                            "expression": config_setting.expression}
+                    }
+                )
+        evaluation = project.get_evaluation()
+        if evaluation is not None:
+            files[ConfigProjectManager.EVALUATION] = evaluation
+        config_index = project.get_selected_config_index()
+        if config_index is not None:
+            files[ConfigProjectManager.CONFIG] = str(config_index)
+        return {os.path.normpath(file): content for file, content in files.items()}
+
+    @staticmethod
+    def __existing_files(path: str) -> dict[str, object]:
+        """
+        Finds the project files in a directory, which has not been exported to before. Their content is unknown.
+        :param path: Path of the project directory.
+        :return: None for each found file, keyed by the path of the file relative to the project directory.
+        """
+        files = [ConfigProjectManager.CHOICE, ConfigProjectManager.RAW_DATA_PATH, ConfigProjectManager.EVALUATION,
+                 ConfigProjectManager.CONFIG]
+        directories = [ConfigProjectManager.ALTERNATIVES, ConfigProjectManager.DERIVATIVES,
+                       ConfigProjectManager.THRESHOLDS]
+        if os.path.isdir(os.path.join(path, ConfigProjectManager.PROCESSING_CONFIGS)):
+            directories += [os.path.join(ConfigProjectManager.PROCESSING_CONFIGS, entry.name)
+                            for entry in os.scandir(os.path.join(path, ConfigProjectManager.PROCESSING_CONFIGS))
+                            if entry.is_dir()]
+        for directory in directories:
+            if os.path.isdir(os.path.join(path, directory)):
+                files += [os.path.join(directory, entry.name) for entry in os.scandir(os.path.join(path, directory))
+                          if entry.is_file() and entry.name.endswith(".json")]
+        return {os.path.normpath(file): None for file in files if os.path.isfile(os.path.join(path, file))}
 
-    def _export_processing_configs(self, config_settings: dict[str, object], key: str, path: str):
+    @staticmethod
+    def __equal_content(saved: object, content: object) -> bool:
+        if saved is None:
+            return False  # content of files found on disk is unknown
+        if isinstance(content, pd.DataFrame):
+            return isinstance(saved, pd.DataFrame) and saved.equals(content)
+        return saved == content
+
+    @staticmethod
+    def __remove_empty_directories(path: str, directory: str):
         """
-        Exports a processing_config as a json file.
-        :param config_settings: all configs.
-        :param key: key to get the one to be exported.
-        :param path: path where the config should be exported to.
+        Removes a directory inside the project directory and its parents, as long as they are empty.
+        :param path: Path of the project directory.
+        :param directory: Path of the directory relative to the project directory.
         """
-        try:
-            config_setting: FunctionalExpression = config_settings[key]
-            json_file = json.dumps(
-                {
-                    "variable": key,
-                    "functional_expression": {
-                        "expression": config_setting.expression}
-                }
-            )
-            FileManager.export(ConfigFiles.PATH_JSON_FILE % (path, key), file_content=json_file)
-        except KeyError as error:
-            return error
-        except OSError as os_e:
-            return os_e
+        while directory:
+            try:
+                os.rmdir(os.path.join(path, directory))
+            except OSError:
+                return  # not empty or already removed
+            directory = os.path.dirname(directory)
 
-    def import_raw_data(self, path: str):
+    def import_raw_data(self, path: str, progress: Callable[[int, int], None] = None):
         """
         Imports the raw_data and sets it
         :param path: path where the raw_data is located
+        :param progress: called with the number of bytes read and the size of the file while the raw_data is read
         """
-        raw_data = DataFrame(FileManager.import_(path))
+        fingerprint = FileManager.fingerprint(path)
+        raw_data = DataFrame(FileManager.import_(path, progress))
+        raw_data.attrs[ConfigFiles.FINGERPRINT_ATTRIBUTE] = fingerprint
         self.get_project().set_raw_data(raw_data, path)
 
     def export_raw_data(self, path: str):
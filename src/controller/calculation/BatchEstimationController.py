@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+import time
+
+from src.config import ConfigBatchEstimation as Cfg
+from src.config import ConfigProjectManager
+from src.controller.AbstractController import AbstractController
+from src.controller.FileManager import FileManager
+from src.controller.PackedProject import PackedProject
+from src.controller.ProjectManager import ProjectManager
+
+
+class BatchEstimationController(AbstractController):
+    """Controller used to run the estimation of a saved project without the graphical user interface.
+    Neither this controller nor anything it imports depends on PyQt5."""
+
+    def run(self, project_path: str, output_path: str = None, config_index: int = None,
+            warm_start: bool = False, workers: int = None) -> dict[str, float]:
+        """Opens a saved project, evaluates it with its selected processing configuration and exports the result.
+        Only the columns of the raw data and the derivatives the model uses are loaded and calculated.
+
+        Args:
+            project_path (str): Directory or packed project file of the project, as written by ProjectManager.save.
+            output_path (str): Path of the exported evaluation csv file. Defaults to the evaluation file of the project
+                directory, or to the evaluation file next to a packed project file.
+            config_index (int): Index of the processing configuration. Defaults to the one selected in the project.
+            warm_start (bool): Whether the estimation starts from the values of the evaluation saved in the project.
+            workers (int): Maximum number of processes estimating in parallel. Defaults to the configured maximum.
+
+        Returns:
+            dict[str, float]: Duration of each phase in seconds.
+
+        Raises:
+            FileNotFoundError: The project or its raw data does not exist.
+            ValueError: The project can not be opened.
+            SnapshotError: The project can not be evaluated.
+            OSError: The evaluation can not be exported.
+        """
+        packed = PackedProject.is_packed(project_path)
+        if not (os.path.isfile(project_path) if packed else os.path.isdir(project_path)):
+            raise FileNotFoundError(Cfg.ERROR_PROJECT_NOT_FOUND % project_path)
+        if output_path is None:
+            directory = os.path.dirname(project_path) if packed else project_path
+            output_path = os.path.join(directory, ConfigProjectManager.EVALUATION)
+
+        timings = {}
+
+        start = time.perf_counter()
+        error = ProjectManager().open(project_path, used_columns_only=True)
+        if error is not None:
+            raise ValueError(Cfg.ERROR_PROJECT_NOT_OPENED % project_path) from error
+        project = self.get_project()
+        raw_data_path = project.get_raw_data_path()
+        if not raw_data_path or not os.path.isfile(raw_data_path):
+            raise FileNotFoundError(Cfg.ERROR_RAW_DATA_NOT_FOUND % raw_data_path)
+        timings[Cfg.PHASE_DATA_LOAD] = time.perf_counter() - start
+
+        if config_index is not None:
+            project.set_selected_config_index(config_index)
+        if workers is not None:
+            project.set_max_workers(workers)
+
+        # the calculated derivatives are cached by the data, so the estimation does not calculate them again
+        start = time.perf_counter()
+        project.get_raw_data(with_derivatives=True, used_only=True)
+        timings[Cfg.PHASE_DERIVATIVES] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        project.evaluate(warm_start)
+        timings[Cfg.PHASE_ESTIMATION] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = FileManager.export(output_path, project.get_evaluation())
+        if isinstance(result, OSError):
+            raise result
+        timings[Cfg.PHASE_EXPORT] = time.perf_counter() - start
+        return timings
+
+    def get_iterations(self) -> tuple[int | None, int | None]:
+        """Accessing method for the iterations of the last estimation.
+
+        Returns:
+            tuple[int | None, int | None]: Number of optimizer iterations and number of iterations saved by the warm
+            start. Each is None, if unknown.
+        """
+        return self.get_project().get_evaluation_iterations()
@@ -1,5 +1,7 @@
 from __future__ import annotations
+from typing import Callable
 
+from src.model.processing.Evaluation import Evaluation
 from src.model.processing.Threshold import Threshold
 from src.controller.FileManager import FileManager
 from src.controller.AbstractController import AbstractController
@@ -34,11 +36,40 @@ class EvaluationController(AbstractController):
         """
         return self.get_project().get_evaluation()
 
-    def evaluate(self):
+    def evaluate(self, warm_start: bool = False):
         """
         Starts evaluating the model based on the selected processing configuration.
+        :param warm_start: whether the calculation starts from the results of the current evaluation
         """
-        self.get_project().evaluate()
+        self.get_project().evaluate(warm_start)
+
+    def get_evaluation_basis(self) -> object:
+        """
+        accessing method for the model and the selected processing configuration an evaluation is calculated from
+        :return: opaque basis of an evaluation
+        """
+        return self.get_project().get_evaluation_basis()
+
+    def calculate_evaluation(self, warm_start: bool = False, progress: Callable[[int, int], None] = None,
+                             cancelled: Callable[[], bool] = None, basis: object = None) -> Evaluation:
+        """
+        Calculates an evaluation of the model based on the selected processing configuration without storing it.
+        Can be called from a background thread, the project is not changed.
+        :param warm_start: whether the calculation starts from the results of the current evaluation
+        :param progress: called with the number of finished and the number of all estimations
+        :param cancelled: polled between the estimations, the calculation stops as soon as it returns True
+        :param basis: basis returned by get_evaluation_basis, calculated instead of the current model and configuration
+        :return: the calculated evaluation
+        """
+        return self.get_project().calculate_evaluation(warm_start, progress, cancelled, basis)
+
+    def set_evaluation(self, evaluation: Evaluation, basis: object = None):
+        """
+        Stores an evaluation calculated before in the current project.
+        :param evaluation: the calculated evaluation
+        :param basis: basis the evaluation has been calculated from, it is only stored if the basis is still current
+        """
+        self.get_project().set_evaluation(evaluation, basis)
 
     def is_optimizable(self):
         """
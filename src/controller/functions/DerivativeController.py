@@ -42,8 +42,7 @@ class DerivativeController(FunctionController):
         Returns:
             dict[str, type]: List of tuples containing 
         """
-        data = self.get_project().get_raw_data().dtypes
-        return dict(data)
+        return dict(self.get_project().get_raw_data_types())
 
     def add(self, label: str, function: str):
         """ Addition of a new derivative to the model. Before Addition a safety validation is done.
@@ -1,10 +1,13 @@
 """This module contains only one class with the same name."""
 
 from __future__ import annotations
+from typing import Callable
 
 from src.model.data.Alternative import Alternative
+from src.model.data.EvaluationMethod import EvaluationMethod
 from src.model.data.functions.FunctionalExpression import FunctionalExpression
 from src.model.data.functions.ErrorReport import ErrorReport
+from src.model.processing.Evaluation import Evaluation
 from src.model.processing.Threshold import Threshold
 
 import pandas as pd
@@ -86,9 +89,60 @@ class Project:
         """
         raise NotImplementedError
 
-    def evaluate(self):
+    def evaluate(self, warm_start: bool = False):
         """
         Starts evaluating the model based on the selected processing configuration.
+        :param warm_start: Truth value, whether the calculation starts from the results of the current evaluation.
+        :type warm_start: bool
+        """
+        raise NotImplementedError
+
+    def set_max_workers(self, max_workers: int):
+        """
+        Sets the maximum number of processes calculating estimations in parallel for all processing configurations.
+        It is not saved with the project.
+        :param max_workers: Maximum number of processes, at least 1.
+        :type max_workers: int
+        """
+        raise NotImplementedError
+
+    def get_evaluation_basis(self) -> object:
+        """
+        Get the model and the selected processing configuration, which an evaluation is calculated from.
+        :return: Opaque basis of an evaluation. Only meaningful for calculate_evaluation and set_evaluation.
+        :rtype: object
+        """
+        raise NotImplementedError
+
+    def calculate_evaluation(self, warm_start: bool = False, progress: Callable[[int, int], None] = None,
+                             cancelled: Callable[[], bool] = None, basis: object = None) -> Evaluation:
+        """
+        Calculates an evaluation of the model based on the selected processing configuration without storing it.
+        Does not change the project, so it can be called outside the thread changing the project.
+        :param warm_start: Truth value, whether the calculation starts from the results of the current evaluation.
+        :type warm_start: bool
+        :param progress: Called with the number of finished and the number of all estimations.
+        :type progress: Callable[[int, int], None]
+        :param cancelled: Polled between the estimations, the calculation stops as soon as it returns True.
+        :type cancelled: Callable[[], bool]
+        :param basis: Basis returned by get_evaluation_basis before, which is calculated instead of the current model
+        and processing configuration.
+        :type basis: object
+        :return: Calculated evaluation.
+        :rtype: Evaluation
+        :raises CancelledError: Calculation has been cancelled.
+        """
+        raise NotImplementedError
+
+    def set_evaluation(self, evaluation: Evaluation, basis: object = None):
+        """
+        Stores an evaluation calculated before in the project.
+        :param evaluation: New evaluation.
+        :type evaluation: Evaluation
+        :param basis: Basis the evaluation has been calculated from. If given, the evaluation is only stored while
+        the model and the selected processing configuration have not been changed since.
+        :type basis: object
+        :raises ValueError: The evaluation has been calculated from another model or processing configuration.
         """
         raise NotImplementedError
 
@@ -105,16 +159,37 @@ class Project:
         """
         raise NotImplementedError
 
-    def get_raw_data(self, with_derivatives: bool = False) -> pd.DataFrame:
+    def get_raw_data(self, with_derivatives: bool = False, used_only: bool = False) -> pd.DataFrame:
         """
         Returns the data which is stored in the model.
+        The table is shared with the model and read-only, it has to be copied before changing values.
         :param with_derivatives: Determines, whether all derivatives should be added to raw data.
         :type with_derivatives: bool
+        :param used_only: Determines, whether the table only contains the columns used by the alternatives, availability
+        conditions and the choice. Derivatives which are not used are not calculated.
+        :type used_only: bool
         :return: Table with all raw data and (if selected) all calculated derivatives.
         :rtype: pd.DataFrame
         """
         raise NotImplementedError
 
+    def get_raw_data_types(self) -> pd.Series:
+        """
+        Returns the data types of the raw data without accessing its values.
+        :return: Data type of each column of the raw data.
+        :rtype: pd.Series
+        """
+        raise NotImplementedError
+
+    def get_cached_derivatives(self) -> dict[str, tuple[str, pd.Series, EvaluationMethod]]:
+        """
+        Returns the derivative columns, which have already been calculated for the current data, without calculating
+        any derivative.
+        :return: Signature, read-only column and evaluation method of each calculated derivative.
+        :rtype: dict[str, tuple[str, pd.Series, EvaluationMethod]]
+        """
+        raise NotImplementedError
+
     def get_raw_data_path(self) -> str:
         """
         Returns the path of the raw data file which was imported into the model.
@@ -269,3 +344,11 @@ class Project:
         :rtype: Evaluation
         """
         raise NotImplementedError
+
+    def get_evaluation_iterations(self) -> tuple[int | None, int | None]:
+        """
+        :return: Number of iterations of the evaluation stored in the project and the number of iterations saved by a
+        warm start. Each is None, if unknown.
+        :rtype: tuple[int | None, int | None]
+        """
+        raise NotImplementedError
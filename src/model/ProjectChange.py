@@ -0,0 +1,38 @@
+"""This module contains only one class with the same name."""
+
+from __future__ import annotations
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ProjectChange:
+    """
+    Describes which parts of a project changed between two versions, so a view only has to refresh the affected
+    entries. Derivatives and alternatives which depend on a changed function are affected as well, since their error
+    reports and types may have changed.
+
+    Attributes:
+        derivatives: Labels of the added, changed and removed derivatives and of the derivatives depending on them.
+        :type derivatives: frozenset[str]
+        alternatives: Labels of the added, changed and removed alternatives and of the alternatives depending on
+        changed functions.
+        :type alternatives: frozenset[str]
+        complete: Whether something every function depends on changed, like the raw data or the processing
+        configuration. All entries have to be refreshed then.
+        :type complete: bool
+    """
+
+    derivatives: frozenset[str] = frozenset()
+    alternatives: frozenset[str] = frozenset()
+    complete: bool = False
+
+    def merge(self, other: ProjectChange) -> ProjectChange:
+        """
+        Combines this change with a following one.
+        :param other: Change following this change.
+        :type other: ProjectChange
+        :return: Change covering both changes.
+        :rtype: ProjectChange
+        """
+        return ProjectChange(self.derivatives | other.derivatives, self.alternatives | other.alternatives,
+                             self.complete or other.complete)
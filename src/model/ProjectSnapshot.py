@@ -3,11 +3,13 @@
 from __future__ import annotations
 from graphlib import TopologicalSorter
 import functools
+from typing import Callable
 
 from src.model.Project import Project
 from src.model.data.Model import Model
 from src.model.data.Data import Data
 from src.model.data.Alternative import Alternative
+from src.model.data.EvaluationMethod import EvaluationMethod
 from src.model.data.functions.FunctionalExpression import FunctionalExpression
 from src.model.data.functions.ErrorReport import ErrorReport
 from src.model.processing.ProcessingConfig import ProcessingConfig
@@ -16,6 +18,8 @@ from src.model.processing.VariedLogitBiogemeConfig import VariedLogitBiogemeConf
 from src.model.processing.Evaluation import Evaluation
 from src.model.processing.Threshold import Threshold
 
+from src.config import ConfigErrorMessages
+
 import pandas as pd
 
 
@@ -56,6 +60,26 @@ class ProjectSnapshot(Project):
     def redo(self) -> Project:
         return self.next
 
+    def memory_usage(self) -> dict[int, int]:
+        """
+        Get the memory used by the tables of this snapshot. Tables are shared between snapshots, so the memory of
+        several snapshots is the sum over the union of their tables.
+        :return: Number of bytes of each table, keyed by the identity of the table.
+        :rtype: dict[int, int]
+        """
+        return self.__model.data.memory_usage()
+
+    def clear_caches(self, current: ProjectSnapshot):
+        """
+        Drop the values calculated for this snapshot, which are not shared with the current snapshot.
+        :param current: Current snapshot of the project, whose calculated values are kept.
+        :type current: ProjectSnapshot
+        """
+        if self.__model is not current.__model:
+            self.__model.clear_caches()
+        if self.__model.data is not current.__model.data:
+            self.__model.data.clear_caches()
+
     def get_selected_config_index(self) -> int:
         return self.__selected_config_index
 
@@ -69,11 +93,29 @@ class ProjectSnapshot(Project):
         self.__processing_configs = self.__processing_configs.copy()
         self.__processing_configs[index] = self.__processing_configs[index].set_settings(settings)
 
+    def set_max_workers(self, max_workers: int):
+        self.__processing_configs = [config.set_max_workers(max_workers) for config in self.__processing_configs]
+
     def get_config_display_names(self) -> list[str]:
         return list(map(lambda c: c.display_name, self.__processing_configs))
 
-    def evaluate(self):
-        self.__evaluation = self.__processing_configs[self.get_selected_config_index()].process(self.__model)
+    def evaluate(self, warm_start: bool = False):
+        self.set_evaluation(self.calculate_evaluation(warm_start))
+
+    def get_evaluation_basis(self) -> tuple[Model, ProcessingConfig]:
+        return self.__model, self.__processing_configs[self.get_selected_config_index()]
+
+    def calculate_evaluation(self, warm_start: bool = False, progress: Callable[[int, int], None] = None,
+                             cancelled: Callable[[], bool] = None,
+                             basis: tuple[Model, ProcessingConfig] = None) -> Evaluation:
+        model, config = basis if basis is not None else self.get_evaluation_basis()
+        return config.process(model, self.__evaluation if warm_start else None, progress, cancelled)
+
+    def set_evaluation(self, evaluation: Evaluation, basis: tuple[Model, ProcessingConfig] = None):
+        # models and processing configurations are immutable, a change always replaces them
+        if basis is not None and any(a is not b for a, b in zip(basis, self.get_evaluation_basis())):
+            raise ValueError(ConfigErrorMessages.ERROR_MSG_OUTDATED_EVALUATION)
+        self.__evaluation = evaluation
 
     def is_optimizable(self) -> bool:
         return self.__evaluation and self.__evaluation.is_optimizable
@@ -81,10 +123,19 @@ class ProjectSnapshot(Project):
     def optimize_model(self):
         self.__model = self.__evaluation.optimize(self.__model)
 
-    def get_raw_data(self, with_derivatives: bool = False) -> pd.DataFrame:
+    def get_raw_data(self, with_derivatives: bool = False, used_only: bool = False) -> pd.DataFrame:
         if with_derivatives:
-            return self.__model.data.complete_data
-        return self.__model.data.raw_data.copy()
+            return self.__model.get_used_data() if used_only else self.__model.data.complete_data
+        if used_only:
+            used_variables = self.__model.used_variables
+            return self.__model.data.raw_data[[c for c in self.__model.data.raw_data.columns if c in used_variables]]
+        return self.__model.data.raw_data
+
+    def get_raw_data_types(self) -> pd.Series:
+        return self.__model.data.raw_data.dtypes
+
+    def get_cached_derivatives(self) -> dict[str, tuple[str, pd.Series, EvaluationMethod]]:
+        return self.__model.data.get_cached_derivatives()
 
     def get_raw_data_path(self) -> str:
         return self.__model.data.raw_data_path
@@ -161,7 +212,8 @@ class ProjectSnapshot(Project):
         self.__model = self.__model.set_choice(choice)
 
     def get_choice_error_report(self) -> ErrorReport:
-        return self.get_choice().get_error_report(**self.__model.data.get_variables())
+        data = self.__model.data
+        return self.get_choice().get_error_report(data.dependency_graph, **data.get_variables())
 
     def get_thresholds(self) -> dict[str, Threshold]:
         return self.__thresholds.copy()
@@ -171,3 +223,8 @@ class ProjectSnapshot(Project):
 
     def get_evaluation(self) -> pd.DataFrame | None:
         return self.__evaluation.result.copy() if self.__evaluation is not None else None
+
+    def get_evaluation_iterations(self) -> tuple[int | None, int | None]:
+        if self.__evaluation is None:
+            return None, None
+        return self.__evaluation.iterations, self.__evaluation.saved_iterations
@@ -2,29 +2,59 @@
 
 from __future__ import annotations
 from typing import Callable
+from collections import deque
 from copy import copy
+import functools
+import itertools
 
+from src.config import ConfigHistory
 from src.model.Project import Project
+from src.model.ProjectChange import ProjectChange
 from src.model.ProjectSnapshot import ProjectSnapshot
 from src.model.SnapshotError import SnapshotError
 from src.model.data.Alternative import Alternative
+from src.model.data.EvaluationMethod import EvaluationMethod
 from src.model.data.functions.FunctionalExpression import FunctionalExpression
 from src.model.data.functions.ErrorReport import ErrorReport
+from src.model.processing.Evaluation import Evaluation
 from src.model.processing.Threshold import Threshold
 
 import pandas as pd
 
 
 class ProxyProject(Project):
-    """Time invariant interface for the management of the Projects. Necessary for the ProjectSnapshot functionality."""
-    def __init__(self, project: ProjectSnapshot = None):
+    """
+    Time invariant interface for the management of the Projects. Necessary for the ProjectSnapshot functionality.
+    The history of snapshots is bounded in length and in the memory of the held tables. If a bound is exceeded, the
+    oldest snapshots are removed first, then the most recently undone ones. Values calculated for snapshots other
+    than the current one are dropped whenever the current snapshot changes.
+    Every change of the current snapshot gets a new version. The views ask for the changes since the version they
+    display, so they only refresh the affected entries.
+
+    Attributes:
+        max_snapshots: Maximum number of snapshots in the history, including the current one.
+        :type max_snapshots: int
+        max_memory: Maximum number of bytes of the tables held by all snapshots in the history.
+        The current snapshot is always kept, even if it exceeds this bound alone.
+        :type max_memory: int
+    """
+    __versions = itertools.count()  # versions are unique across projects, so a version of another one is not known
+
+    def __init__(self, project: ProjectSnapshot = None, max_snapshots: int = ConfigHistory.MAX_SNAPSHOTS,
+                 max_memory: int = ConfigHistory.MAX_MEMORY):
         self.__current_project: ProjectSnapshot = project if project is not None else ProjectSnapshot()
+        self.max_snapshots = max_snapshots
+        self.max_memory = max_memory
+        self.__version: int = next(ProxyProject.__versions)
+        # version before and after each recorded change, with the change
+        self.__changes: deque[tuple[int, int, ProjectChange]] = deque(maxlen=ConfigHistory.MAX_CHANGES)
 
     @staticmethod
     def __snapshot(version_offset: int = 0, new_snapshot: bool = False, move_current: bool = True):
         def __wrapper(func: Callable):
             def __do_operation(self, *args, **kwargs):
-                p = self.__current_project
+                current = self.__current_project
+                p = current
                 remaining = version_offset
 
                 while remaining < 0:
@@ -51,12 +81,130 @@ class ProxyProject(Project):
 
                 if move_current:
                     self.__current_project = np
+                    if np is not current:
+                        self.__record_change(current, np)
+
+                if new_snapshot or (move_current and version_offset != 0):
+                    self.__trim_history()
 
                 return ret
 
             return __do_operation
         return __wrapper
 
+    def __record_change(self, previous: ProjectSnapshot, current: ProjectSnapshot):
+        """
+        Assigns a new version to the current snapshot and records what changed since the previous one.
+        :param previous: Snapshot which was current before.
+        :type previous: ProjectSnapshot
+        :param current: Snapshot which is current now.
+        :type current: ProjectSnapshot
+        """
+        complete = previous.get_raw_data() is not current.get_raw_data() \
+            or previous.get_selected_config_index() != current.get_selected_config_index() \
+            or previous.get_config_settings() != current.get_config_settings()
+        derivatives, alternatives = current.get_derivatives(), current.get_alternatives()
+        changed_derivatives = ProxyProject.__changed_labels(previous.get_derivatives(), derivatives)
+        changed_alternatives = ProxyProject.__changed_labels(previous.get_alternatives(), alternatives)
+
+        # functions depending on a changed function are affected as well
+        dependents: dict[str, set[str]] = {}
+        for label, expr in derivatives.items():
+            for variable in expr.variables:
+                dependents.setdefault(variable, set()).add(label)
+        for label, alternative in alternatives.items():
+            if not isinstance(alternative, Alternative):
+                continue
+            for variable in alternative.function.variables | alternative.availability_condition.variables:
+                dependents.setdefault(variable, set()).add(label)
+        affected = changed_derivatives | changed_alternatives
+        pending = list(affected)
+        while pending:
+            for label in dependents.get(pending.pop(), ()):
+                if label not in affected:
+                    affected.add(label)
+                    pending.append(label)
+        changed_derivatives |= affected & derivatives.keys()
+        changed_alternatives |= affected & alternatives.keys()
+
+        version = next(ProxyProject.__versions)
+        self.__changes.append((self.__version, version, ProjectChange(frozenset(changed_derivatives),
+                                                                      frozenset(changed_alternatives), complete)))
+        self.__version = version
+
+    @staticmethod
+    def __changed_labels(previous: dict[str, object], current: dict[str, object]) -> set[str]:
+        """
+        :return: Labels of the entries which have been added, changed or removed.
+        :rtype: set[str]
+        """
+        return {label for label in previous.keys() | current.keys() if previous.get(label) != current.get(label)}
+
+    def get_version(self) -> int:
+        """
+        :return: Version of the current snapshot. Every change of the current snapshot leads to a new version.
+        :rtype: int
+        """
+        return self.__version
+
+    def get_changes(self, since: int) -> ProjectChange | None:
+        """
+        Collects the changes of the project since a version.
+        :param since: Version returned by get_version before.
+        :type since: int
+        :return: Changes since the version, None if the version is unknown or too old, so everything has to be
+        refreshed.
+        :rtype: ProjectChange | None
+        """
+        if since == self.__version:
+            return ProjectChange()
+        change = None
+        for previous, _, version_change in self.__changes:
+            if change is not None:
+                change = change.merge(version_change)
+            elif previous == since:
+                change = version_change
+        return change
+
+    def __history(self) -> list[ProjectSnapshot]:
+        """
+        :return: All snapshots in the history from the oldest to the most recently undone one.
+        :rtype: list[ProjectSnapshot]
+        """
+        first = self.__current_project
+        while first.previous is not None:
+            first = first.previous
+        history = [first]
+        while history[-1].next is not None:
+            history.append(history[-1].next)
+        return history
+
+    def __trim_history(self):
+        """
+        Drops the calculated values of all snapshots except the current one and removes snapshots from the history
+        until its length and memory are within their bounds.
+        """
+        current = self.__current_project
+        history = self.__history()
+        for snapshot in history:
+            if snapshot is not current:
+                snapshot.clear_caches(current)
+
+        usage = [snapshot.memory_usage() for snapshot in history]
+        while len(history) > 1:
+            memory = sum(functools.reduce(lambda a, b: a | b, usage, {}).values())
+            if len(history) <= self.max_snapshots and memory <= self.max_memory:
+                break
+            # remove the oldest snapshot, if the current one is the oldest remove the most recently undone one
+            idx = 0 if history[0] is not current else -1
+            removed = history.pop(idx)
+            usage.pop(idx)
+            if idx == 0:
+                history[0].previous = None
+            else:
+                history[-1].next = None
+            removed.previous, removed.next = None, None
+
     @property
     @__snapshot()
     def path(self: ProjectSnapshot) -> str:
@@ -104,13 +252,31 @@ class ProxyProject(Project):
     def set_config_settings(self: ProjectSnapshot, index: int, settings: dict[str, object]):
         return self.set_config_settings(index, settings)
 
+    @__snapshot()  # runtime setting, which is no change of the project
+    def set_max_workers(self: ProjectSnapshot, max_workers: int):
+        return self.set_max_workers(max_workers)
+
     @__snapshot()
     def get_config_display_names(self: ProjectSnapshot) -> list[str]:
         return self.get_config_display_names()
 
     @__snapshot(new_snapshot=True)
-    def evaluate(self: ProjectSnapshot):
-        return self.evaluate()
+    def evaluate(self: ProjectSnapshot, warm_start: bool = False):
+        return self.evaluate(warm_start)
+
+    @__snapshot()
+    def get_evaluation_basis(self: ProjectSnapshot) -> object:
+        return self.get_evaluation_basis()
+
+    @__snapshot(move_current=False)  # may run in another thread, while the current project changes
+    def calculate_evaluation(self: ProjectSnapshot, warm_start: bool = False,
+                             progress: Callable[[int, int], None] = None,
+                             cancelled: Callable[[], bool] = None, basis: object = None) -> Evaluation:
+        return self.calculate_evaluation(warm_start, progress, cancelled, basis)
+
+    @__snapshot(new_snapshot=True)
+    def set_evaluation(self: ProjectSnapshot, evaluation: Evaluation, basis: object = None):
+        return self.set_evaluation(evaluation, basis)
 
     @__snapshot()
     def is_optimizable(self: ProjectSnapshot) -> bool:
@@ -121,8 +287,16 @@ class ProxyProject(Project):
         return self.optimize_model()
 
     @__snapshot()
-    def get_raw_data(self: ProjectSnapshot, with_derivatives: bool = False) -> pd.DataFrame:
-        return self.get_raw_data(with_derivatives)
+    def get_raw_data(self: ProjectSnapshot, with_derivatives: bool = False, used_only: bool = False) -> pd.DataFrame:
+        return self.get_raw_data(with_derivatives, used_only)
+
+    @__snapshot()
+    def get_raw_data_types(self: ProjectSnapshot) -> pd.Series:
+        return self.get_raw_data_types()
+
+    @__snapshot()
+    def get_cached_derivatives(self: ProjectSnapshot) -> dict[str, tuple[str, pd.Series, EvaluationMethod]]:
+        return self.get_cached_derivatives()
 
     @__snapshot()
     def get_raw_data_path(self: ProjectSnapshot) -> str:
@@ -199,3 +373,7 @@ class ProxyProject(Project):
     @__snapshot()
     def get_evaluation(self: ProjectSnapshot) -> pd.DataFrame | None:
         return self.get_evaluation()
+
+    @__snapshot()
+    def get_evaluation_iterations(self: ProjectSnapshot) -> tuple[int | None, int | None]:
+        return self.get_evaluation_iterations()
@@ -0,0 +1,53 @@
+"""This module contains only one class with the same name."""
+
+from __future__ import annotations
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class ColumnSchema:
+    """
+    Describes a column of the raw data. Validation and type inference of expressions use the representative value
+    in place of the column, so the column itself is not needed for them.
+
+    Attributes:
+        name: Label of the column.
+        :type name: str
+        dtype: Data type of the column.
+        :type dtype: np.dtype | pd.api.extensions.ExtensionDtype
+        nullable: Whether the column contains missing values.
+        :type nullable: bool
+        value: First value of the column which is not missing, as Python scalar. If all values are missing, the zero
+        of a numeric data type, otherwise None.
+        :type value: object
+    """
+
+    name: str
+    dtype: np.dtype | pd.api.extensions.ExtensionDtype
+    nullable: bool
+    value: object
+
+    @staticmethod
+    def of(name: str, column: pd.Series) -> ColumnSchema:
+        """
+        Describe a column.
+        :param name: Label of the column.
+        :type name: str
+        :param column: Values of the column.
+        :type column: pd.Series
+        :return: Schema of the column.
+        :rtype: ColumnSchema
+        """
+        present = column.notna().to_numpy()
+        if present.any():
+            value = column.iloc[int(present.argmax())]
+        elif isinstance(column.dtype, np.dtype) and column.dtype.kind in 'biufc':
+            value = np.zeros(1, dtype=column.dtype)[0]
+        else:
+            value = None
+        if isinstance(value, np.generic):
+            value = value.item()
+        return ColumnSchema(name, column.dtype, not present.all(), value)
@@ -1,10 +1,17 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cached_property
+import hashlib
 
+from src.model.data.ColumnSchema import ColumnSchema
 from src.model.data.functions.FunctionalExpression import FunctionalExpression
 from src.model.data.functions.ErrorReport import ErrorReport
+from src.model.data.functions.DependencyGraph import DependencyGraph
+from src.model.data.functions.TypeInference import TypeInference
+from src.model.data.EvaluationMethod import EvaluationMethod
+from src.model.data.DerivativeCache import DerivativeCache
 
+import numpy as np
 import pandas as pd
 from graphlib import TopologicalSorter
 
@@ -13,15 +20,64 @@ from graphlib import TopologicalSorter
 class Data:
     """
     Maintains input data and all derivatives. Represents a current Snapshot of this data.
+    The raw data and all calculated columns are read-only and shared by all versions of the data and all readers
+    instead of being copied. Writing values into them raises a ValueError, replacing whole columns of a shallow copy
+    does not change the shared data.
 
     Attributes:
         raw_data: Input data on which calculations are based on.
         raw_data_path: Source path of the raw input data.
         derivatives: All derivatives in the current model.
+        derivative_cache: Calculated derivative columns shared by all versions based on the same raw data.
+        schema: Schema of each column of the raw data, keyed by the column label. Derived from the raw data once and
+        shared by all versions based on the same raw data.
     """
     raw_data: pd.DataFrame
     raw_data_path: str | None
     derivatives: dict[str, FunctionalExpression]
+    derivative_cache: DerivativeCache = field(default_factory=DerivativeCache, compare=False, repr=False)
+    schema: dict[str, ColumnSchema] = field(default=None, compare=False, repr=False)
+
+    __CACHED_PROPERTIES = ('dependency_graph', 'complete_data', 'evaluation_methods', '_Data__complete_evaluation',
+                           '_Data__signatures', 'raw_data_types', 'derivative_types', 'variable_types')
+
+    def __post_init__(self):
+        object.__setattr__(self, 'raw_data', Data.__read_only(self.raw_data))
+        if self.schema is None:
+            object.__setattr__(self, 'schema', {str(label): ColumnSchema.of(str(label), column)
+                                                for label, column in self.raw_data.items()})
+
+    @staticmethod
+    def __read_only(frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Get a read-only version of a table sharing the memory of its columns. Read-only tables are returned unchanged.
+        Tables with duplicate column labels can not be rebuilt by column and are returned unchanged.
+        :param frame: Table to be made read-only.
+        :return: Read-only table with equal content.
+        """
+        if not frame.columns.is_unique or all(not Data.__is_writeable(column) for _, column in frame.items()):
+            return frame
+        result = pd.DataFrame({label: Data.__read_only_column(column) for label, column in frame.items()},
+                              index=frame.index, columns=frame.columns, copy=False)
+        result.attrs = frame.attrs
+        return result
+
+    @staticmethod
+    def __read_only_column(column: pd.Series) -> pd.Series:
+        """
+        Get a read-only version of a column sharing its memory. Columns of extension types are returned unchanged.
+        :param column: Column to be made read-only.
+        :return: Read-only column with equal content.
+        """
+        if not Data.__is_writeable(column):
+            return column
+        values = column.to_numpy().view()
+        values.flags.writeable = False
+        return pd.Series(values, index=column.index, name=column.name, copy=False)
+
+    @staticmethod
+    def __is_writeable(column: pd.Series) -> bool:
+        return isinstance(column.dtype, np.dtype) and column.to_numpy().flags.writeable
 
     @staticmethod
     def sort_expressions(variables: dict[str, FunctionalExpression]) -> iter(str):
@@ -30,9 +86,12 @@ class Data:
         :return: Sorted FunctionalExpressions. First to last represents evaluable order.
         """
         graph = {}
+        dependency_graph = DependencyGraph.of(variables)
         for key in variables:
             expression = variables.get(key)
-            if expression.get_error_report(**variables).valid:
+            if not isinstance(expression, FunctionalExpression):
+                graph[key] = set()  # values do not depend on other variables
+            elif expression.get_error_report(dependency_graph, **variables).valid:
                 graph[key] = expression.variables
         # graph is acyclic because only valid expressions
         sorter = TopologicalSorter(graph)
@@ -40,23 +99,221 @@ class Data:
         # filter for only derivatives so eval can be called on all elements
         return sorted_variables
 
+    @cached_property
+    def dependency_graph(self) -> DependencyGraph:
+        """
+        Get the dependencies between all derivatives and attributes of the raw data.
+        Calculated once per version of the data.
+        :return: Dependency graph of all variables.
+        """
+        return DependencyGraph.of(self.get_variables())
+
+    @cached_property
+    def raw_data_types(self) -> dict[str, type]:
+        """
+        Get the types of the values of the raw data columns, derived from their data types. Columns of other data
+        types are typed by their representative value, columns without any value are missing.
+        :return: Type of the values of each column.
+        """
+        types = dict()
+        for label, column in self.schema.items():
+            column_type = TypeInference.of_dtype(column.dtype)
+            if column_type is None and column.value is not None:
+                column_type = type(column.value)
+            if column_type is not None:
+                types[label] = column_type
+        return types
+
+    @cached_property
+    def derivative_types(self) -> dict[str, type | None]:
+        """
+        Infer the types of all valid derivatives statically in one sweep in evaluable order.
+        Calculated once per version of the data.
+        :return: Type of each valid derivative. None if it can not be inferred without evaluating the derivative.
+        """
+        return TypeInference.infer_all({label: self.derivatives[label] for label in self.__signatures},
+                                       self.raw_data_types)
+
+    @cached_property
+    def variable_types(self) -> dict[str, type]:
+        """
+        Get the types of all variables of the data whose type is known statically.
+        Derivatives replace raw data columns with the same label.
+        :return: Type of each raw data column and valid derivative with a statically inferred type.
+        """
+        types = {label: column_type for label, column_type in self.raw_data_types.items()
+                 if label not in self.derivatives}
+        return types | {label: derivative_type for label, derivative_type in self.derivative_types.items()
+                        if derivative_type is not None}
+
     @cached_property
     def complete_data(self) -> pd.DataFrame:
         """
         Create a new table containing the raw data and calculated columns for all valid derivatives.
         :return: New table with raw data and calculated valid derivatives.
         """
-        complete_data = self.raw_data.copy(True)
+        return self.__complete_evaluation[0]
+
+    @cached_property
+    def evaluation_methods(self) -> dict[str, EvaluationMethod]:
+        """
+        Get the way each derivative column of the complete data has been calculated.
+        :return: Evaluation method for each calculated valid derivative.
+        """
+        return self.__complete_evaluation[1]
 
-        variables = self.sort_expressions(self.get_variables())
-        sorted_derivatives = [x for x in variables if x in self.derivatives]
+    @cached_property
+    def __complete_evaluation(self) -> tuple[pd.DataFrame, dict[str, EvaluationMethod]]:
+        """
+        Calculate all valid derivatives in evaluable order.
+        The resulting table shares its columns with the raw data and the derivative cache.
+        :return: Table with raw data and calculated valid derivatives and the evaluation method of each derivative.
+        """
+        columns, methods = self.__evaluate(self.__signatures.keys())
+        return pd.DataFrame(columns, index=self.raw_data.index, copy=False), methods
+
+    def __evaluate(self, keys: iter(str)) -> tuple[dict[str, pd.Series], dict[str, EvaluationMethod]]:
+        """
+        Calculate valid derivatives in evaluable order.
+        Columns of unchanged derivatives are reused from the derivative cache, all others are recalculated.
+        Derivatives are evaluated on whole columns if possible, otherwise row by row.
+        :param keys: Labels of valid derivatives in evaluable order, including all derivatives they depend on.
+        :return: Columns of the raw data and the calculated derivatives and the evaluation method of each derivative.
+        """
+        columns = {label: column for label, column in self.raw_data.items()}
+        methods = dict()
+
+        signatures = self.__signatures
         # add derivatives
-        for key in sorted_derivatives:
+        for key in keys:
+            signature = signatures[key]
+            cached = self.derivative_cache.get(key, signature)
+            if cached is None:
+                expression = self.derivatives.get(key)
+                used_columns = pd.DataFrame({label: columns[label] for label in sorted(expression.variables)},
+                                            index=self.raw_data.index, copy=False)
+                column, method = self.__evaluate_column(expression, used_columns)
+                cached = Data.__read_only_column(column), method
+                self.derivative_cache.put(key, signature, *cached)
+            columns[key], methods[key] = cached
+        return columns, methods
+
+    def reachable_variables(self, variables: set[str]) -> set[str]:
+        """
+        Get variables and all variables they depend on directly or indirectly through derivatives.
+        :param variables: Names of the variables. Names which are no derivative are kept without dependencies.
+        :return: Names of the variables and of all their dependencies.
+        """
+        reachable = set()
+        pending = list(variables)
+        while pending:
+            variable = pending.pop()
+            if variable in reachable:
+                continue
+            reachable.add(variable)
+            if variable in self.derivatives:
+                pending.extend(self.derivatives[variable].variables)
+        return reachable
+
+    def get_complete_data(self, variables: set[str] = None) -> pd.DataFrame:
+        """
+        Create a table containing the raw data and calculated columns for the valid derivatives, restricted to some
+        variables and their dependencies. Derivatives outside of them are not calculated, if the complete data has
+        not been calculated yet.
+        :param variables: Names of the variables the table is restricted to. All variables, if None.
+        :return: Table with the raw data and calculated valid derivatives the variables depend on.
+        """
+        if variables is None:
+            return self.complete_data
+        reachable = self.reachable_variables(variables)
+        if 'complete_data' in self.__dict__:
+            columns = {label: column for label, column in self.complete_data.items()}
+        else:
+            columns, _ = self.__evaluate(key for key in self.__signatures if key in reachable)
+        return pd.DataFrame({label: column for label, column in columns.items() if label in reachable},
+                            index=self.raw_data.index, copy=False)
+
+    @cached_property
+    def __signatures(self) -> dict[str, str]:
+        """
+        Calculate a signature for every valid derivative. The signature of a derivative changes if its expression or
+        the signature of any of its dependencies changes.
+        :return: Signatures of all valid derivatives in evaluable order.
+        """
+        signatures = {str(col): str(col) for col in self.raw_data.columns}
+        for key in self.sort_expressions(self.get_variables()):
+            if key not in self.derivatives:
+                continue
             expression = self.derivatives.get(key)
-            row_value_dict = complete_data.to_dict(orient='index')
-            complete_data[key] = complete_data.index.map(row_value_dict)
-            complete_data[key] = complete_data[key].apply(lambda x: expression.eval(**x))
-        return complete_data
+            content = repr((expression.expression, sorted((var, signatures.get(var)) for var in expression.variables)))
+            signatures[key] = hashlib.sha256(content.encode()).hexdigest()
+        return {key: signature for key, signature in signatures.items() if key in self.derivatives}
+
+    def get_derivative_signatures(self) -> dict[str, str]:
+        """
+        Get the signature of every valid derivative. The signature of a derivative changes if its expression or the
+        expression of any derivative it depends on changes.
+        :return: Signatures of all valid derivatives in evaluable order.
+        """
+        return self.__signatures.copy()
+
+    def get_cached_derivatives(self) -> dict[str, tuple[str, pd.Series, EvaluationMethod]]:
+        """
+        Get the calculated columns of the valid derivatives of this version, which are held by the derivative cache.
+        Derivatives are not calculated by this method.
+        :return: Signature, column and evaluation method of each calculated derivative.
+        """
+        cached = dict()
+        for label, signature in self.__signatures.items():
+            entry = self.derivative_cache.get(label, signature)
+            if entry is not None:
+                cached[label] = (signature, *entry)
+        return cached
+
+    @staticmethod
+    def __evaluate_column(expression: FunctionalExpression,
+                          data: pd.DataFrame) -> tuple[pd.Series, EvaluationMethod]:
+        """
+        Evaluate an expression for all rows of a table.
+        :param expression: Valid expression only depending on columns of the table.
+        :param data: Table containing all columns the expression depends on.
+        :return: Resulting column and the way it has been calculated.
+        """
+        used_columns = data[sorted(expression.variables)]
+
+        if expression.vectorizable:
+            try:
+                result = expression.eval_columns(**{label: used_columns[label] for label in used_columns})
+                if isinstance(result, pd.Series) and len(result) == len(data):
+                    # never share memory with an input column
+                    return result.copy(), EvaluationMethod.VECTORIZED
+                if not isinstance(result, pd.Series) and pd.api.types.is_scalar(result):
+                    dtype = object if result is None else None
+                    return pd.Series(result, index=data.index, dtype=dtype), EvaluationMethod.VECTORIZED
+            except Exception:
+                pass  # column-wise semantics not applicable to these values, evaluate row by row instead
+
+        results = expression.eval_rows(len(data), **{label: used_columns[label].tolist() for label in used_columns})
+        return pd.Series(results, index=data.index), EvaluationMethod.ROW_WISE
+
+    def memory_usage(self) -> dict[int, int]:
+        """
+        Get the memory used by the tables of this version of the data. Tables are shared between versions, so each
+        table is keyed by its identity and the memory of several versions is the sum over the union of their tables.
+        The complete data shares its columns with the raw data and the derivative cache and is not counted.
+        Python objects in object columns are shared by all copies of a table and are not counted.
+        :return: Number of bytes of each table, keyed by the identity of the table.
+        """
+        return {id(self.raw_data): int(self.raw_data.memory_usage(index=True).sum()),
+                id(self.derivative_cache): self.derivative_cache.memory_usage()}
+
+    def clear_caches(self):
+        """
+        Drop all values calculated for this version of the data, they are recalculated on the next access.
+        Columns in the derivative cache are kept, they are shared with the other versions.
+        """
+        for name in Data.__CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
 
     def set_raw_data(self, raw_data: pd.DataFrame, path: str) -> Data:
         """
@@ -76,7 +333,7 @@ class Data:
         """
         new_derivatives = self.derivatives.copy()
         new_derivatives.update({label: derivative})
-        return Data(self.raw_data, self.raw_data_path, new_derivatives)
+        return Data(self.raw_data, self.raw_data_path, new_derivatives, self.derivative_cache, self.schema)
 
     def remove_derivative(self, label: str) -> Data:
         """
@@ -90,19 +347,17 @@ class Data:
 
         new_derivatives = self.derivatives.copy()
         new_derivatives.pop(label)
-        return Data(self.raw_data, self.raw_data_path, new_derivatives)
+        return Data(self.raw_data, self.raw_data_path, new_derivatives, self.derivative_cache, self.schema)
 
-    def get_variables(self) -> dict[str, FunctionalExpression]:
+    def get_variables(self) -> dict[str, FunctionalExpression | object]:
         """
-        Get all derivatives and attributes of the raw data as functional expressions.
-        Raw data attributes are represented by an example value.
+        Get all derivatives as functional expressions and all attributes of the raw data.
+        Raw data attributes are represented by the representative value of their column schema.
         :return: Union of derivatives and raw data attributes.
         """
-        variables = dict()
-        for col in self.raw_data.columns:
-            # first row example value as an expression
-            variables[str(col)] = FunctionalExpression(str(self.raw_data[col].iloc[0]))
-        variables |= self.derivatives.copy()
+        variables: dict[str, FunctionalExpression | object] = {label: column.value
+                                                                for label, column in self.schema.items()}
+        variables |= self.derivatives
         return variables
 
     def get_derivative_error_report(self, label: str, variables: dict[str, object]) -> ErrorReport:
@@ -117,7 +372,7 @@ class Data:
             raise KeyError(f'There is no derivative with the label {label}')
 
         derivative_expression = self.derivatives.get(label)
-        return derivative_expression.get_error_report(**(variables | self.get_variables()))
+        return derivative_expression.get_error_report(self.dependency_graph, **(variables | self.get_variables()))
 
     def get_derivative_type(self, label: str, variables: dict[str, object]) -> type:
         """
@@ -131,4 +386,10 @@ class Data:
             raise KeyError(f'There is no derivative with the label {label}')
 
         derivative_expression = self.derivatives.get(label)
-        return derivative_expression.type(**(variables | self.get_variables()))
+        variables = variables | self.get_variables()
+        if not derivative_expression.get_error_report(self.dependency_graph, **variables).valid:
+            raise SyntaxError
+        derivative_type = self.derivative_types.get(label)
+        if derivative_type is not None:
+            return derivative_type
+        return derivative_expression.type(self.dependency_graph, **variables)
@@ -0,0 +1,68 @@
+from __future__ import annotations
+import threading
+
+from src.model.data.EvaluationMethod import EvaluationMethod
+
+import pandas as pd
+
+
+class DerivativeCache:
+    """
+    Stores calculated derivative columns, so they can be reused by later versions of the same data.
+    A column is only reused if its signature still matches. The signature covers the expression of the derivative
+    and the signatures of all expressions it depends on, so editing a derivative invalidates only the derivative
+    itself and everything depending on it.
+    Holds at most one column per derivative label. Access is thread safe.
+    """
+
+    def __init__(self):
+        self.__columns: dict[str, tuple[str, pd.Series, EvaluationMethod]] = dict()
+        self.__lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, object]:
+        """
+        Cached columns are not pickled, an unpickled cache is empty.
+        """
+        return dict()
+
+    def __setstate__(self, state: dict[str, object]):
+        self.__init__()
+
+    def get(self, label: str, signature: str) -> tuple[pd.Series, EvaluationMethod] | None:
+        """
+        Get a cached column.
+        :param label: Name of the derivative.
+        :param signature: Current signature of the derivative.
+        :return: Column and the way it has been calculated. None if no column with this signature is cached.
+        """
+        with self.__lock:
+            entry = self.__columns.get(label)
+        if entry is None or entry[0] != signature:
+            return None
+        return entry[1], entry[2]
+
+    def put(self, label: str, signature: str, column: pd.Series, method: EvaluationMethod):
+        """
+        Store a calculated column. Replaces any column cached for the same label.
+        :param label: Name of the derivative.
+        :param signature: Signature of the derivative the column has been calculated with.
+        :param column: Calculated column.
+        :param method: Way the column has been calculated.
+        """
+        with self.__lock:
+            self.__columns[label] = (signature, column, method)
+
+    def memory_usage(self) -> int:
+        """
+        Get the memory used by the cached columns.
+        :return: Number of bytes of all cached columns.
+        """
+        with self.__lock:
+            return sum(int(column.memory_usage(index=True)) for _, column, _ in self.__columns.values())
+
+    def clear(self):
+        """
+        Remove all cached columns.
+        """
+        with self.__lock:
+            self.__columns.clear()
@@ -0,0 +1,14 @@
+from __future__ import annotations
+from enum import Enum
+
+
+class EvaluationMethod(Enum):
+    """
+    Way a derivative column has been calculated.
+
+    Attributes:
+        VECTORIZED: The expression has been evaluated once on whole columns.
+        ROW_WISE: The expression has been evaluated once per row.
+    """
+    VECTORIZED = 'vectorized'
+    ROW_WISE = 'row-wise'
@@ -1,10 +1,13 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import cached_property
 
 from src.model.data.Data import Data
 from src.model.data.Alternative import Alternative
 from src.model.data.functions.FunctionalExpression import FunctionalExpression
 from src.model.data.functions.ErrorReport import ErrorReport
+from src.model.data.functions.DependencyGraph import DependencyGraph
+from src.model.data.functions.TypeInference import TypeInference
 
 import pandas as pd
 
@@ -83,15 +86,64 @@ class Model:
         """
         return Model(data, self.alternatives, self.choice)
 
-    def get_variables(self) -> dict[str, FunctionalExpression]:
+    def get_variables(self) -> dict[str, FunctionalExpression | object]:
         """
-        Get all derivatives and attributes of the raw data as functional expressions
-        and all alternatives as expressions.
-        Raw data attributes are represented by an example value.
+        Get all derivatives and alternatives as functional expressions and all attributes of the raw data.
+        Raw data attributes are represented by the representative value of their column schema.
         :return: Union of derivatives, raw data attributes and alternatives.
         """
         return self.data.get_variables() | {label: alt.function for label, alt in self.alternatives.items()}
 
+    @cached_property
+    def dependency_graph(self) -> DependencyGraph:
+        """
+        Get the dependencies between all alternatives, derivatives and attributes of the raw data.
+        Calculated once per version of the model.
+        :return: Dependency graph of all variables.
+        """
+        return DependencyGraph.of(self.get_variables())
+
+    @cached_property
+    def used_variables(self) -> set[str]:
+        """
+        Get the variables the model uses: all variables of the alternatives, availability conditions and the choice
+        and all derivatives and attributes of the raw data they depend on. Labels of alternatives and parameters,
+        which are used in alternatives, are contained as well.
+        Calculated once per version of the model.
+        :return: Names of the used variables.
+        """
+        variables = set(self.choice.variables)
+        for alternative in self.alternatives.values():
+            variables |= alternative.function.variables | alternative.availability_condition.variables
+        return self.data.reachable_variables(variables)
+
+    def get_used_data(self) -> pd.DataFrame:
+        """
+        Get the columns of the raw data and the valid derivatives the model uses. Derivatives the model does not use
+        are not calculated.
+        :return: Table with the used raw data attributes and calculated valid derivatives.
+        """
+        return self.data.get_complete_data(self.used_variables)
+
+    @cached_property
+    def alternative_types(self) -> dict[str, type | None]:
+        """
+        Infer the types of all alternatives statically in one sweep in evaluable order.
+        Calculated once per version of the model.
+        :return: Type of each alternative. None if it can not be inferred without evaluating the alternative.
+        """
+        return TypeInference.infer_all({label: alt.function for label, alt in self.alternatives.items()},
+                                       self.data.variable_types)
+
+    def clear_caches(self):
+        """
+        Drop all values calculated for this version of the model, they are recalculated on the next access.
+        The data is not changed, it may be shared with other versions of the model.
+        """
+        self.__dict__.pop('dependency_graph', None)
+        self.__dict__.pop('used_variables', None)
+        self.__dict__.pop('alternative_types', None)
+
     def get_derivative_error_report(self, label: str, variables: dict[str, object]) -> ErrorReport:
         """
         Get an error report of the derivative. Contains all found errors.
@@ -124,7 +176,7 @@ class Model:
             raise KeyError(f'There is no alternative with this label {label}')
 
         alternative_expression = self.alternatives.get(label).function
-        return alternative_expression.get_error_report(**(variables | self.get_variables()))
+        return alternative_expression.get_error_report(self.dependency_graph, **(variables | self.get_variables()))
 
     def get_alternative_type(self, label: str, variables: dict[str, object]) -> type:
         """
@@ -138,7 +190,13 @@ class Model:
             raise KeyError(f'There is no alternative with this label {label}')
 
         alternative_expression = self.alternatives.get(label).function
-        return alternative_expression.type(**(variables | self.get_variables()))
+        variables = variables | self.get_variables()
+        if not alternative_expression.get_error_report(self.dependency_graph, **variables).valid:
+            raise SyntaxError
+        alternative_type = self.alternative_types.get(label)
+        if alternative_type is not None:
+            return alternative_type
+        return alternative_expression.type(self.dependency_graph, **variables)
 
     def get_availability_condition_error_report(self, label: str, variables: dict[str, object]) -> ErrorReport:
         """
@@ -152,7 +210,7 @@ class Model:
             raise KeyError(f'There is no alternative with this label {label}')
 
         expr = self.alternatives.get(label).availability_condition
-        return expr.get_error_report(**(variables | self.data.get_variables()))
+        return expr.get_error_report(self.data.dependency_graph, **(variables | self.data.get_variables()))
 
     def get_availability_condition_type(self, label: str, variables: dict[str, object]) -> type:
         """
@@ -166,7 +224,13 @@ class Model:
             raise KeyError(f'There is no alternative with this label {label}')
 
         expr = self.alternatives.get(label).availability_condition
-        return expr.type(**(variables | self.data.get_variables()))
+        variables = variables | self.data.get_variables()
+        if not expr.get_error_report(self.data.dependency_graph, **variables).valid:
+            raise SyntaxError
+        condition_type = expr.static_type(self.data.variable_types)
+        if condition_type is not None:
+            return condition_type
+        return expr.type(self.data.dependency_graph, **variables)
 
     def set_choice(self, choice: FunctionalExpression) -> Model:
         """
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import ast
+import operator
+
+import numpy as np
+import pandas as pd
+
+from src.model.data.functions.Interval import Interval
+from src.model.data.functions.GroupMap import GroupMap
+
+
+class ColumnTransformer(ast.NodeTransformer):
+    """
+    Rewrites the syntax tree of an expression, so it can be evaluated once on whole columns instead of once per row.
+    Operations whose row-wise semantics differ from their column-wise semantics are replaced by helper calls.
+    Expressions containing unsupported syntax can not be transformed and have to be evaluated row-wise.
+
+    Attributes:
+        HELPERS: Helper functions used by transformed expressions. Have to be part of the evaluation namespace.
+    """
+
+    __CONTAINS = '__column_contains'
+    __ARITHMETIC = '__column_arithmetic'
+    __BINARY = '__column_binary'
+    __ABSOLUTE = '__column_absolute'
+    __MINIMUM = '__column_minimum'
+    __MAXIMUM = '__column_maximum'
+    __GROUP_MAP = '__column_group_map'
+
+    __SUPPORTED_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Compare, ast.Call, ast.Name, ast.Constant,
+                         ast.List, ast.Tuple, ast.Set, ast.keyword, ast.Load, ast.operator, ast.cmpop, ast.UAdd,
+                         ast.USub)
+    __UNSUPPORTED_OPERATORS = (ast.MatMult, ast.Is, ast.IsNot)
+    __OPERATORS = {ast.Add: 'add', ast.Sub: 'sub', ast.Mult: 'mul', ast.Div: 'truediv', ast.FloorDiv: 'floordiv',
+                   ast.Mod: 'mod', ast.Pow: 'pow', ast.BitAnd: 'and_', ast.BitOr: 'or_', ast.BitXor: 'xor',
+                   ast.LShift: 'lshift', ast.RShift: 'rshift'}
+    __BITWISE_OPERATORS = {'and_', 'or_', 'xor'}  # the only operators keeping booleans
+    __DIVISIONS = {'truediv', 'floordiv', 'mod'}
+    __INTEGER_LIMIT = 2.0 ** 62  # integer powers reaching it may overflow 64 bit integers
+    __SUPPORTED_FUNCTIONS = {'abs', 'pow', 'min', 'max', 'range', 'set', 'Interval', 'GroupMap'}
+
+    def transform(self, expression: str) -> ast.Expression:
+        """
+        Create the column-wise syntax tree of an expression.
+        :param expression: Input string of the expression.
+        :return: Transformed syntax tree. Can be compiled in 'eval' mode.
+        :raises SyntaxError: The expression can not be parsed.
+        :raises ValueError: The expression can not be evaluated column-wise.
+        """
+        tree = ast.parse(expression, mode='eval')
+        for node in ast.walk(tree):
+            if not isinstance(node, ColumnTransformer.__SUPPORTED_NODES) \
+                    or isinstance(node, ColumnTransformer.__UNSUPPORTED_OPERATORS):
+                raise ValueError(f'{type(node).__name__} can not be evaluated column-wise')
+        return ast.fix_missing_locations(self.visit(tree))
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        self.generic_visit(node)
+        name = ColumnTransformer.__OPERATORS.get(type(node.op))
+        if name is None:
+            return node
+        return self.__call(ColumnTransformer.__BINARY, ast.Constant(name), node.left, node.right)
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        self.generic_visit(node)
+        # python negation of booleans results in integers, numpy negation stays boolean
+        node.operand = self.__call(ColumnTransformer.__ARITHMETIC, node.operand)
+        return node
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        self.generic_visit(node)
+        # split chained comparisons, because they are evaluated with an implicit 'and'
+        parts = []
+        left = node.left
+        for op, right in zip(node.ops, node.comparators):
+            if isinstance(op, (ast.In, ast.NotIn)):
+                parts.append(self.__call(ColumnTransformer.__CONTAINS, right, left,
+                                         ast.Constant(isinstance(op, ast.NotIn))))
+            else:
+                parts.append(ast.Compare(left=left, ops=[op], comparators=[right]))
+            left = right
+
+        result = parts[0]
+        for part in parts[1:]:
+            result = ast.BinOp(left=result, op=ast.BitAnd(), right=part)
+        return result
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        self.generic_visit(node)
+        # GroupMap(groups)(x)
+        if isinstance(node.func, ast.Call) and isinstance(node.func.func, ast.Name) \
+                and node.func.func.id == 'GroupMap':
+            if len(node.args) != 1 or node.keywords:
+                raise ValueError('GroupMap can only be called with one argument')
+            return self.__call(ColumnTransformer.__GROUP_MAP, node.func, node.args[0])
+
+        if not isinstance(node.func, ast.Name) or node.func.id not in ColumnTransformer.__SUPPORTED_FUNCTIONS:
+            raise ValueError('function can not be evaluated column-wise')
+
+        # min and max of multiple values are calculated elementwise, min and max of an iterable are not supported
+        if node.func.id in ('min', 'max'):
+            if len(node.args) < 2 or node.keywords:
+                raise ValueError(f'{node.func.id} of an iterable can not be evaluated column-wise')
+            helper = ColumnTransformer.__MINIMUM if node.func.id == 'min' else ColumnTransformer.__MAXIMUM
+            return self.__call(helper, *node.args)
+        if node.func.id == 'pow':
+            if len(node.args) != 2 or node.keywords:
+                raise ValueError('pow with modulo can not be evaluated column-wise')
+            return self.__call(ColumnTransformer.__BINARY, ast.Constant('pow'), *node.args)
+        if node.func.id == 'abs':
+            if len(node.args) != 1 or node.keywords:
+                raise ValueError('abs can only be called with one argument')
+            return self.__call(ColumnTransformer.__ABSOLUTE, node.args[0])
+        return node
+
+    @staticmethod
+    def __call(name: str, *args: ast.expr) -> ast.Call:
+        return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=list(args), keywords=[])
+
+    @staticmethod
+    def __contains(container: object, item: object, negate: bool) -> object:
+        """
+        Column-wise counterpart of 'item in container'.
+        """
+        if not isinstance(item, pd.Series):
+            # membership in a column tests its index, not its values, so only known containers are evaluated
+            if not isinstance(container, (Interval, range, list, tuple, set, frozenset, str)):
+                raise TypeError(f'membership in {type(container).__name__} can not be evaluated column-wise')
+            return (item not in container) if negate else (item in container)
+
+        if isinstance(container, Interval):
+            mask = ColumnTransformer.__interval_mask(container, item)
+        elif isinstance(container, range):
+            mask = ColumnTransformer.__range_mask(container, item)
+        elif isinstance(container, (list, tuple, set, frozenset)):
+            mask = item.isin(list(container))
+        else:
+            raise TypeError(f'membership in {type(container).__name__} can not be evaluated column-wise')
+        return ~mask if negate else mask
+
+    @staticmethod
+    def __interval_mask(interval: Interval, values: pd.Series) -> pd.Series:
+        mask = pd.Series(True, index=values.index)
+        if interval.begin is not None:
+            mask &= (interval.begin < values) | (interval.include_begin & (interval.begin == values))
+        if interval.end is not None:
+            mask &= (values < interval.end) | (interval.include_end & (interval.end == values))
+        return mask
+
+    @staticmethod
+    def __range_mask(range_: range, values: pd.Series) -> pd.Series:
+        if not pd.api.types.is_numeric_dtype(values.dtype):
+            raise TypeError('membership of non-numeric values in range can not be evaluated column-wise')
+        values = ColumnTransformer.__arithmetic(values)
+        if range_.step > 0:
+            mask = (range_.start <= values) & (values < range_.stop)
+        else:
+            mask = (values <= range_.start) & (range_.stop < values)
+        return mask & ((values - range_.start) % range_.step == 0)
+
+    @staticmethod
+    def __arithmetic(value: object) -> object:
+        if isinstance(value, pd.Series) and pd.api.types.is_bool_dtype(value.dtype):
+            return value.astype(np.int64)
+        return value
+
+    @staticmethod
+    def __is_bool(value: object) -> bool:
+        if isinstance(value, pd.Series):
+            return pd.api.types.is_bool_dtype(value.dtype)
+        return isinstance(value, (bool, np.bool_))
+
+    @staticmethod
+    def __is_number(value: object, kinds: str) -> bool:
+        if isinstance(value, pd.Series):
+            return isinstance(value.dtype, np.dtype) and value.dtype.kind in kinds
+        return isinstance(value, (bool, int, float, complex, np.number, np.bool_)) \
+            and np.asarray(value).dtype.kind in kinds
+
+    @staticmethod
+    def __binary(name: str, left: object, right: object) -> object:
+        """
+        Column-wise counterpart of a binary operator. Raises, if the result would differ from the row-wise result, so
+        the expression is evaluated row by row instead: on division by zero and on integer powers exceeding 64 bits.
+        """
+        function = getattr(operator, name)
+        if not isinstance(left, pd.Series) and not isinstance(right, pd.Series):
+            return function(left, right)
+
+        # python operators on booleans result in integers, except for bitwise operators on two booleans
+        if name not in ColumnTransformer.__BITWISE_OPERATORS \
+                or not (ColumnTransformer.__is_bool(left) and ColumnTransformer.__is_bool(right)):
+            left = ColumnTransformer.__arithmetic(left)
+            right = ColumnTransformer.__arithmetic(right)
+
+        if name in ColumnTransformer.__DIVISIONS and ColumnTransformer.__is_number(left, 'biufc') \
+                and ColumnTransformer.__is_number(right, 'biufc') and np.any(np.asarray(right) == 0):
+            raise ZeroDivisionError(f'{name} by zero')
+        if name == 'pow' and ColumnTransformer.__is_number(left, 'biu') and ColumnTransformer.__is_number(right, 'biu'):
+            with np.errstate(all='ignore'):
+                magnitude = np.abs(np.power(np.asarray(left, dtype=np.float64), np.asarray(right, dtype=np.float64)))
+            if np.any(magnitude >= ColumnTransformer.__INTEGER_LIMIT):
+                raise OverflowError('integer power exceeds 64 bits')
+        return function(left, right)
+
+    @staticmethod
+    def __absolute(value: object) -> object:
+        return abs(ColumnTransformer.__arithmetic(value))
+
+    @staticmethod
+    def __select(values: tuple, replace) -> object:
+        """
+        Select elementwise like the builtins min and max: a later value only replaces the current one, if replace is
+        true for this pair.
+        """
+        booleans = [ColumnTransformer.__is_bool(value) for value in values]
+        if any(booleans) and not all(booleans):
+            # the type of the selected value differs between the rows
+            raise TypeError('min and max of booleans and numbers can not be evaluated column-wise')
+        index = next(v.index for v in values if isinstance(v, pd.Series))
+        result = values[0]
+        for value in values[1:]:
+            result = np.where(replace(value, result), value, result)
+        return pd.Series(result, index=index)
+
+    @staticmethod
+    def __minimum(*values: object) -> object:
+        if not any(isinstance(v, pd.Series) for v in values):
+            return min(*values)
+        return ColumnTransformer.__select(values, lambda value, current: value < current)
+
+    @staticmethod
+    def __maximum(*values: object) -> object:
+        if not any(isinstance(v, pd.Series) for v in values):
+            return max(*values)
+        return ColumnTransformer.__select(values, lambda value, current: value > current)
+
+    @staticmethod
+    def __group_map(group_map: GroupMap, values: object) -> object:
+        """
+        Column-wise counterpart of 'group_map(values)'.
+        """
+        if not isinstance(values, pd.Series):
+            return group_map(values)
+
+        result = np.full(len(values), np.nan)
+        unassigned = np.ones(len(values), dtype=bool)
+        for idx, group in enumerate(group_map.groups):
+            mask = ColumnTransformer.__contains(group, values, False).to_numpy(dtype=bool)
+            result[mask & unassigned] = idx + 1
+            unassigned &= ~mask
+
+        if unassigned.any():
+            # elements without group are None, whose column type depends on the other rows
+            raise ValueError('elements without group can not be evaluated column-wise')
+        return pd.Series(result.astype(np.int64), index=values.index)
+
+    HELPERS = {
+        __CONTAINS: __contains,
+        __ARITHMETIC: __arithmetic,
+        __BINARY: __binary,
+        __ABSOLUTE: __absolute,
+        __MINIMUM: __minimum,
+        __MAXIMUM: __maximum,
+        __GROUP_MAP: __group_map
+    }
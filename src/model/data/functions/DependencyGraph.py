@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+
+class DependencyGraph:
+    """
+    Dependencies between variables. Used to find cyclic dependencies.
+    The strongly connected components of the graph are calculated once in linear time (Tarjan's algorithm),
+    afterwards the cycle status of any variable can be read without searching the graph again.
+
+    Attributes:
+        dependencies: Labels of the variables each variable depends on directly.
+    """
+
+    def __init__(self, dependencies: dict[str, set[str]]):
+        self.dependencies = dependencies
+        self.__component: dict[str, int] = dict()
+        self.__cyclic_components: set[int] = set()
+        self.__leads_to_cycle: dict[str, bool] = dict()
+        self.__cycles: dict[str, list[str]] = dict()
+        self.__find_components()
+
+    @staticmethod
+    def of(variables: dict[str, object]) -> DependencyGraph:
+        """
+        Create the dependency graph of variables. Only expressions can depend on other variables.
+        :param variables: Variables with their values or expressions.
+        :return: Dependency graph of the variables.
+        """
+        dependencies = dict()
+        for label, value in variables.items():
+            used = getattr(value, 'variables', None)
+            dependencies[label] = used if isinstance(used, (set, frozenset)) else set()
+        return DependencyGraph(dependencies)
+
+    def __successors(self, label: str) -> list[str]:
+        return sorted(dep for dep in self.dependencies.get(label, ()) if dep in self.dependencies)
+
+    def __find_components(self):
+        """
+        Calculate the strongly connected components with an iterative version of Tarjan's algorithm.
+        Components are found in reverse topological order, so whether a variable leads to a cycle is known for all
+        its dependencies when its component is completed.
+        """
+        index = dict()
+        low_link = dict()
+        stack = list()
+        on_stack = set()
+        component_count = 0
+
+        for root in self.dependencies:
+            if root in index:
+                continue
+            work = [(root, iter(self.__successors(root)))]
+            index[root] = low_link[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                label, successors = work[-1]
+                successor = next(successors, None)
+                if successor is not None:
+                    if successor not in index:
+                        index[successor] = low_link[successor] = len(index)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, iter(self.__successors(successor))))
+                    elif successor in on_stack:
+                        low_link[label] = min(low_link[label], index[successor])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low_link[parent] = min(low_link[parent], low_link[label])
+                if low_link[label] != index[label]:
+                    continue
+
+                # label is the root of a strongly connected component
+                members = list()
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    self.__component[member] = component_count
+                    members.append(member)
+                    if member == label:
+                        break
+                if len(members) > 1 or label in self.dependencies[label]:
+                    self.__cyclic_components.add(component_count)
+                for member in members:
+                    self.__leads_to_cycle[member] = component_count in self.__cyclic_components \
+                        or any(self.__leads_to_cycle[dep] for dep in self.__successors(member))
+                component_count += 1
+
+    def leads_to_cycle(self, label: str) -> bool:
+        """
+        :param label: Label of a variable.
+        :return: True if the variable is part of a cyclic dependency or depends on one. Otherwise, False.
+        """
+        return self.__leads_to_cycle.get(label, False)
+
+    def cycle(self, label: str) -> list[str] | None:
+        """
+        Find a path from a variable into a cyclic dependency.
+        :param label: Label of a variable.
+        :return: Labels along the path. Starts with the variable and ends with the first repeated label.
+        None if the variable does not lead to a cyclic dependency.
+        """
+        if not self.leads_to_cycle(label):
+            return None
+        if label not in self.__cycles:
+            path = list()
+            current = label
+            while self.__component[current] not in self.__cyclic_components:
+                path.append(current)
+                current = next(dep for dep in self.__successors(current) if self.leads_to_cycle(dep))
+            self.__cycles[label] = path + self.__cycle_in_component(current)
+        return self.__cycles[label]
+
+    def __cycle_in_component(self, label: str) -> list[str]:
+        """
+        Find the shortest cycle from a variable back to itself inside its strongly connected component.
+        :param label: Label of a variable which is part of a cyclic dependency.
+        :return: Labels along the cycle, starting and ending with the variable.
+        """
+        component = self.__component[label]
+        predecessor = dict()
+        queue = [label]
+        for current in queue:
+            for dep in self.__successors(current):
+                if self.__component[dep] != component:
+                    continue
+                if dep == label:
+                    path = [label]
+                    while current != label:
+                        path.append(current)
+                        current = predecessor[current]
+                    return [label] + path[:0:-1] + [label]
+                if dep not in predecessor:
+                    predecessor[dep] = current
+                    queue.append(dep)
+        raise ValueError(f'{label} is not part of a cyclic dependency')
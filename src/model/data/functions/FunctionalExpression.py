@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import itertools
 import re
 from dataclasses import dataclass
-from functools import lru_cache, cached_property
+from functools import cached_property
 
 from src.model.data.functions.ErrorReport import ErrorReport
 from src.model.data.functions.ErrorReport import StringMarker
 from src.model.data.functions.Interval import Interval
 from src.model.data.functions.GroupMap import GroupMap
+from src.model.data.functions.ColumnTransformer import ColumnTransformer
+from src.model.data.functions.ValidationCache import ValidationCache
+from src.model.data.functions.DependencyGraph import DependencyGraph
+from src.model.data.functions.TypeInference import TypeInference
 from src.config import ConfigExpressionErrors as Config
+from src.config import ConfigCaches
 
 import ast
 
@@ -21,6 +27,8 @@ class FunctionalExpression:
     Attributes:
         expression: Input string being evaluated.
         __DEFAULT_VARIABLES: Additional functionality usable inside expressions.
+        __VALIDATION_CACHE: Error reports and types of already validated expressions.
+        __GLOBALS: Namespace of all evaluations, shared because evaluated expressions can not change it.
     """
     expression: str
 
@@ -45,6 +53,58 @@ class FunctionalExpression:
 
     __BLACKLISTED_SYNTAX = {'while', 'for', 'import'} | __builtins__.keys() - __WHITELISTED_BUILTINS.keys()
 
+    __GLOBALS = {"__builtins__": __WHITELISTED_BUILTINS} | __DEFAULT_VARIABLES
+
+    __VALIDATION_CACHE = ValidationCache(ConfigCaches.VALIDATION_CACHE_SIZE)
+    __MISSING = object()  # placeholder for variables which do not exist
+
+    @staticmethod
+    def clear_validation_cache():
+        """
+        Remove all cached error reports and types. Should be called if a different project is opened.
+        """
+        FunctionalExpression.__VALIDATION_CACHE.clear()
+
+    def __fingerprint(self, variables: dict[str, object], with_values: bool) -> tuple | None:
+        """
+        Describe all variables the expression depends on directly or indirectly through other expressions.
+        Variables the expression does not depend on are not part of the fingerprint.
+        :param variables: All variables usable in the expression.
+        :param with_values: Include values of variables which are not expressions.
+        :return: Hashable fingerprint of the used variables. None if a used value is not hashable.
+        """
+        entries = list()
+        visited = set()
+        pending = list(self.variables)
+        while pending:
+            label = pending.pop()
+            if label in visited:
+                continue
+            visited.add(label)
+
+            value = variables.get(label, FunctionalExpression.__MISSING)
+            if isinstance(value, FunctionalExpression):
+                entries.append((label, 'expression', value.expression))
+                pending.extend(value.variables)
+            elif value is FunctionalExpression.__MISSING:
+                entries.append((label, 'missing'))
+            elif with_values:
+                try:
+                    hash(value)
+                except TypeError:
+                    return None
+                entries.append((label, type(value), value))
+            else:
+                entries.append((label, 'value'))
+        entries.sort(key=lambda entry: entry[0])
+        return tuple(entries)
+
+    def __getstate__(self) -> dict[str, object]:
+        """
+        Only the expression is pickled. Compiled code objects can not be pickled and are compiled again on demand.
+        """
+        return {'expression': self.expression}
+
     @cached_property
     def __compiled(self):
         """
@@ -52,6 +112,50 @@ class FunctionalExpression:
         """
         return compile(self.expression, '<str>', 'eval')
 
+    @cached_property
+    def __compiled_columns(self):
+        """
+        Compile the column-wise counterpart of the expression.
+        :return: Compiled expression or None if the expression can not be evaluated column-wise.
+        """
+        try:
+            return compile(ColumnTransformer().transform(self.expression), '<str>', 'eval')
+        except (SyntaxError, ValueError):
+            return None
+
+    @cached_property
+    def __eval_syntax_tree(self) -> ast.Expression | None:
+        """
+        Parse the expression once for static analysis.
+        :return: Syntax tree of the expression or None if it is not a valid expression.
+        """
+        try:
+            return ast.parse(self.expression, mode='eval')
+        except SyntaxError:
+            return None
+
+    @property
+    def vectorizable(self) -> bool:
+        """
+        :return: True if the expression can be evaluated once on whole columns. Otherwise, False.
+        """
+        return self.__compiled_columns is not None
+
+    def eval_columns(self, **columns):
+        """
+        Evaluate the expression once on whole columns instead of once per row.
+        Should only be called if the expression has been validated beforehand and is vectorizable.
+        :param columns: Columns (pd.Series) or scalar values of the used variables.
+        :return: Resulting column or a scalar value, if the expression does not depend on any column.
+        :raises ValueError: The expression can not be evaluated column-wise.
+        """
+        if not self.vectorizable:
+            raise ValueError(f'expression "{self.expression}" can not be evaluated column-wise')
+
+        used_columns = {var_label: columns[var_label] for var_label in self.variables}
+        return eval(self.__compiled_columns, {"__builtins__": self.__WHITELISTED_BUILTINS},
+                    FunctionalExpression.__DEFAULT_VARIABLES | used_columns | ColumnTransformer.HELPERS)
+
     def eval(self, **variables):
         """
         Evaluate the expression.
@@ -65,8 +169,26 @@ class FunctionalExpression:
                 used_variables[var_label] = variables[var_label]
                 continue
             used_variables[var_label] = variables[var_label].eval(**variables)
-        return eval(self.expression, {"__builtins__": self.__WHITELISTED_BUILTINS},
-                    FunctionalExpression.__DEFAULT_VARIABLES | used_variables)
+        return eval(self.__compiled, FunctionalExpression.__GLOBALS, used_variables)
+
+    def eval_rows(self, length: int, /, **columns) -> list:
+        """
+        Evaluate the expression once per row. The expression is compiled once and a single namespace is reused for
+        all rows, only the values of the used variables are replaced per row.
+        Should only be called if the expression has been validated beforehand.
+        :param length: Number of rows.
+        :param columns: Values of the used variables, one sequence of the given length per variable.
+        :return: Evaluation result of each row.
+        """
+        labels = list(self.variables)
+        code = self.__compiled
+        namespace = dict()
+        rows = zip(*(columns[label] for label in labels)) if labels else itertools.repeat((), length)
+        results = []
+        for values in rows:
+            namespace.update(zip(labels, values))
+            results.append(eval(code, FunctionalExpression.__GLOBALS, namespace))
+        return results
 
     def __get_syntax_tree(self):
         """
@@ -152,9 +274,10 @@ class FunctionalExpression:
                 errors.add(StringMarker(Config.ERROR_BRACKET_NOT_CLOSED, index, index+1, Config.COLOR_HEX))
         return errors
 
-    def __check_variables(self, **variables) -> set[StringMarker]:
+    def __check_variables(self, dependency_graph: DependencyGraph, **variables) -> set[StringMarker]:
         """
         Used for error checking the usage of variables in the expression
+        :param dependency_graph: Dependencies between the variables.
         :param variables: All variables usable in the expression.
         :return: Found variable errors in the expression.
         """
@@ -178,71 +301,50 @@ class FunctionalExpression:
                 found_errors.add(marker)
                 continue
             # search for cyclic dependencies
-            # TODO: fix this messy catch
-            try:  # catch errors
-                cyclic_dependencies = self.__check_cyclic_dependencies(variable.id, **variables)
-                if cyclic_dependencies:
-                    marker = StringMarker(Config.ERROR_CYCLIC_DEPENDENCY.format(cyclic_dependencies[0]), variable.col_offset,
-                                          variable.end_col_offset, Config.COLOR_HEX)
-                    found_errors.add(marker)
-                    continue
-            except (SyntaxError, AttributeError):
-                marker = StringMarker(Config.ERROR_INVALID_VARIABLE.format(variable.id),
-                                      variable.col_offset, variable.end_col_offset, Config.COLOR_HEX)
+            cyclic_dependency = dependency_graph.cycle(variable.id)
+            if cyclic_dependency:
+                marker = StringMarker(Config.ERROR_CYCLIC_DEPENDENCY.format(cyclic_dependency), variable.col_offset,
+                                      variable.end_col_offset, Config.COLOR_HEX)
                 found_errors.add(marker)
                 continue
             # variable is invalid
             # TODO: fix for default variables
             if not hasattr(variables.get(variable.id), 'get_error_report'):
                 continue
-            if not variables.get(variable.id).get_error_report(**variables).valid:
+            if not variables.get(variable.id).get_error_report(dependency_graph, **variables).valid:
                 marker = StringMarker(Config.ERROR_INVALID_VARIABLE.format(variable.id), variable.col_offset,
                                       variable.end_col_offset, Config.COLOR_HEX)
                 found_errors.add(marker)
                 continue
         return found_errors
 
-    @staticmethod
-    def __check_cyclic_dependencies(label, **variables) -> list[list[str]]:
-        """
-        Checks if any cyclic dependencies are present in the expression and its dependencies.
-        :param label: Label of the expression.
-        :param variables: All variables usable in the expression.
-        :return: Found cyclic dependencies.
-        """
-        cycles = list()
-
-        def depth_search(variable_name, path):
-            variable_expr = variables.get(variable_name)
-            # TODO: fix for default variables
-            if not hasattr(variable_expr, 'variables'):
-                return
-            dependencies = variable_expr.variables
-            for dependency in dependencies:
-                # cycle detected
-                if dependency in path:
-                    cycle = path.copy()
-                    cycle.append(dependency)
-                    cycles.append(cycle)
-                    return
-                # recursive step
-                path.append(dependency)
-                depth_search(dependency, path)
-                path.pop()
-
-        depth_search(label, [label])
-        return cycles
-
-    @lru_cache
-    def get_error_report(self, **variables) -> ErrorReport:
+    def get_error_report(self, dependency_graph: DependencyGraph | None = None, /, **variables) -> ErrorReport:
         """
         Construct a report containing all found errors in the expression.
         Any errors make the expression invalid and should prevent execution.
+        Reports are cached until the expression or any variable it depends on changes.
+        :param dependency_graph: Dependencies between the variables, used to find cyclic dependencies.
+        Created from the variables if not given. Variables missing in the graph are treated as independent.
         :param variables: Usable variables in the expression.
         :return: Report containing all found errors.
         """
         variables |= FunctionalExpression.__DEFAULT_VARIABLES
         variables |= FunctionalExpression.__WHITELISTED_BUILTINS
+
+        key = ('error_report', self.expression, self.__fingerprint(variables, False))
+        report = FunctionalExpression.__VALIDATION_CACHE.get(key)
+        if report is None:
+            report = self.__create_error_report(dependency_graph, **variables)
+            FunctionalExpression.__VALIDATION_CACHE.put(key, report)
+        return report
+
+    def __create_error_report(self, dependency_graph: DependencyGraph | None, **variables) -> ErrorReport:
+        """
+        Construct a report containing all found errors in the expression without using the cache.
+        :param dependency_graph: Dependencies between the variables. Created from the variables if None.
+        :param variables: Usable variables in the expression including default variables.
+        :return: Report containing all found errors.
+        """
         found_errors = set()
 
         # check syntax
@@ -253,7 +355,9 @@ class FunctionalExpression:
             return ErrorReport(False, found_errors)
 
         # check used variable names for existence, cyclic dependencies and validity
-        found_errors |= self.__check_variables(**variables)
+        if dependency_graph is None:
+            dependency_graph = DependencyGraph.of(variables)
+        found_errors |= self.__check_variables(dependency_graph, **variables)
 
         if found_errors:
             return ErrorReport(False, found_errors)
@@ -272,15 +376,36 @@ class FunctionalExpression:
         except SyntaxError:
             return set()
 
-    @lru_cache
-    def type(self, **variables) -> type:
+    def static_type(self, types: dict[str, type]) -> type | None:
+        """
+        Infer the result type of the expression from its syntax tree without evaluating it.
+        Should only be called if the expression has been validated beforehand.
+        :param types: Types of the used variables. Variables without a known type are missing.
+        :return: Result type of the expression. None if it can not be inferred without evaluating the expression.
+        """
+        tree = self.__eval_syntax_tree
+        return TypeInference.infer(tree, types) if tree is not None else None
+
+    def type(self, dependency_graph: DependencyGraph | None = None, /, **variables) -> type:
         """
         Returns the result type of the expression.
+        Types are cached until the expression or any variable it depends on changes.
+        :param dependency_graph: Dependencies between the variables, used to find cyclic dependencies.
+        Created from the variables if not given.
         :param variables: All variables usable in the expression.
         :return: Result type of the expression.
         :raises SyntaxError: The expression can not be evaluated.
         """
-        if not self.get_error_report(**variables).valid:
+        if not self.get_error_report(dependency_graph, **variables).valid:
             raise SyntaxError
 
-        return type(self.eval(**variables))
+        fingerprint = self.__fingerprint(variables, True)
+        if fingerprint is None:  # used values are not hashable
+            return type(self.eval(**variables))
+
+        key = ('type', self.expression, fingerprint)
+        result_type = FunctionalExpression.__VALIDATION_CACHE.get(key)
+        if result_type is None:
+            result_type = type(self.eval(**variables))
+            FunctionalExpression.__VALIDATION_CACHE.put(key, result_type)
+        return result_type
@@ -0,0 +1,173 @@
+"""This module contains only one class with the same name."""
+
+from __future__ import annotations
+import ast
+from graphlib import TopologicalSorter
+
+from src.model.data.functions.DependencyGraph import DependencyGraph
+from src.model.data.functions.GroupMap import GroupMap
+from src.model.data.functions.Interval import Interval
+
+
+class TypeInference:
+    """
+    Infers the result type of expressions from their syntax tree and the types of the variables they use, without
+    evaluating them. Covers numeric promotion, text concatenation, comparisons and membership tests, Interval and
+    GroupMap. The type of expressions whose result type depends on the values or which may fail for the types of
+    their operands is not inferred and is None, such expressions have to be evaluated to get their type or error.
+    """
+
+    __NUMERIC = (bool, int, float, complex)  # in the order of numeric promotion
+    __DTYPE_KINDS = {'b': bool, 'i': int, 'u': int, 'f': float, 'c': complex}
+    __ARITHMETIC = (ast.Add, ast.Sub, ast.Mult, ast.FloorDiv, ast.Mod)
+    __BITWISE = (ast.BitAnd, ast.BitOr, ast.BitXor)
+    __ORDERED = (bool, int, float)  # complex numbers have no order
+
+    @staticmethod
+    def of_dtype(dtype: object) -> type | None:
+        """
+        Get the type of the values of a column.
+        :param dtype: Data type of the column.
+        :return: Python type of the values. None if the data type is not numeric or boolean.
+        """
+        return TypeInference.__DTYPE_KINDS.get(getattr(dtype, 'kind', None))
+
+    @staticmethod
+    def infer(tree: ast.Expression, types: dict[str, type]) -> type | None:
+        """
+        Infer the result type of an expression.
+        :param tree: Syntax tree of the expression, parsed in eval mode.
+        :param types: Types of the variables. Variables without a known type are missing.
+        :return: Result type of the expression. None if it can not be inferred without evaluating the expression.
+        """
+        return TypeInference.__infer(tree.body, types)
+
+    @staticmethod
+    def infer_all(expressions: dict[str, object], types: dict[str, type]) -> dict[str, type | None]:
+        """
+        Infer the result types of expressions depending on each other in one sweep in evaluable order.
+        Expressions leading to a cyclic dependency are skipped.
+        :param expressions: Expressions with a static_type method and their variables, keyed by their label.
+        :param types: Types of the variables, which are no expressions.
+        :return: Result type of each expression, None if it can not be inferred without evaluating the expression.
+        """
+        dependency_graph = DependencyGraph.of(expressions)
+        graph = {label: expression.variables & expressions.keys() for label, expression in expressions.items()
+                 if not dependency_graph.leads_to_cycle(label)}
+        known = types.copy()
+        result = dict()
+        for label in TopologicalSorter(graph).static_order():
+            if label not in graph:
+                continue
+            result[label] = expressions[label].static_type(known)
+            if result[label] is None:
+                known.pop(label, None)
+            else:
+                known[label] = result[label]
+        return result
+
+    @staticmethod
+    def __infer(node: ast.AST, types: dict[str, type]) -> type | None:
+        if isinstance(node, ast.Constant):
+            return type(node.value)
+        if isinstance(node, ast.Name):
+            return types.get(node.id)
+        if isinstance(node, ast.Compare):
+            return TypeInference.__infer_compare(node, types)
+        if isinstance(node, ast.UnaryOp):
+            return TypeInference.__infer_unary(node, types)
+        if isinstance(node, ast.BinOp):
+            return TypeInference.__infer_binary(node, types)
+        if isinstance(node, (ast.BoolOp, ast.IfExp)):
+            # the result is one of the operands, its type is only known if all operands have the same type
+            operands = node.values if isinstance(node, ast.BoolOp) else [node.body, node.orelse]
+            operand_types = {TypeInference.__infer(operand, types) for operand in operands}
+            return operand_types.pop() if len(operand_types) == 1 else None
+        if isinstance(node, ast.Call):
+            return TypeInference.__infer_call(node, types)
+        return None
+
+    @staticmethod
+    def __infer_compare(node: ast.Compare, types: dict[str, type]) -> type | None:
+        # a comparison is only known to result in a bool, if no part of it can raise an error for these types
+        left = TypeInference.__infer(node.left, types)
+        for op, comparator in zip(node.ops, node.comparators):
+            right = TypeInference.__infer(comparator, types)
+            if isinstance(op, (ast.Eq, ast.NotEq, ast.Is, ast.IsNot)):
+                pass  # never fails
+            elif isinstance(op, (ast.In, ast.NotIn)):
+                if isinstance(comparator, (ast.List, ast.Tuple)):
+                    pass  # compared for equality only
+                elif right is Interval:
+                    if left not in TypeInference.__ORDERED:
+                        return None
+                elif not (left is str and right is str):
+                    return None
+            elif not ((left in TypeInference.__ORDERED and right in TypeInference.__ORDERED)
+                      or (left is str and right is str)):
+                return None
+            left = right
+        return bool
+
+    @staticmethod
+    def __infer_unary(node: ast.UnaryOp, types: dict[str, type]) -> type | None:
+        if isinstance(node.op, ast.Not):
+            return bool
+        operand = TypeInference.__infer(node.operand, types)
+        if isinstance(node.op, ast.Invert):
+            return int if operand in (bool, int) else None
+        if operand in TypeInference.__NUMERIC:
+            return int if operand is bool else operand
+        return None
+
+    @staticmethod
+    def __infer_binary(node: ast.BinOp, types: dict[str, type]) -> type | None:
+        left = TypeInference.__infer(node.left, types)
+        right = TypeInference.__infer(node.right, types)
+        op = node.op
+        if left in TypeInference.__NUMERIC and right in TypeInference.__NUMERIC:
+            promoted = TypeInference.__NUMERIC[max(TypeInference.__NUMERIC.index(left),
+                                                   TypeInference.__NUMERIC.index(right),
+                                                   TypeInference.__NUMERIC.index(int))]
+            integral = promoted is int
+            divisor = node.right
+            if isinstance(op, (ast.Div, ast.FloorDiv, ast.Mod)) and isinstance(divisor, ast.Constant) \
+                    and divisor.value == 0:
+                return None  # raises a ZeroDivisionError
+            if isinstance(op, ast.Div):
+                return complex if promoted is complex else float
+            if isinstance(op, TypeInference.__ARITHMETIC):
+                return None if promoted is complex and isinstance(op, (ast.FloorDiv, ast.Mod)) else promoted
+            if isinstance(op, ast.Pow):
+                # negative exponents of integers and fractional exponents of negative numbers change the type
+                if integral:
+                    exponent = node.right
+                    return int if isinstance(exponent, ast.Constant) and exponent.value >= 0 else None
+                return float if promoted is float and right in (bool, int) else None
+            if isinstance(op, TypeInference.__BITWISE):
+                return bool if left is bool and right is bool else int if integral else None
+            if isinstance(op, (ast.LShift, ast.RShift)):
+                return int if integral else None
+            return None
+        # formatting with '%' depends on the conversions in the format string, which may not match the values
+        if left is str and isinstance(op, ast.Add) and right is str:
+            return str
+        if isinstance(op, ast.Mult) and {left, right} in ({str, int}, {str, bool}):
+            return str
+        return None
+
+    @staticmethod
+    def __infer_call(node: ast.Call, types: dict[str, type]) -> type | None:
+        if isinstance(node.func, ast.Name):
+            name = node.func.id
+            if name == 'Interval':
+                return Interval
+            if name == 'GroupMap':
+                return GroupMap
+            arguments = [TypeInference.__infer(argument, types) for argument in node.args]
+            if name == 'abs' and len(arguments) == 1 and arguments[0] in TypeInference.__NUMERIC:
+                return {bool: int, complex: float}.get(arguments[0], arguments[0])
+            if name in ('min', 'max') and len(arguments) > 1 and not node.keywords and len(set(arguments)) == 1:
+                return arguments[0]
+        # calling a GroupMap results in the index of the group of the element, or None if no group contains it
+        return None
@@ -0,0 +1,56 @@
+from __future__ import annotations
+from collections import OrderedDict
+from collections.abc import Hashable
+import threading
+
+
+class ValidationCache:
+    """
+    Bounded cache for validation results of expressions. Evicts the least recently used entry if full.
+    Keys should only contain the content the cached result depends on, e.g. the expression text and a fingerprint
+    of the variables it uses, so results stay valid as long as these do not change.
+    Access is thread safe.
+
+    Attributes:
+        max_size: Maximum number of cached entries.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.__entries: OrderedDict[Hashable, object] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key: Hashable, default: object = None) -> object:
+        """
+        Get a cached result and mark it as recently used.
+        :param key: Key of the result.
+        :param default: Returned if no result is cached for the key.
+        :return: Cached result or default.
+        """
+        with self.__lock:
+            if key not in self.__entries:
+                return default
+            self.__entries.move_to_end(key)
+            return self.__entries[key]
+
+    def put(self, key: Hashable, value: object):
+        """
+        Cache a result. Evicts the least recently used results if the maximum size is exceeded.
+        :param key: Key of the result.
+        :param value: Result to be cached.
+        """
+        with self.__lock:
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Remove all cached results.
+        """
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
@@ -0,0 +1,71 @@
+"""This module contains only one class with the same name."""
+
+from __future__ import annotations
+from collections import OrderedDict
+import threading
+import weakref
+
+
+class DatabaseCache:
+    """
+    Bounded cache for prepared calculation databases, keyed by the identity of the Data object they are built from.
+    Data objects are immutable, so a database stays valid as long as its Data object exists. Entries are removed as
+    soon as their Data object is garbage collected, and the least recently used entry is evicted if the cache is full.
+    Access is thread safe.
+
+    Attributes:
+        max_size: Maximum number of cached databases.
+        :type max_size: int
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.__entries: OrderedDict[int, tuple[weakref.ref, object]] = OrderedDict()
+        self.__lock = threading.RLock()  # reentrant, the garbage collector may remove entries while the lock is held
+
+    def get(self, data: object) -> object | None:
+        """
+        Get the cached database of a Data object and mark it as recently used.
+        :param data: Data object the database has been built from.
+        :type data: Data
+        :return: Cached database or None.
+        :rtype: object | None
+        """
+        with self.__lock:
+            entry = self.__entries.get(id(data))
+            if entry is None or entry[0]() is not data:
+                return None
+            self.__entries.move_to_end(id(data))
+            return entry[1]
+
+    def put(self, data: object, database: object):
+        """
+        Cache the database of a Data object. Evicts the least recently used databases if the maximum size is exceeded.
+        :param data: Data object the database has been built from.
+        :type data: Data
+        :param database: Database to be cached.
+        :type database: object
+        """
+        key = id(data)
+        reference = weakref.ref(data, lambda ref: self.__remove(key, ref))
+        with self.__lock:
+            self.__entries[key] = (reference, database)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def __remove(self, key: int, reference: weakref.ref):
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[0] is reference:
+                del self.__entries[key]
+
+    def clear(self):
+        """
+        Remove all cached databases.
+        """
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
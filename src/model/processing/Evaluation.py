@@ -3,6 +3,9 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
+import math
+
+from src.config import ConfigProcessing
 
 if TYPE_CHECKING:  # prevent circular imports but allow type hints
     from src.model.data.Model import Model
@@ -21,10 +24,76 @@ class Evaluation:
         :type result: pd.DataFrame
         optimizer: optional visitor given by calculation library, if the model can be optimized through this result
         :type optimizer: Optimizer
+        iterations: optional number of optimizer iterations of all estimations of this evaluation
+        :type iterations: int
+        saved_iterations: optional number of iterations saved by starting from the values of a previous evaluation
+        :type saved_iterations: int
     """
 
     result: pd.DataFrame
     optimizer: Optimizer = None
+    iterations: int = None
+    saved_iterations: int = None
+
+    @property
+    def estimations(self) -> int:
+        """
+        :return: Number of single estimations this evaluation consists of.
+        :rtype: int
+        """
+        if isinstance(self.result.columns, pd.MultiIndex):
+            return len(self.result.columns.unique(level=0))
+        return 1
+
+    def component(self, index: object) -> Evaluation | None:
+        """
+        Returns the evaluation of a single estimation, if this evaluation consists of multiple ones.
+        The iterations are distributed equally over all single estimations.
+        :param index: Key of the single estimation.
+        :type index: object
+        :return: Evaluation of the single estimation or None, if it does not exist.
+        If this evaluation only consists of one estimation, it is returned itself.
+        :rtype: Evaluation | None
+        """
+        if not isinstance(self.result.columns, pd.MultiIndex):
+            return self
+        if index not in self.result.columns.unique(level=0):
+            return None
+
+        def __share(count: int | None) -> int | None:
+            return round(count / self.estimations) if count is not None else None
+
+        return Evaluation(self.result[index], iterations=__share(self.iterations),
+                          saved_iterations=__share(self.saved_iterations))
+
+    def start_values(self) -> dict[str, float]:
+        """
+        Returns the estimated parameter values, so they can be used as starting values of a further estimation.
+        If this evaluation consists of multiple estimations, the values of the first one are returned.
+        :return: Estimated value of each parameter. Empty if the result does not contain estimated values.
+        :rtype: dict[str, float]
+        """
+        if isinstance(self.result.columns, pd.MultiIndex):
+            components = self.result.columns.unique(level=0)
+            return self.component(components[0]).start_values() if len(components) > 0 else {}
+        if ConfigProcessing.VALUE_COLUMN not in self.result.columns:
+            return {}
+        values = pd.to_numeric(self.result[ConfigProcessing.VALUE_COLUMN], errors='coerce')
+        return {str(label): float(value) for label, value in values.items() if math.isfinite(value)}
+
+    def saved_iterations_by(self, iterations: int) -> int | None:
+        """
+        Estimates, how many iterations a single estimation saved by starting from the values of this evaluation.
+        The number of iterations this evaluation would have needed without a warm start is used as reference.
+        :param iterations: Number of iterations of the estimation started from the values of this evaluation.
+        :type iterations: int
+        :return: Number of saved iterations or None, if this evaluation has no information about its iterations.
+        :rtype: int | None
+        """
+        if self.iterations is None:
+            return None
+        reference = (self.iterations + (self.saved_iterations or 0)) / self.estimations
+        return max(round(reference) - iterations, 0)
 
     def optimize(self, model: Model) -> Model:
         """
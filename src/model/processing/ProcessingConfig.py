@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 from dataclasses import dataclass, field
+from typing import Callable
 
 from src.model.data.Model import Model
 from src.model.data.functions.FunctionalExpression import FunctionalExpression
@@ -22,14 +23,22 @@ class ProcessingConfig:
 
     settings: dict[str, FunctionalExpression] = field(default_factory=dict)
 
-    def process(self, model: Model) -> Evaluation:
+    def process(self, model: Model, warm_start: Evaluation = None, progress: Callable[[int, int], None] = None,
+                cancelled: Callable[[], bool] = None) -> Evaluation:
         """
         Executes the calculation of the implemented calculation algorithm.
         :param model: Model the calculation should be calculated on
         :type model: Model
+        :param warm_start: Previous evaluation whose results are used as starting point of the calculation.
+        :type warm_start: Evaluation
+        :param progress: Called with the number of finished and the number of all estimations after each estimation.
+        :type progress: Callable[[int, int], None]
+        :param cancelled: Polled between the estimations, the calculation stops as soon as it returns True.
+        :type cancelled: Callable[[], bool]
         :return: Evaluation of the algorithm.
         :rtype: Evaluation
         :raises ValueError: Model does not fulfill the required conditions.
+        :raises CancelledError: Calculation has been cancelled.
         """
         raise NotImplementedError
 
@@ -42,6 +51,17 @@ class ProcessingConfig:
         """
         raise NotImplementedError
 
+    def set_max_workers(self, max_workers: int) -> ProcessingConfig:
+        """
+        Setter for the maximum number of processes calculating estimations in parallel.
+        Configurations calculating a single estimation ignore it.
+        :param max_workers: New maximum number of processes, at least 1.
+        :type max_workers: int
+        :return: Copy of configuration object with new maximum number of processes.
+        :rtype: ProcessingConfig
+        """
+        return self
+
     def set_settings(self, settings: dict[str, FunctionalExpression]) -> ProcessingConfig:
         """
         Setter for configuration settings for process.
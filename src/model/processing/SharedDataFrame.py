@@ -0,0 +1,140 @@
+"""This module contains only one class with the same name."""
+
+from __future__ import annotations
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pandas as pd
+
+
+class SharedDataFrame:
+    """
+    A DataFrame published once into shared memory, so other processes can read it without receiving a copy. Only the
+    description of the memory block is pickled, an unpickled object attaches to the same block.
+    The creating process owns the block and has to unlink it when it is not needed anymore. This can be done by using
+    the object as a context manager.
+
+    Attributes:
+        name: Name of the shared memory block.
+        :type name: str
+        length: Number of rows.
+        :type length: int
+        columns: Label, data type and byte offset of each shared column, in the order of the DataFrame.
+        :type columns: list[tuple[object, str, int]]
+        index: Range of a range index, or data type and byte offset of the shared index values.
+        :type index: range | tuple[str, int]
+        index_name: Name of the index.
+        :type index_name: object
+    """
+
+    __ALIGNMENT = 8
+    __SHAREABLE_KINDS = 'biufcmM'  # fixed size numpy data types
+
+    @staticmethod
+    def is_shareable(frame: pd.DataFrame) -> bool:
+        """
+        Checks whether all columns and the index of a DataFrame can be shared. Columns and indices with an extension
+        data type, like categories, or with Python objects can not be shared.
+        :param frame: DataFrame which should be shared.
+        :type frame: pd.DataFrame
+        :return: Truth value, whether the DataFrame can be shared.
+        :rtype: bool
+        """
+        return (isinstance(frame.index, pd.RangeIndex) or SharedDataFrame.__is_shareable_dtype(frame.index.dtype)) \
+            and all(SharedDataFrame.__is_shareable_dtype(dtype) for dtype in frame.dtypes)
+
+    @staticmethod
+    def __is_shareable_dtype(dtype: object) -> bool:
+        return isinstance(dtype, np.dtype) and dtype.kind in SharedDataFrame.__SHAREABLE_KINDS
+
+    def __init__(self, frame: pd.DataFrame):
+        """
+        Copies all columns and the index of a DataFrame into a new shared memory block.
+        :param frame: DataFrame which should be shared.
+        :type frame: pd.DataFrame
+        :raises TypeError: A column or the index can not be shared, see is_shareable.
+        """
+        if not SharedDataFrame.is_shareable(frame):
+            raise TypeError('only columns and indices with a fixed size numpy data type can be shared')
+        arrays = [column.to_numpy() for _, column in frame.items()]
+        if not isinstance(frame.index, pd.RangeIndex):
+            arrays.append(frame.index.to_numpy())
+
+        self.length = len(frame)
+        offsets = []
+        size = 0
+        for values in arrays:
+            offsets.append(size)
+            size += -(-values.nbytes // SharedDataFrame.__ALIGNMENT) * SharedDataFrame.__ALIGNMENT
+        self.columns = [(label, values.dtype.str, offset)
+                        for label, values, offset in zip(frame.columns, arrays, offsets)]
+        if isinstance(frame.index, pd.RangeIndex):
+            self.index = range(frame.index.start, frame.index.stop, frame.index.step)
+        else:
+            self.index = (arrays[-1].dtype.str, offsets[-1])
+        self.index_name = frame.index.name
+
+        self.__memory = SharedMemory(create=True, size=max(size, 1))
+        self.__owned_memory = self.__memory
+        self.name = self.__memory.name
+        self.__frame = None
+        for values, offset in zip(arrays, offsets):
+            shared = np.ndarray(self.length, dtype=values.dtype, buffer=self.__memory.buf, offset=offset)
+            shared[:] = values
+            del shared  # the memory block can only be closed, if no array uses it anymore
+
+    def __getstate__(self) -> dict[str, object]:
+        return {'name': self.name, 'length': self.length, 'columns': self.columns, 'index': self.index,
+                'index_name': self.index_name}
+
+    def __setstate__(self, state: dict[str, object]):
+        self.__dict__.update(state)
+        self.__memory = None
+        self.__owned_memory = None
+        self.__frame = None
+
+    def __enter__(self) -> SharedDataFrame:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        self.unlink()
+
+    def attach(self) -> pd.DataFrame:
+        """
+        Creates a DataFrame whose columns are views on the shared memory block. No data is copied.
+        The DataFrame must not be modified and must not be used after close is called.
+        :return: DataFrame of the shared columns.
+        :rtype: pd.DataFrame
+        """
+        if self.__frame is None:
+            if self.__memory is None:
+                self.__memory = SharedMemory(name=self.name)
+            columns = [np.ndarray(self.length, dtype=dtype, buffer=self.__memory.buf, offset=offset)
+                       for _, dtype, offset in self.columns]
+            if isinstance(self.index, range):
+                index = pd.RangeIndex(self.index.start, self.index.stop, self.index.step, name=self.index_name)
+            else:
+                dtype, offset = self.index
+                index = pd.Index(np.ndarray(self.length, dtype=dtype, buffer=self.__memory.buf, offset=offset),
+                                 name=self.index_name, copy=False)
+            self.__frame = pd.DataFrame(dict(enumerate(columns)), index=index, copy=False)
+            self.__frame.columns = pd.Index([label for label, _, _ in self.columns])
+        return self.__frame
+
+    def close(self):
+        """
+        Releases the memory block in this process. DataFrames created by attach must not be used anymore.
+        """
+        self.__frame = None
+        if self.__memory is not None:
+            self.__memory.close()
+            self.__memory = None
+
+    def unlink(self):
+        """
+        Frees the memory block for all processes. Only done by the process which created the block.
+        """
+        if self.__owned_memory is not None:
+            self.__owned_memory.unlink()
+            self.__owned_memory = None
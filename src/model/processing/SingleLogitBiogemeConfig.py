@@ -1,14 +1,20 @@
 """This module contains only one class with the same name."""
 
 from __future__ import annotations
+from concurrent.futures import CancelledError
 from dataclasses import dataclass
 from graphlib import TopologicalSorter
 import functools
+from typing import Callable
 
+from src.config import ConfigCaches, ConfigProcessing
 from src.model.data.Model import Model
 from src.model.data.functions.FunctionalExpression import FunctionalExpression
 from src.model.processing.ProcessingConfig import ProcessingConfig
 from src.model.processing.Evaluation import Evaluation
+from src.model.processing.DatabaseCache import DatabaseCache
+
+import pandas as pd
 
 
 @dataclass(frozen=True)
@@ -18,23 +24,51 @@ class SingleLogitBiogemeConfig(ProcessingConfig):
     """
 
     __DISPLAY_NAME = 'Logit Parameter Estimation (Biogeme)'
+    __DATABASES = DatabaseCache(ConfigCaches.DATABASE_CACHE_SIZE)
 
-    def process(self, model: Model) -> Evaluation:
+    def process(self, model: Model, warm_start: Evaluation = None, progress: Callable[[int, int], None] = None,
+                cancelled: Callable[[], bool] = None, estimation_data: pd.DataFrame = None) -> Evaluation:
+        """
+        Executes the calculation of the implemented calculation algorithm.
+        :param model: Model the calculation should be calculated on
+        :type model: Model
+        :param warm_start: Previous evaluation whose estimated values are used as starting values.
+        :type warm_start: Evaluation
+        :param progress: Called with one of one estimations finished after the estimation.
+        :type progress: Callable[[int, int], None]
+        :param cancelled: Polled before the estimation starts, a running estimation can not be stopped.
+        :type cancelled: Callable[[], bool]
+        :param estimation_data: Columns of the data of the model the estimation is based on. Calculated from the model,
+        if not given.
+        :type estimation_data: pd.DataFrame
+        :return: Evaluation of the algorithm.
+        :rtype: Evaluation
+        :raises ValueError: Model does not fulfill the required conditions.
+        :raises CancelledError: Calculation has been cancelled before the estimation started.
+        """
         from biogeme.database import Database
         from biogeme.biogeme import BIOGEME
         from biogeme.models import logit
         from biogeme.expressions import Beta
 
-        # load raw data into biogeme database
-        db = Database('biogeme_model_db',
-                      model.data.complete_data.select_dtypes(exclude=['object']).dropna(axis=1, how='any'))
+        # load the used columns into biogeme database, which is reused as long as the data does not change and the
+        # model uses no other variables
+        cached = SingleLogitBiogemeConfig.__DATABASES.get(model.data)
+        if cached is not None and model.used_variables <= cached[1]:
+            db = cached[0]
+        else:
+            if estimation_data is None:
+                estimation_data = SingleLogitBiogemeConfig.estimation_data(model)
+            db = Database('biogeme_model_db', estimation_data)
+            SingleLogitBiogemeConfig.__DATABASES.put(model.data, (db, frozenset(model.used_variables)))
 
         alt_depends = {label: alt.function.variables for label, alt in model.alternatives.items()}
 
         # define beta variables in biogeme database
         # undefined labels in alternatives are interpreted as beta variables
         beta_labels = functools.reduce(lambda a, b: a | b, alt_depends.values(), set()) - db.variables.keys()
-        betas = {label: Beta(label, 0, None, None, 0) for label in beta_labels}
+        start_values = warm_start.start_values() if warm_start is not None else {}
+        betas = {label: Beta(label, start_values.get(label, 0), None, None, 0) for label in beta_labels}
 
         # define alternatives in topological order to consider dependencies
         alts = {}
@@ -68,8 +102,39 @@ class SingleLogitBiogemeConfig(ProcessingConfig):
         bio_model = BIOGEME(db, prop)
         bio_model.generate_html, bio_model.generate_pickle = False, False  # disable generating result files
         bio_model.modelName = 'biogeme_model'  # set model name to prevent warning from biogeme
+        # starting values are only given by the warm start, not by an iterations file of a previous estimation
+        bio_model.save_iterations = False
+        if cancelled is not None and cancelled():
+            raise CancelledError
         bio_result = bio_model.estimate()
-        return Evaluation(bio_result.getEstimatedParameters())
+        if progress is not None:
+            progress(1, 1)
+
+        iterations = bio_result.data.optimizationMessages.get(ConfigProcessing.ITERATIONS_MESSAGE)
+        iterations = int(iterations) if iterations is not None else None
+        saved_iterations = warm_start.saved_iterations_by(iterations) \
+            if start_values and iterations is not None else None
+        return Evaluation(bio_result.getEstimatedParameters(), iterations=iterations,
+                          saved_iterations=saved_iterations)
+
+    @staticmethod
+    def clear_database_cache():
+        """
+        Remove all cached biogeme databases.
+        """
+        SingleLogitBiogemeConfig.__DATABASES.clear()
+
+    @staticmethod
+    def estimation_data(model: Model) -> pd.DataFrame:
+        """
+        Returns the columns the estimation is based on: all non-object columns used by the model without missing
+        values. Derivatives the model does not use are not calculated.
+        :param model: Model the calculation should be calculated on
+        :type model: Model
+        :return: Columns of the biogeme database.
+        :rtype: pd.DataFrame
+        """
+        return model.get_used_data().select_dtypes(exclude=['object']).dropna(axis=1, how='any')
 
     @property
     def display_name(self) -> str:
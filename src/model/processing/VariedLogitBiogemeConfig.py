@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import gc
 import itertools
-from dataclasses import dataclass
-from typing import Iterable
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
 
+from src.config import ConfigProcessing
+from src.model.data.Data import Data
 from src.model.data.Model import Model
 from src.model.data.functions.FunctionalExpression import FunctionalExpression
 from src.model.processing.ProcessingConfig import ProcessingConfig
 from src.model.processing.SingleLogitBiogemeConfig import SingleLogitBiogemeConfig
 from src.model.processing.Evaluation import Evaluation
+from src.model.processing.SharedDataFrame import SharedDataFrame
 
 from functools import cached_property
 import pandas as pd
@@ -22,16 +31,184 @@ class VariedLogitBiogemeConfig(ProcessingConfig):
     Implements a calculation of a varied discrete choice parameter estimation with logit function using biogeme.
     The varied parameter estimation consists of multiple single parameter estimations
     (see class SimpleProcessingConfig).
+
+    Attributes:
+        max_workers: Maximum number of processes estimating the single parameter estimations in parallel.
+        With at most one worker, all estimations are calculated one after another in the current process.
+        :type max_workers: int
     """
 
+    max_workers: int = field(default=ConfigProcessing.MAX_WORKERS, compare=False)
+
     __DISPLAY_NAME = 'Varied Logit Parameter Estimation (Biogeme)'
 
-    def process(self, model: Model) -> Evaluation:
-        single_result_gen = map(lambda c: c.process(model).result, self.components)  # single result generator
+    # state of a worker process, set once by the initializer of the process pool
+    __worker_model = None
+    __worker_data = None
+    __worker_directory = None
+
+    def process(self, model: Model, warm_start: Evaluation = None, progress: Callable[[int, int], None] = None,
+                cancelled: Callable[[], bool] = None) -> Evaluation:
+        progress = progress if progress is not None else lambda finished, total: None
+        cancelled = cancelled if cancelled is not None else lambda: False
+        workers = min(self.max_workers, len(self.components))
+        estimation_data = SingleLogitBiogemeConfig.estimation_data(model) if workers > 1 else None
+        if workers <= 1 or not SharedDataFrame.is_shareable(estimation_data):
+            # columns which can not be shared are only estimated in the current process
+            single_evaluations = self.__process_serial(model, warm_start, progress, cancelled)
+        else:
+            single_evaluations = self.__process_parallel(model, estimation_data, warm_start, workers, progress,
+                                                         cancelled)
 
         # concat all single results to one DataFrame
-        result = pd.concat(single_result_gen, axis=1, keys=range(len(self.components)))
-        return Evaluation(result)
+        result = pd.concat([e.result for e in single_evaluations], axis=1, keys=range(len(self.components)))
+        iterations = [e.iterations for e in single_evaluations]
+        saved_iterations = [e.saved_iterations for e in single_evaluations if e.saved_iterations is not None]
+        return Evaluation(result, iterations=sum(iterations) if None not in iterations else None,
+                          saved_iterations=sum(saved_iterations) if saved_iterations else None)
+
+    def __process_serial(self, model: Model, warm_start: Evaluation | None, progress: Callable[[int, int], None],
+                         cancelled: Callable[[], bool]) -> list[Evaluation]:
+        """
+        Calculates the single parameter estimations one after another in the current process.
+        With a warm start, each estimation starts from the values of the same estimation of the previous evaluation.
+        If these do not exist, it starts from the values of the neighbouring estimation calculated before.
+        :param model: Model the calculation should be calculated on
+        :type model: Model
+        :param warm_start: Previous evaluation or None for a cold start.
+        :type warm_start: Evaluation | None
+        :param progress: Called after each finished estimation.
+        :type progress: Callable[[int, int], None]
+        :param cancelled: Polled before each estimation.
+        :type cancelled: Callable[[], bool]
+        :return: Evaluations of the single parameter estimations in the order of the components.
+        :rtype: list[Evaluation]
+        :raises CancelledError: Calculation has been cancelled.
+        """
+        evaluations = []
+        for start in self.__start_evaluations(warm_start):
+            if cancelled():
+                raise CancelledError
+            if warm_start is not None and (start is None or not start.start_values()) and evaluations:
+                start = evaluations[-1]
+            evaluations.append(self.components[len(evaluations)].process(model, start))
+            progress(len(evaluations), len(self.components))
+        return evaluations
+
+    def __start_evaluations(self, warm_start: Evaluation | None) -> list[Evaluation | None]:
+        """
+        :param warm_start: Previous evaluation or None for a cold start.
+        :type warm_start: Evaluation | None
+        :return: For each component the evaluation of the same estimation in the previous evaluation, if it exists.
+        :rtype: list[Evaluation | None]
+        """
+        if warm_start is None:
+            return [None] * len(self.components)
+        return [warm_start.component(idx) for idx in range(len(self.components))]
+
+    def __process_parallel(self, model: Model, estimation_data: pd.DataFrame, warm_start: Evaluation | None,
+                           workers: int, progress: Callable[[int, int], None],
+                           cancelled: Callable[[], bool]) -> list[Evaluation]:
+        """
+        Calculates the single parameter estimations in a pool of worker processes.
+        The estimation data is published once into shared memory, from which all workers read it without copying.
+        Each worker receives the model without any data once, only the single configurations are transferred per
+        estimation. The shared memory is freed when the calculation is finished or has failed.
+        With a warm start, each estimation starts from the values of the same estimation of the previous evaluation.
+        :param model: Model the calculation should be calculated on
+        :type model: Model
+        :param estimation_data: Estimation data of the model, which has to be shareable.
+        :type estimation_data: pd.DataFrame
+        :param warm_start: Previous evaluation or None for a cold start.
+        :type warm_start: Evaluation | None
+        :param workers: Number of worker processes.
+        :type workers: int
+        :param progress: Called after each finished estimation.
+        :type progress: Callable[[int, int], None]
+        :param cancelled: Polled after each finished estimation. Pending estimations are not started anymore after a
+        cancellation or a failed estimation, running estimations are finished before the shared memory is freed.
+        :type cancelled: Callable[[], bool]
+        :return: Evaluations of the single parameter estimations in the order of the components.
+        :rtype: list[Evaluation]
+        :raises CancelledError: Calculation has been cancelled.
+        """
+        data = model.data
+        model_without_data = Model(Data(pd.DataFrame(), data.raw_data_path, data.derivatives), model.alternatives,
+                                   model.choice)
+        context = multiprocessing.get_context(ConfigProcessing.WORKER_START_METHOD)
+        with SharedDataFrame(estimation_data) as shared_data:
+            with ProcessPoolExecutor(workers, mp_context=context,
+                                     initializer=VariedLogitBiogemeConfig._initialize_worker,
+                                     initargs=(model_without_data, shared_data, os.getcwd())) as executor:
+                evaluations = []
+                try:
+                    for evaluation in executor.map(VariedLogitBiogemeConfig._process_component, self.components,
+                                                   self.__start_evaluations(warm_start)):
+                        evaluations.append(evaluation)
+                        progress(len(evaluations), len(self.components))
+                        if cancelled() and len(evaluations) < len(self.components):
+                            raise CancelledError
+                except BaseException:
+                    # pending estimations are not started after a failure or cancellation, only running ones are
+                    # awaited when leaving the pool
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+                return evaluations
+
+    # The following functions are called by the worker processes and have to be picklable by their qualified name,
+    # so they can not be name mangled.
+
+    @staticmethod
+    def _initialize_worker(model: Model, shared_data: SharedDataFrame, working_directory: str):
+        """
+        Stores the model and attaches to the shared estimation data in the worker process.
+        Each worker runs in a temporary working directory, so the files biogeme writes during estimation are not
+        shared between parallel estimations.
+        :param model: Model the calculation should be calculated on, without data.
+        :type model: Model
+        :param shared_data: Estimation data in shared memory.
+        :type shared_data: SharedDataFrame
+        :param working_directory: Working directory of the process which created the worker.
+        :type working_directory: str
+        """
+        VariedLogitBiogemeConfig.__worker_model = model
+        VariedLogitBiogemeConfig.__worker_data = shared_data
+        shared_data.attach()
+        multiprocessing.util.Finalize(shared_data, VariedLogitBiogemeConfig.__finalize_worker,
+                                      args=(working_directory,), exitpriority=10)
+        VariedLogitBiogemeConfig.__worker_directory = tempfile.TemporaryDirectory()
+        parameter_file = os.path.join(working_directory, ConfigProcessing.BIOGEME_PARAMETER_FILE)
+        if os.path.isfile(parameter_file):
+            shutil.copy(parameter_file, VariedLogitBiogemeConfig.__worker_directory.name)
+        os.chdir(VariedLogitBiogemeConfig.__worker_directory.name)
+
+    @staticmethod
+    def __finalize_worker(working_directory: str):
+        """
+        Releases the shared estimation data and removes the temporary working directory when the worker process
+        exits. The cached database uses the shared memory and has to be removed beforehand.
+        :param working_directory: Working directory of the process which created the worker.
+        :type working_directory: str
+        """
+        SingleLogitBiogemeConfig.clear_database_cache()
+        gc.collect()
+        VariedLogitBiogemeConfig.__worker_data.close()
+        os.chdir(working_directory)  # the current directory can not be removed on every platform
+        VariedLogitBiogemeConfig.__worker_directory.cleanup()
+
+    @staticmethod
+    def _process_component(component: SingleLogitBiogemeConfig, warm_start: Evaluation | None) -> Evaluation:
+        """
+        Calculates a single parameter estimation on the model and the shared data of the worker process.
+        :param component: Single parameter estimation configuration.
+        :type component: SingleLogitBiogemeConfig
+        :param warm_start: Evaluation whose values are used as starting values or None for a cold start.
+        :type warm_start: Evaluation | None
+        :return: Evaluation of the single parameter estimation.
+        :rtype: Evaluation
+        """
+        return component.process(VariedLogitBiogemeConfig.__worker_model, warm_start,
+                                 estimation_data=VariedLogitBiogemeConfig.__worker_data.attach())
 
     @cached_property
     def components(self) -> list[SingleLogitBiogemeConfig]:
@@ -53,5 +230,8 @@ class VariedLogitBiogemeConfig(ProcessingConfig):
     def display_name(self) -> str:
         return VariedLogitBiogemeConfig.__DISPLAY_NAME
 
+    def set_max_workers(self, max_workers: int) -> VariedLogitBiogemeConfig:
+        return VariedLogitBiogemeConfig(self.settings, max_workers)
+
     def set_settings(self, settings: dict[str, FunctionalExpression]) -> VariedLogitBiogemeConfig:
-        return VariedLogitBiogemeConfig(settings)
+        return VariedLogitBiogemeConfig(settings, self.max_workers)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from src.benchmark.Benchmark import Benchmark
+from src.benchmark.DatasetGenerator import DatasetGenerator
+from src.config import ConfigBenchmark as Cfg
+from src.model.ProjectSnapshot import ProjectSnapshot
+from src.model.data.Data import Data
+from src.model.data.Model import Model
+
+import unittest
+from parameterized import parameterized
+
+
+class TestBenchmark(unittest.TestCase):
+    @parameterized.expand([
+        ('single_alternative', 50, 1, 1),
+        ('swissmetro_alternatives', 100, 3, 2),
+        ('many_alternatives', 20, 5, 3),
+    ])
+    def test_generated_model(self, name: str, rows: int, alternatives: int, depth: int):
+        generator = DatasetGenerator()
+        raw_data = generator.raw_data(rows, alternatives)
+        self.assertEqual(len(raw_data), rows)
+        self.assertEqual(raw_data.equals(DatasetGenerator().raw_data(rows, alternatives)), True)
+        self.assertEqual(set(raw_data['CHOICE'].unique()) <= set(range(1, alternatives + 1)), True)
+
+        model = Model(Data(raw_data, None, DatasetGenerator.derivatives(alternatives, depth)),
+                      DatasetGenerator.alternatives(alternatives, depth), DatasetGenerator.choice())
+        self.assertEqual(len(model.data.derivatives), 2 * alternatives * depth)
+        self.assertEqual(model.data.complete_data.isna().any().any(), False)
+        snapshot = ProjectSnapshot(model=model)
+        for label in snapshot.get_derivatives():
+            self.assertEqual(snapshot.get_derivative_error_report(label).valid, True)
+        for label in snapshot.get_alternatives():
+            self.assertEqual(snapshot.get_alternative_error_report(label).valid, True)
+            self.assertEqual(snapshot.get_availability_condition_error_report(label).valid, True)
+        self.assertEqual(snapshot.get_choice_error_report().valid, True)
+
+    def test_run(self):
+        results = Benchmark(DatasetGenerator(), repeat=2).run(20, 2, 2, estimate=False)
+        self.assertEqual([result['stage'] for result in results],
+                         [Cfg.STAGE_VALIDATION, Cfg.STAGE_COMPLETE_DATA, Cfg.STAGE_INCREMENTAL_COMPLETE_DATA,
+                          Cfg.STAGE_ROW_WISE, Cfg.STAGE_ROW_WISE_APPLY, Cfg.STAGE_SAVE, Cfg.STAGE_OPEN,
+                          Cfg.STAGE_SAVE_PACKED, Cfg.STAGE_OPEN_PACKED])
+        for result in results:
+            self.assertEqual(len(result['seconds']), 2)
+            self.assertEqual(result['min'] <= result['median'], True)
+
+
+if __name__ == '__main__':
+    unittest.main()
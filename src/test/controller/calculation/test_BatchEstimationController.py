@@ -0,0 +1,90 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from src.config import ConfigBatchEstimation as Cfg, ConfigProjectManager
+from src.controller.ProjectManager import ProjectManager
+from src.controller.calculation.BatchEstimationController import BatchEstimationController
+from src.model.data.Alternative import Alternative
+from src.model.data.functions.FunctionalExpression import FunctionalExpression
+from src.model.processing.VariedLogitBiogemeConfig import VariedLogitBiogemeConfig
+
+
+class TestBatchEstimationController(unittest.TestCase):
+    __RAW_DATA = f'{os.path.dirname(__file__)}/../../resources/swissmetro.csv'
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.project_path = os.path.join(self.directory.name, 'project')
+        self.controller = BatchEstimationController()
+
+        raw_data = pd.read_csv(TestBatchEstimationController.__RAW_DATA, sep='\t')
+        raw_data = raw_data[raw_data['CHOICE'] != 0].head(2000)
+        raw_data_path = os.path.join(self.directory.name, 'raw_data.csv')
+        raw_data.to_csv(raw_data_path, sep=';', index=False)
+
+        project_manager = ProjectManager()
+        project_manager.new()
+        project_manager.import_raw_data(raw_data_path)
+        project = project_manager.get_project()
+        project.set_derivatives(TRAIN_TT_SCALED=FunctionalExpression('TRAIN_TT / 100'),
+                                CAR_TT_SCALED=FunctionalExpression('CAR_TT / 100'),
+                                SM_TT_SCALED=FunctionalExpression('SM_TT / 100'))
+        project.set_alternatives(
+            train=Alternative(FunctionalExpression('ASC_TRAIN + B_TIME * TRAIN_TT_SCALED'),
+                              FunctionalExpression('TRAIN_AV'), 1),
+            sm=Alternative(FunctionalExpression('B_TIME * SM_TT_SCALED'), FunctionalExpression('SM_AV'), 2),
+            car=Alternative(FunctionalExpression('ASC_CAR + B_TIME * CAR_TT_SCALED'),
+                            FunctionalExpression('CAR_AV'), 3))
+        project.set_choice(FunctionalExpression('CHOICE'))
+        project_manager.save(self.project_path)
+        project_manager.new()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_run(self):
+        timings = self.controller.run(self.project_path)
+
+        self.assertListEqual(list(timings.keys()), [Cfg.PHASE_DATA_LOAD, Cfg.PHASE_DERIVATIVES, Cfg.PHASE_ESTIMATION,
+                                                     Cfg.PHASE_EXPORT])
+        evaluation = pd.read_csv(os.path.join(self.project_path, ConfigProjectManager.EVALUATION), sep=';',
+                                 index_col=0)
+        self.assertSetEqual(set(evaluation.index), {'ASC_TRAIN', 'ASC_CAR', 'B_TIME'})
+
+    def test_run_workers(self):
+        with patch.object(VariedLogitBiogemeConfig, 'process', autospec=True,
+                          side_effect=VariedLogitBiogemeConfig.process) as process:
+            self.controller.run(self.project_path, config_index=1, workers=1)
+        self.assertEqual(process.call_args.args[0].max_workers, 1)
+
+    def test_no_gui_dependency(self):
+        command = 'import sys, src.controller.calculation.BatchEstimationController; print("PyQt5" in sys.modules)'
+        result = subprocess.run([sys.executable, '-c', command], capture_output=True, text=True, check=True,
+                                cwd=f'{os.path.dirname(__file__)}/../../../..')
+        self.assertEqual(result.stdout.strip(), 'False')
+
+    def test_run_output_path(self):
+        output_path = os.path.join(self.directory.name, 'result.csv')
+        self.controller.run(self.project_path, output_path, 0)
+
+        self.assertEqual(os.path.isfile(output_path), True)
+        self.assertEqual(os.path.isfile(os.path.join(self.project_path, ConfigProjectManager.EVALUATION)), False)
+
+    def test_run_missing_project(self):
+        with self.assertRaises(FileNotFoundError):
+            self.controller.run(os.path.join(self.directory.name, 'missing'))
+
+    def test_run_missing_raw_data(self):
+        os.remove(os.path.join(self.directory.name, 'raw_data.csv'))
+        with self.assertRaises(FileNotFoundError):
+            self.controller.run(self.project_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -36,7 +36,7 @@ class TestAbstractController(unittest.TestCase):
 
         c.save()
 
-        c._AbstractController__saving_thread.join()
+        ProjectManager().flush_saving_process()
 
         self.assertTrue(os.path.isdir(target))
 
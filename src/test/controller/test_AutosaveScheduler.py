@@ -0,0 +1,77 @@
+from __future__ import annotations
+import threading
+import time
+
+from src.controller.AutosaveScheduler import AutosaveScheduler
+
+import unittest
+
+
+class TestAutosaveScheduler(unittest.TestCase):
+    def setUp(self):
+        self.saves = []
+        self.state = 0
+
+    def __save(self):
+        self.saves.append(self.state)
+
+    def test_coalesce(self):
+        scheduler = AutosaveScheduler(self.__save, 0.2)
+        for state in range(1, 6):
+            self.state = state
+            scheduler.schedule()
+        self.assertListEqual(self.saves, [])  # the quiet period has not passed yet
+        time.sleep(0.5)
+        self.assertListEqual(self.saves, [5])
+        self.assertFalse(scheduler.is_pending())
+
+    def test_flush(self):
+        scheduler = AutosaveScheduler(self.__save, 60)
+        self.assertTrue(scheduler.flush())  # nothing scheduled
+        self.state = 1
+        scheduler.schedule()
+        self.assertTrue(scheduler.is_pending())
+        self.assertTrue(scheduler.flush(5))
+        self.assertListEqual(self.saves, [1])
+
+    def test_schedule_while_saving(self):
+        started, release = threading.Event(), threading.Event()
+
+        def save():
+            state = self.state
+            started.set()
+            release.wait(5)
+            self.saves.append(state)
+
+        scheduler = AutosaveScheduler(save, 0)
+        self.state = 1
+        scheduler.schedule()
+        self.assertTrue(started.wait(5))
+        self.state = 2
+        scheduler.schedule()  # not skipped although a save is running
+        release.set()
+        self.assertTrue(scheduler.flush(5))
+        self.assertListEqual(self.saves, [1, 2])
+
+    def test_cancel(self):
+        scheduler = AutosaveScheduler(self.__save, 60)
+        scheduler.schedule()
+        scheduler.cancel()
+        self.assertTrue(scheduler.flush(5))
+        self.assertListEqual(self.saves, [])
+
+    def test_error(self):
+        def save():
+            raise OSError('disk full')
+
+        scheduler = AutosaveScheduler(save, 0)
+        scheduler.schedule()
+        self.assertTrue(scheduler.flush(5))
+        self.assertIsInstance(scheduler.get_last_error(), OSError)
+
+        scheduler.schedule()  # the worker keeps running after an error
+        self.assertTrue(scheduler.flush(5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,6 @@
+import importlib.util
+import os
+import tempfile
 import unittest
 from unittest.mock import mock_open, patch, MagicMock
 import pandas as pd
@@ -33,6 +36,18 @@ class TestFileManager(unittest.TestCase):
             result = self.file_manager.export("path/to/export.json", {"key": "value"})
             self.assertIsInstance(result, OSError)
 
+    def test_export_atomic(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "export.json")
+            self.assertTrue(self.file_manager.export(path, '{"key": "old"}', atomic=True))
+            with patch.object(pd.DataFrame, 'to_csv', side_effect=OSError("Error writing file")):
+                result = self.file_manager.export(os.path.join(directory, "export.csv"), pd.DataFrame(), atomic=True)
+            self.assertIsInstance(result, OSError)
+            self.assertTrue(self.file_manager.export(path, '{"key": "new"}', atomic=True))
+
+            self.assertListEqual(os.listdir(directory), ["export.json"])  # no temporary or partial files are left
+            self.assertEqual(self.file_manager.import_(path), {"key": "new"})
+
     def test_import_json_positive(self):
         with patch("builtins.open", mock_open(read_data='{"key": "value"}')):
             result = self.file_manager.import_("test.json")
@@ -63,6 +78,63 @@ class TestFileManager(unittest.TestCase):
             expected_dataframe = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
             pd.testing.assert_frame_equal(result, expected_dataframe)
 
+    def test_read_csv_file_chunked(self):
+        rows = ['A;B;C'] + [f'{i};{i},5;x{i}' for i in range(20)] + ['text;1,5;x']
+        progress = []
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.csv")
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write('\n'.join(rows) + '\n')
+            with patch.object(ConfigFiles, 'CSV_CHUNK_ROWS', 3), patch.object(ConfigFiles, 'CSV_SNIFF_SIZE', 40), \
+                    patch.object(pd, 'read_csv', wraps=pd.read_csv) as read_csv, \
+                    patch.object(pd, 'concat', wraps=pd.concat) as concat:
+                result = self.file_manager.import_(path, lambda read, size: progress.append((read, size)))
+            concat.assert_not_called()  # the chunks are copied into the result instead of being kept
+            # only the mixed column is read a second time
+            self.assertListEqual([call.kwargs['usecols'] for call in read_csv.call_args_list if call.args[0] == path],
+                                 [['A']])
+            expected_dataframe = pd.read_csv(path, sep=';', decimal=',')
+            pd.testing.assert_frame_equal(self.file_manager.import_(path, columns={'C', 'missing'}),
+                                          expected_dataframe[['C']])
+
+        pd.testing.assert_frame_equal(result, expected_dataframe)
+        self.assertEqual(len(progress), 7)
+        self.assertListEqual(sorted(progress), progress)
+        self.assertEqual(progress[-1][0], progress[-1][1])
+
+    def test_read_csv_file_chunked_mixed_columns(self):
+        rows = ['A;B;C'] + [f'{i},5;{i};' if i % 2 else f'{i},5;;{i}' for i in range(20)] + ['text;x;y']
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.csv")
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write('\n'.join(rows) + '\n')
+            with patch.object(ConfigFiles, 'CSV_CHUNK_ROWS', 3), patch.object(ConfigFiles, 'CSV_SNIFF_SIZE', 40), \
+                    patch.object(pd, 'read_csv', wraps=pd.read_csv) as read_csv:
+                result = self.file_manager.import_(path)
+            expected_dataframe = pd.read_csv(path, sep=';', decimal=',')
+
+        # only the mixed columns are read a second time
+        self.assertListEqual([call.kwargs['usecols'] for call in read_csv.call_args_list if call.args[0] == path],
+                             [['A', 'B', 'C']])
+        pd.testing.assert_frame_equal(result, expected_dataframe)
+        self.assertEqual(result['A'][1], '1,5')
+        self.assertEqual(result['B'][1], '1')
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is not installed")
+    def test_export_import_columnar(self):
+        data = pd.DataFrame({"A": [1, 2, 3], "B": [4.5, 5.5, 6.5], "C": ["x", "y", "z"]})
+        evaluation = pd.DataFrame({"Value": [0.5, -1.0]}, index=pd.Index(["ASC", "B_TIME"], name="Parameter"))
+        with tempfile.TemporaryDirectory() as directory:
+            for extension in (".parquet", ".feather"):
+                path = os.path.join(directory, f"data{extension}")
+                self.assertTrue(self.file_manager.export(path, data))
+                pd.testing.assert_frame_equal(self.file_manager.import_(path), data)
+                pd.testing.assert_frame_equal(self.file_manager.import_(path, columns=["B"]), data[["B"]])
+
+            path = os.path.join(directory, "evaluation.feather")
+            self.assertTrue(self.file_manager.export(path, evaluation))  # the index is exported as column
+            pd.testing.assert_frame_equal(self.file_manager.import_(path).set_index("Parameter"), evaluation)
+
     def test_read_csv_file_negative(self):
         with patch("builtins.open", mock_open()) as mock_file:
             mock_file.side_effect = OSError("Test Error")
@@ -6,10 +6,14 @@ from unittest.mock import patch
 import pandas as pd
 from parameterized import parameterized
 
+from src.config import ConfigProjectManager
+from src.controller.FileManager import FileManager
+from src.controller.PersistentDerivativeCache import PersistentDerivativeCache
 from src.controller.ProjectManager import ProjectManager
 from src.controller.functions.AlternativeController import AlternativeController
 from src.controller.functions.DerivativeController import DerivativeController
 from src.model.Project import Project
+from src.model.data.Data import Data
 from src.model.data.Alternative import Alternative
 from src.model.data.functions.FunctionalExpression import FunctionalExpression
 
@@ -91,6 +95,128 @@ class TestProjectManager(unittest.TestCase):
         self.assertEqual(pa.get_selected_config_index(), config_idx)
         self.assertEqual(pa.get_choice(), choice)
 
+    def test_save_incremental(self):
+        target = f'{TestProjectManager.__BASE_PATH}/project'
+        self.__prepare_project({}, {'a': FunctionalExpression('1'), 'b': FunctionalExpression('2')})
+        os.makedirs(f'{target}/derivatives')
+        with open(f'{target}/derivatives/stale.json', 'w') as file:
+            file.write('{"label": "stale", "functional_expression": {"expression": "3"}}')
+        with open(f'{target}/notes.txt', 'w') as file:
+            file.write('not part of the project')
+
+        self.project_manager.save(target)
+        self.assertListEqual(sorted(os.listdir(f'{target}/derivatives')), ['a.json', 'b.json'])
+
+        self.dc.change('a', '4')
+        self.dc.remove('b')
+        with patch('src.controller.FileManager.FileManager.export', wraps=FileManager.export) as export:
+            self.project_manager.save(target)
+        self.assertListEqual([call.args[0] for call in export.call_args_list],
+                             [os.path.join(target, 'derivatives', 'a.json')])
+        self.assertListEqual(os.listdir(f'{target}/derivatives'), ['a.json'])
+        self.assertEqual(os.path.isfile(f'{target}/notes.txt'), True)
+
+        self.dc.remove('a')
+        self.project_manager.save(target)
+        self.assertEqual(os.path.exists(f'{target}/derivatives'), False)
+
+        self.project_manager.open(target)
+        self.assertDictEqual(self.project_manager.get_project().get_derivatives(), {})
+
+    def test_save_open_packed(self):
+        target = f'{TestProjectManager.__BASE_PATH}/project.dcproj'
+        alternatives = {'a': Alternative(FunctionalExpression('x+y'), FunctionalExpression('3*z'), 1)}
+        derivatives = {'x': FunctionalExpression('1'), 'y': FunctionalExpression('2'), 'z': FunctionalExpression('3')}
+        self.__prepare_project(alternatives, derivatives)
+        self.project_manager.get_project().set_choice(FunctionalExpression('choice'))
+
+        with patch('src.controller.FileManager.FileManager.export', wraps=FileManager.export) as export:
+            self.project_manager.save(target)
+        self.assertListEqual([call.args[0] for call in export.call_args_list], [target])  # a single write
+        self.assertListEqual(os.listdir(TestProjectManager.__BASE_PATH), ['project.dcproj'])
+
+        self.project_manager.new()
+        self.project_manager.open(target)
+        project = self.project_manager.get_project()
+        self.assertEqual(project.path, target)
+        self.assertEqual(project.get_alternatives(), alternatives)
+        self.assertEqual(project.get_derivatives(), derivatives)
+        self.assertEqual(project.get_choice(), FunctionalExpression('choice'))
+
+        with open(target, 'w') as file:
+            file.write('{"format": "unknown"}\n')
+        self.assertIsInstance(self.project_manager.open(target), ValueError)
+
+    def test_convert(self):
+        directory = f'{TestProjectManager.__BASE_PATH}/project'
+        packed = f'{TestProjectManager.__BASE_PATH}/project.dcproj'
+        derivatives = {'a': FunctionalExpression('1'), 'b': FunctionalExpression('a+1')}
+        self.__prepare_project({}, derivatives)
+        self.project_manager.get_project().set_selected_config_index(1)
+        self.project_manager.save(directory)
+
+        self.project_manager.convert(directory, packed)
+        self.project_manager.new()
+        self.project_manager.open(packed)
+        self.assertEqual(self.project_manager.get_project().get_derivatives(), derivatives)
+        self.assertEqual(self.project_manager.get_project().get_selected_config_index(), 1)
+
+        self.dc.remove('b')
+        self.project_manager.save(packed)
+        self.project_manager.convert(packed, directory)  # stale project files are deleted
+        self.project_manager.open(directory)
+        self.assertEqual(self.project_manager.get_project().get_derivatives(), {'a': FunctionalExpression('1')})
+        self.assertListEqual(os.listdir(f'{directory}/derivatives'), ['a.json'])
+
+    def test_derivative_cache_persisted(self):
+        target = f'{TestProjectManager.__BASE_PATH}/project'
+        raw_data_path = f'{TestProjectManager.__BASE_PATH}/data.csv'
+        pd.DataFrame({'x': [1, 2, 3]}).to_csv(raw_data_path, sep=';', index=False)
+        self.project_manager.import_raw_data(raw_data_path)
+        self.__prepare_project({}, {'a': FunctionalExpression('x*2'), 'b': FunctionalExpression('a+1')})
+        expected = self.project_manager.get_project().get_raw_data(with_derivatives=True)
+        self.project_manager.save(target)
+        files = sorted(os.listdir(f'{target}/derivative_cache'))
+        self.assertListEqual([file.split('-')[0] for file in files], ['a', 'b', 'index.json'])
+
+        evaluate = 'src.model.data.Data.Data._Data__evaluate_column'
+        self.project_manager.open(target)
+        with patch(evaluate) as evaluate_column:
+            data = self.project_manager.get_project().get_raw_data(with_derivatives=True)
+        evaluate_column.assert_not_called()  # stored columns are loaded
+        pd.testing.assert_frame_equal(data, expected, check_dtype=False)
+
+        self.dc.change('b', 'a+2')
+        self.project_manager.save(target)
+        self.project_manager.open(target)
+        with patch(evaluate, wraps=Data._Data__evaluate_column) as evaluate_column:
+            data = self.project_manager.get_project().get_raw_data(with_derivatives=True)
+        self.assertListEqual(list(data['b']), [4, 6, 8])
+        evaluate_column.assert_called_once()  # only the changed derivative is calculated again
+
+        # a save interrupted before the index is written leaves the previous index and its columns consistent
+        def export(path: str, content: object):
+            if path.endswith(ConfigProjectManager.DERIVATIVE_CACHE_INDEX):
+                raise OSError
+            FileManager.export(path, content, atomic=True)
+
+        with patch.object(PersistentDerivativeCache, '_PersistentDerivativeCache__export', side_effect=export):
+            self.assertRaises(OSError, self.project_manager.save, target)  # column of 'a+2' written, index not
+        self.assertEqual(len(os.listdir(f'{target}/derivative_cache')), 4)
+        self.dc.change('b', 'a+1')  # key of the stored column again
+        self.project_manager.save(target)
+        self.assertEqual(len(os.listdir(f'{target}/derivative_cache')), 3)  # the column left behind is deleted
+        self.project_manager.open(target)
+        self.assertListEqual(list(self.project_manager.get_project().get_raw_data(with_derivatives=True)['b']),
+                             [3, 5, 7])
+        self.dc.change('b', 'a+2')
+        self.project_manager.save(target)
+
+        pd.DataFrame({'x': [4, 5, 6, 7]}).to_csv(raw_data_path, sep=';', index=False)
+        self.project_manager.open(target)
+        data = self.project_manager.get_project().get_raw_data(with_derivatives=True)
+        self.assertListEqual(list(data['b']), [10, 12, 14, 16])  # raw data changed, nothing stored is loaded
+
     def test_open_negative(self):
         with patch("os.path.isfile") as mock_isfile:
             mock_isfile.side_effect = ValueError
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from src.model.data.functions.DependencyGraph import DependencyGraph
+from src.model.data.functions.FunctionalExpression import FunctionalExpression
+
+import time
+import unittest
+from parameterized import parameterized
+
+
+class TestDependencyGraph(unittest.TestCase):
+    @parameterized.expand([
+        ('no_cycle', {'a': {'b'}, 'b': {'c'}, 'c': set()}, 'a', None),
+        ('unknown_dependency', {'a': {'x'}}, 'a', None),
+        ('self_loop', {'a': {'a'}}, 'a', ['a', 'a']),
+        ('two_cycle', {'a': {'b'}, 'b': {'a'}}, 'a', ['a', 'b', 'a']),
+        ('path_into_cycle', {'x': {'a'}, 'a': {'b'}, 'b': {'a'}}, 'x', ['x', 'a', 'b', 'a']),
+        ('cycle_not_reachable', {'x': {'c'}, 'c': set(), 'a': {'b'}, 'b': {'a'}}, 'x', None),
+    ])
+    def test_cycle(self, name: str, dependencies: dict[str, set[str]], label: str, expected: list[str] | None):
+        graph = DependencyGraph(dependencies)
+        self.assertEqual(graph.cycle(label), expected)
+        self.assertEqual(graph.leads_to_cycle(label), expected is not None)
+
+    def test_of(self):
+        variables = {'a': FunctionalExpression('b + 1'), 'b': FunctionalExpression('a * 2'), 'c': 3}
+        graph = DependencyGraph.of(variables)
+
+        self.assertEqual(graph.cycle('a'), ['a', 'b', 'a'])
+        self.assertIsNone(graph.cycle('c'))
+
+    def test_deep_diamond(self):
+        # every level depends twice on the level below, a depth-first search without memoization is exponential
+        depth = 200
+        variables = {'v0': FunctionalExpression('1')}
+        for level in range(1, depth):
+            variables[f'v{level}'] = FunctionalExpression(f'v{level - 1} + v{level - 1} * 2')
+
+        start = time.perf_counter()
+        report = variables[f'v{depth - 1}'].get_error_report(**variables)
+        self.assertLess(time.perf_counter() - start, 5)
+        self.assertEqual(report.valid, True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,7 @@ from src.model.data.functions.StringMarker import StringMarker
 from src.config import ConfigExpressionErrors as Config
 
 import unittest
+from unittest.mock import patch
 from parameterized import parameterized
 import pandas as pd
 
@@ -62,6 +63,30 @@ class TestFunctionalExpression(unittest.TestCase):
     def test_error_report(self, name: str, expr: str, variables: dict[str, object], report: ErrorReport):
         self.assertEqual(FunctionalExpression(expr).get_error_report(**variables), report)
 
+    @parameterized.expand([
+        ('unrelated_variable', {'c': FunctionalExpression('2')}, False),
+        ('unrelated_value', {'x': 3}, False),
+        ('changed_value', {'a': 5}, False),
+        ('changed_dependency', {'b': FunctionalExpression('a + d')}, True),
+        ('changed_indirect_dependency', {'a': FunctionalExpression('b')}, True),
+        ('removed_dependency', {'b': 1}, True)
+    ])
+    def test_error_report_cache(self, name: str, changes: dict[str, object], revalidated: bool):
+        FunctionalExpression.clear_validation_cache()
+        variables = {'a': 1, 'b': FunctionalExpression('a * 2'), 'c': FunctionalExpression('1'), 'x': 1}
+        expr = FunctionalExpression('b + 1')
+        report = expr.get_error_report(**variables)
+
+        create = FunctionalExpression._FunctionalExpression__create_error_report
+        with patch.object(FunctionalExpression, '_FunctionalExpression__create_error_report', autospec=True,
+                          side_effect=create) as create_mock:
+            new_report = expr.get_error_report(**(variables | changes))
+
+        revalidations = [call for call in create_mock.call_args_list if call.args[0] == expr]
+        self.assertEqual(len(revalidations) > 0, revalidated)
+        if not revalidated:
+            self.assertEqual(new_report, report)
+
     @parameterized.expand([
         ('eq_false', 'a == b', {'a': 1, 'b': 2}, False),
         ('eq_true', 'a == b', {'a': 'qwertz', 'b': 'qwertz'}, True),
@@ -85,6 +110,48 @@ class TestFunctionalExpression(unittest.TestCase):
     def test_eval(self, name: str, expr: str, variables: dict[str, object], val: object):
         self.assertEqual(FunctionalExpression(expr).eval(**variables), val)
 
+    @parameterized.expand([
+        ('pow', 'a ** 2', True),
+        ('bool_add', '(a > 1) + (b < 2)', True),
+        ('min_max', 'min(a, b) + max(a, 2, b)', True),
+        ('chained_compare', '0 <= a < 2', True),
+        ('interval', 'a in Interval(0, 2, True, False)', True),
+        ('not_in_set', 's not in set({\'x\', \'z\'})', True),
+        ('in_range', 'a in range(0, 4, 2)', True),
+        ('groupmap', 'GroupMap([range(0, 2), Interval(2, 3), [4]])(a)', True),
+        ('groupmap_open', 'GroupMap([Interval(None, 1), Interval(1, None)])(b)', True),
+        ('and', 'a > 1 and b > 1', False),
+        ('invert', '~(a > 1)', False),
+        ('lambda', '(lambda x: x+1)(a)', False),
+        ('sum', 'sum(a)', False)
+    ])
+    def test_eval_columns(self, name: str, expr: str, vectorizable: bool):
+        data = pd.DataFrame({'a': [0, 1, 2, 3, 4], 'b': [1.5, 0.5, 3.0, -1.0, 2.0], 's': ['x', 'y', 'z', 'x', 'y']})
+        e = FunctionalExpression(expr)
+        self.assertEqual(e.vectorizable, vectorizable)
+        if not vectorizable:
+            with self.assertRaises(ValueError):
+                e.eval_columns(**data)
+            return
+
+        row_wise = pd.Series([e.eval(**row) for row in data.to_dict(orient='records')])
+        column_wise = e.eval_columns(**data)
+        self.assertEqual(column_wise.equals(row_wise), True)
+
+    @parameterized.expand([
+        ('arithmetic', 'a * 2 + b'),
+        ('groupmap', 'GroupMap([range(0, 2), Interval(2, 3), [4]])(a)'),
+        ('conditional', 's if a > 1 else None'),
+        ('constant', '2 ** 3'),
+    ])
+    def test_eval_rows(self, name: str, expr: str):
+        data = pd.DataFrame({'a': [0, 1, 2, 3, 4], 'b': [1.5, 0.5, 3.0, -1.0, 2.0], 's': ['x', 'y', 'z', 'x', 'y']})
+        e = FunctionalExpression(expr)
+        expected = [e.eval(**row) for row in data.to_dict(orient='records')]
+        with patch('builtins.compile', wraps=compile) as compile_:
+            self.assertListEqual(e.eval_rows(len(data), **{label: data[label].tolist() for label in data}), expected)
+        self.assertEqual(compile_.call_count, 0)  # compiled once before
+
     @parameterized.expand([
         ('while', 'while True: pass', {}, SyntaxError),
         ('import1', 'import math', {}, SyntaxError),
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from src.model.data.functions.FunctionalExpression import FunctionalExpression
+from src.model.data.functions.GroupMap import GroupMap
+from src.model.data.functions.Interval import Interval
+from src.model.data.functions.TypeInference import TypeInference
+
+import unittest
+from unittest.mock import patch
+import numpy as np
+from parameterized import parameterized
+
+
+class TestTypeInference(unittest.TestCase):
+    __TYPES = {'i': int, 'f': float, 'b': bool, 's': str}
+
+    @parameterized.expand([
+        ('i + 1', int),
+        ('i + f', float),
+        ('b + b', int),
+        ('i / 2', float),
+        ('i // 2', int),
+        ('i // 0', None),  # raises a ZeroDivisionError
+        ('f / 0.0', None),
+        ('i ** 2', int),
+        ('i ** i', None),  # negative exponents lead to a float
+        ('f ** 2', float),
+        ('-b', int),
+        ('b & b', bool),
+        ('not i', bool),
+        ('i > f', bool),
+        ('0 < i <= f', bool),
+        ('s < "b"', bool),
+        ('s < i', None),  # raises a TypeError
+        ('s == i', bool),
+        ('s in "abc"', bool),
+        ('i in [1, 2]', bool),
+        ('i in s', None),  # raises a TypeError
+        ('s in Interval(0, 1)', None),  # raises a TypeError
+        ('f in Interval(0, 1)', bool),
+        ('Interval(0, None)', Interval),
+        ('GroupMap([Interval(0, 1), Interval(1, 2)])', GroupMap),
+        ('GroupMap([Interval(0, 1), Interval(1, 2)])(f)', None),  # None for elements without group
+        ('s + "x"', str),
+        ('s % i', None),  # raises a TypeError without conversion in s
+        ('"%d" % s', None),  # raises a TypeError
+        ('s * i', str),
+        ('i if b else f', None),
+        ('i if b else 2', int),
+        ('abs(b)', int),
+        ('max(f, 1.0)', float),
+        ('unknown + 1', None),
+        ('[i][0]', None),
+    ])
+    def test_infer(self, expression: str, expected: type | None):
+        self.assertEqual(FunctionalExpression(expression).static_type(TestTypeInference.__TYPES), expected)
+        if expected is not None:  # agrees with the evaluation
+            values = {'i': 3, 'f': 0.5, 'b': True, 's': 'a'}
+            self.assertEqual(type(FunctionalExpression(expression).eval(**values)), expected)
+
+    @parameterized.expand([
+        (np.dtype('int32'), int),
+        (np.dtype('uint8'), int),
+        (np.dtype('float64'), float),
+        (np.dtype('bool'), bool),
+        (np.dtype('O'), None),
+    ])
+    def test_of_dtype(self, dtype: np.dtype, expected: type | None):
+        self.assertEqual(TypeInference.of_dtype(dtype), expected)
+
+    def test_infer_all(self):
+        expressions = {'c': FunctionalExpression('b * 2.0'), 'b': FunctionalExpression('a + 1'),
+                       'd': FunctionalExpression('x + c'), 'e': FunctionalExpression('f'),
+                       'f': FunctionalExpression('e')}
+        with patch.object(FunctionalExpression, 'eval') as evaluate:
+            types = TypeInference.infer_all(expressions, {'a': int})
+        evaluate.assert_not_called()
+        self.assertDictEqual(types, {'b': int, 'c': float, 'd': None})  # cyclic expressions are skipped
+
+
+if __name__ == '__main__':
+    unittest.main()
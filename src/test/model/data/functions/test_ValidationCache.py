@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from src.model.data.functions.ValidationCache import ValidationCache
+
+import unittest
+from parameterized import parameterized
+
+
+class TestValidationCache(unittest.TestCase):
+    @parameterized.expand([
+        ('no_eviction', 3, ['a', 'b', 'c'], [], {'a', 'b', 'c'}),
+        ('evict_oldest', 2, ['a', 'b', 'c'], [], {'b', 'c'}),
+        ('evict_least_recently_used', 2, ['a', 'b', 'c'], ['a'], {'a', 'c'}),
+    ])
+    def test_eviction(self, name: str, max_size: int, first_keys: list[str], used_keys: list[str],
+                      remaining: set[str]):
+        cache = ValidationCache(max_size)
+        keys = first_keys[:-1]
+        for key in keys:
+            cache.put(key, key.upper())
+        for key in used_keys:
+            self.assertEqual(cache.get(key), key.upper())
+        cache.put(first_keys[-1], first_keys[-1].upper())
+
+        self.assertEqual(len(cache), len(remaining))
+        for key in first_keys:
+            self.assertEqual(cache.get(key), key.upper() if key in remaining else None)
+
+    def test_clear(self):
+        cache = ValidationCache(2)
+        cache.put('a', 1)
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.get('a'))
+
+
+if __name__ == '__main__':
+    unittest.main()
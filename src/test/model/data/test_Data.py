@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+from src.model.data.ColumnSchema import ColumnSchema
 from src.model.data.Data import Data
 from src.model.data.functions.FunctionalExpression import FunctionalExpression
 from src.model.data.functions.ErrorReport import ErrorReport
 from src.model.data.functions.StringMarker import StringMarker
+from src.model.data.EvaluationMethod import EvaluationMethod
 
 from src.config import ConfigExpressionErrors as Config
 
 import unittest
+from unittest.mock import patch
 from parameterized import parameterized
+import numpy as np
 import pandas as pd
 
 
+BOOL_DATA = {'A': [1, 2, 3, 0, 5], 'C': [True, False, True, False, True]}
+
+
 class TestData(unittest.TestCase):
     @parameterized.expand([
         ('test', {'A': [0]}, 'old', {}, pd.DataFrame({'B': [1]}), 'new')
@@ -37,6 +44,24 @@ class TestData(unittest.TestCase):
         self.assertEqual(new_data.raw_data_path, new_rd_path)
         self.assertDictEqual(new_data.derivatives, derivatives)
 
+    def test_shared_read_only_data(self):
+        raw_data = pd.DataFrame({'A': [0, 1, 2], 'B': ['x', 'y', 'z']})
+        data = Data(raw_data, None, {'a': FunctionalExpression('A * 2')})
+        new_data = data.set_derivative('b', FunctionalExpression('a + 1'))
+        self.assertIs(new_data.raw_data, data.raw_data)
+
+        complete_data = new_data.complete_data
+        for label in ('A', 'B'):
+            self.assertEqual(np.shares_memory(complete_data[label].to_numpy(), raw_data[label].to_numpy()), True)
+        self.assertEqual(np.shares_memory(complete_data['a'].to_numpy(), data.complete_data['a'].to_numpy()), True)
+
+        for frame in (new_data.raw_data, complete_data):
+            with self.assertRaises(ValueError):
+                frame.loc[0, 'A'] = 5
+        copy = complete_data.copy(deep=False)
+        copy['A'] = 5
+        self.assertListEqual(new_data.complete_data['A'].tolist(), [0, 1, 2])
+
     @parameterized.expand([
         ('single_pow', {'A': [0, 1, 2, 3]}, 'old', {'der': FunctionalExpression('A**2')},
          pd.DataFrame({'A': [0, 1, 2, 3], 'der': [0, 1, 4, 9]}))
@@ -56,6 +81,121 @@ class TestData(unittest.TestCase):
 
         self.assertEqual(complete_data.equals(data.complete_data), True)
 
+    @parameterized.expand([
+        ('vectorized', {'A': [0, 1, 2, 3]}, {'der': FunctionalExpression('min(A, 2) in Interval(1, 2)')},
+         pd.Series([False, True, True, True]), EvaluationMethod.VECTORIZED),
+        ('row_wise', {'A': [0, 1, 2, 3]}, {'der': FunctionalExpression('A > 0 and A < 3')},
+         pd.Series([False, True, True, False]), EvaluationMethod.ROW_WISE),
+        ('constant', {'A': [0, 1, 2, 3]}, {'der': FunctionalExpression('1.5')},
+         pd.Series([1.5, 1.5, 1.5, 1.5]), EvaluationMethod.VECTORIZED),
+        ('dependency', {'A': [0, 1, 2, 3]}, {'der': FunctionalExpression('B * 2'), 'B': FunctionalExpression('A + 1')},
+         pd.Series([2, 4, 6, 8]), EvaluationMethod.VECTORIZED)
+    ])
+    def test_evaluation_methods(self,
+                                name: str,
+                                raw_data: dict[str, list],
+                                derivatives: dict[str, FunctionalExpression],
+                                column: pd.Series,
+                                method: EvaluationMethod):
+        data = Data(pd.DataFrame(raw_data), None, derivatives)
+
+        self.assertEqual(data.complete_data['der'].equals(column.rename('der')), True)
+        self.assertEqual(data.evaluation_methods['der'], method)
+
+    @parameterized.expand([
+        ('text_in_column', {'s': ['a', 'b', 'a', 'c']}, "'a' in s"),
+        ('text_not_in_column', {'s': ['a', 'b', 'a', 'c']}, "'a' not in s"),
+        ('substring_in_column', {'s': ['ab', 'b', 'ca', 'c']}, "'a' in s"),
+        ('column_in_list', {'A': [1, 5, 1, 2]}, 'A in [1, 2]'),
+        ('number_in_list', {'A': [1, 5, 1, 2]}, '1 in [A, 2]'),
+        ('negated_bool', BOOL_DATA, '-C'),
+        ('negated_bool_product', BOOL_DATA, '-C * 2'),
+        ('negated_bool_difference', BOOL_DATA, 'A - -C'),
+        ('negated_comparison', BOOL_DATA, '-(A > 1)'),
+        ('bitwise_bool_int', BOOL_DATA, 'C | A'),
+        ('bitwise_int_bool', BOOL_DATA, 'A & C'),
+        ('bitwise_bool_bool', BOOL_DATA, 'C & (A > 1)'),
+        ('absolute_bool', BOOL_DATA, 'abs(C)'),
+        ('power_bool', BOOL_DATA, 'pow(C, 2)'),
+        ('minimum_bool_int', BOOL_DATA, 'min(C, A)'),
+        ('maximum_bool_bool', BOOL_DATA, 'max(C, A > 2)'),
+        ('power_overflow', BOOL_DATA, 'A ** 70'),
+        ('group_map_unassigned', BOOL_DATA, 'GroupMap([[1, 2]])(A)'),
+        ('group_map_no_match', BOOL_DATA, 'GroupMap([[7]])(A)')
+    ])
+    def test_vectorized_equals_row_wise(self, name: str, raw_data: dict[str, list], expression: str):
+        frame = pd.DataFrame(raw_data)
+        derivative = FunctionalExpression(expression)
+        data = Data(frame, None, {'der': derivative})
+        expected = [derivative.eval(**row) for row in frame.to_dict(orient='records')]
+
+        pd.testing.assert_series_equal(data.complete_data['der'], pd.Series(expected, index=frame.index, name='der'))
+
+    @parameterized.expand([
+        ('floor_division_by_zero', BOOL_DATA, 'A // 0'),
+        ('division_by_zero_row', BOOL_DATA, 'A / (A - 1)'),
+        ('modulo_by_false', BOOL_DATA, 'A % C')
+    ])
+    def test_vectorized_raises_row_wise(self, name: str, raw_data: dict[str, list], expression: str):
+        data = Data(pd.DataFrame(raw_data), None, {'der': FunctionalExpression(expression)})
+
+        with self.assertRaises(ZeroDivisionError):
+            _ = data.complete_data
+
+    @parameterized.expand([
+        ('leaf', 'd', FunctionalExpression('c - 1'), {'d'}),
+        ('root', 'a', FunctionalExpression('A * 3'), {'a', 'b', 'c', 'd'}),
+        ('inner', 'b', FunctionalExpression('a - 1'), {'b', 'c', 'd'}),
+        ('new', 'e', FunctionalExpression('a + 1'), {'e'})
+    ])
+    def test_incremental_complete_data(self, name: str, label: str, derivative: FunctionalExpression,
+                                       recalculated: set[str]):
+        derivatives = {
+            'a': FunctionalExpression('A * 2'),
+            'b': FunctionalExpression('a + 1'),
+            'c': FunctionalExpression('a + b'),
+            'd': FunctionalExpression('c * 2'),
+            'x': FunctionalExpression('A - 1')
+        }
+        data = Data(pd.DataFrame({'A': [0, 1, 2, 3]}), None, derivatives)
+        data.complete_data
+
+        new_data = data.set_derivative(label, derivative)
+        evaluate = Data._Data__evaluate_column
+        with patch.object(Data, '_Data__evaluate_column', wraps=evaluate) as evaluate_mock:
+            complete_data = new_data.complete_data
+
+        evaluated = {new_data.derivatives[k] for k in recalculated}
+        self.assertSetEqual({call.args[0] for call in evaluate_mock.call_args_list}, evaluated)
+        expected = Data(pd.DataFrame({'A': [0, 1, 2, 3]}), None, new_data.derivatives).complete_data
+        self.assertEqual(complete_data.equals(expected), True)
+
+    @parameterized.expand([
+        ('chain', {'d'}, {'A', 'a', 'b', 'c', 'd'}),
+        ('unused_raw', {'x', 'B'}, {'A', 'B', 'x'}),
+        ('unknown', {'beta', 'B'}, {'B'})
+    ])
+    def test_get_complete_data_used(self, name: str, variables: set[str], columns: set[str]):
+        derivatives = {
+            'a': FunctionalExpression('A * 2'),
+            'b': FunctionalExpression('a + 1'),
+            'c': FunctionalExpression('a + b'),
+            'd': FunctionalExpression('c * 2'),
+            'x': FunctionalExpression('A - 1')
+        }
+        data = Data(pd.DataFrame({'A': [0, 1, 2, 3], 'B': [1, 1, 0, 0]}), None, derivatives)
+
+        evaluate = Data._Data__evaluate_column
+        with patch.object(Data, '_Data__evaluate_column', wraps=evaluate) as evaluate_mock:
+            used_data = data.get_complete_data(variables)
+        self.assertSetEqual({call.args[0] for call in evaluate_mock.call_args_list},
+                            {derivatives[label] for label in columns if label in derivatives})
+        self.assertSetEqual(set(used_data.columns), columns)
+
+        complete_data = data.complete_data
+        self.assertEqual(used_data.equals(complete_data[list(used_data.columns)]), True)
+        self.assertEqual(data.get_complete_data(variables).equals(used_data), True)
+
     @parameterized.expand([
         ('single_pow', {'A': [0, 1, 2, 3]}, 'old', 'der', FunctionalExpression('A**2'))
     ])
@@ -98,7 +238,9 @@ class TestData(unittest.TestCase):
 
     @parameterized.expand([
         ('single_pow', {'A': [0, 1, 2, 3]}, 'old', {'der': FunctionalExpression('A**2')},
-         {'A': FunctionalExpression('0'), 'der': FunctionalExpression('A**2')})
+         {'A': 0, 'der': FunctionalExpression('A**2')}),
+        ('text_and_missing', {'A': ['x', 'y'], 'B': [None, 1.5]}, None, {},
+         {'A': 'x', 'B': 1.5})
     ])
     def test_get_variables(self,
                            name: str,
@@ -111,6 +253,29 @@ class TestData(unittest.TestCase):
 
         self.assertDictEqual(data.get_variables(), variables)
 
+    def test_derivative_types(self):
+        raw_data = pd.DataFrame({'num': [1, 2], 'flag': [True, False]})
+        data = Data(raw_data, None, {'a': FunctionalExpression('num / 2'), 'b': FunctionalExpression('a > 0 and flag'),
+                                     'c': FunctionalExpression('[num][0]')})
+        with patch.object(FunctionalExpression, 'eval', autospec=True,
+                          side_effect=FunctionalExpression.eval) as evaluate:
+            self.assertEqual(data.get_derivative_type('a', {}), float)
+            self.assertEqual(data.get_derivative_type('b', {}), bool)
+            evaluate.assert_not_called()  # inferred statically
+            self.assertEqual(data.get_derivative_type('c', {}), int)
+            evaluate.assert_called()  # evaluated as fallback
+        self.assertDictEqual(data.derivative_types, {'a': float, 'b': bool, 'c': None})
+
+    def test_schema(self):
+        raw_data = pd.DataFrame({'num': [np.nan, 2.5], 'text': ['a', 'b'], 'empty': pd.Series([np.nan, np.nan])})
+        data = Data(raw_data, None, {'d': FunctionalExpression('text + "c"')})
+
+        self.assertEqual(data.schema['num'], ColumnSchema('num', np.dtype('float64'), True, 2.5))
+        self.assertEqual(data.schema['text'], ColumnSchema('text', np.dtype('O'), False, 'a'))
+        self.assertEqual(data.schema['empty'].value, 0.0)
+        self.assertEqual(data.get_derivative_type('d', {}), str)  # text columns are usable in expressions
+        self.assertIs(data.set_derivative('e', FunctionalExpression('num')).schema, data.schema)  # shared
+
     @parameterized.expand([
         ('no_error', {}, {'a': FunctionalExpression('12.5')},
          {}, 'a',
@@ -171,6 +336,7 @@ class TestData(unittest.TestCase):
         ('unknown_column', {'a': [1]}, {'c': FunctionalExpression('a+b')}, {}, 'c', SyntaxError),
         ('unknown_derivative', {}, {'c': FunctionalExpression('a+b')}, {}, 'd', KeyError),
         ('self_reference', {}, {'c': FunctionalExpression('c')}, {}, 'd', KeyError),
+        ('incomparable', {'a': [1], 's': ['x']}, {'c': FunctionalExpression('s < a')}, {}, 'c', TypeError),
     ])
     def test_get_derivative_type_error(self, name: str,
                                        raw_data: dict[str, list],
@@ -99,7 +99,7 @@ class TestInterval(unittest.TestCase):
             model.remove_derivative(label)
 
     @parameterized.expand([
-        (pd.DataFrame(data={'col_1': [1, 2], 'col_2': [3, 0]})),
+        (pd.DataFrame(data={'col_1': [1, 2], 'col_2': [3, 0]}), None),
         (pd.DataFrame(data={'col': [0, 1]}), "directory_path")
     ])
     def test_set_raw_data(self, raw_data: pd.DataFrame, path: str):
@@ -107,7 +107,7 @@ class TestInterval(unittest.TestCase):
                       FunctionalExpression('0'))
         new_model = model.set_raw_data(raw_data, path)
         self.assertIsNot(new_model, model)
-        self.assertIs(new_model.data.raw_data, raw_data)
+        self.assertEqual(new_model.data.raw_data.equals(raw_data), True)  # read-only version sharing the columns
         self.assertEqual(new_model.data.raw_data_path, path)
         self.assertDictEqual(new_model.data.derivatives, model.data.derivatives)
 
@@ -258,6 +258,16 @@ class TestInterval(unittest.TestCase):
         with self.assertRaises(expected_error):
             model.get_derivative_error_report('alt', {})
 
+    def test_used_variables(self):
+        data = Data(pd.DataFrame({'A': [1, 2], 'B': [3, 4], 'AV': [1, 1], 'CHOICE': [1, 2], 'UNUSED': [0, 0]}), None,
+                    {'a': FunctionalExpression('A / 100'), 'b': FunctionalExpression('a + B'),
+                     'unused': FunctionalExpression('UNUSED + 1')})
+        model = Model(data, {'alt_one': Alternative(FunctionalExpression('BETA * b'), FunctionalExpression('AV'), 1),
+                             'alt_two': Alternative(FunctionalExpression('ASC'), FunctionalExpression('1'), 2)},
+                      FunctionalExpression('CHOICE'))
+        self.assertSetEqual(model.used_variables, {'A', 'B', 'AV', 'CHOICE', 'a', 'b', 'BETA', 'ASC'})
+        self.assertListEqual(list(model.get_used_data().columns), ['A', 'B', 'AV', 'CHOICE', 'a', 'b'])
+
     @parameterized.expand([
         (FunctionalExpression("1")),
         (FunctionalExpression("choice_idx"))
@@ -0,0 +1,54 @@
+from __future__ import annotations
+import gc
+
+from src.model.processing.DatabaseCache import DatabaseCache
+
+import unittest
+
+
+class TestDatabaseCache(unittest.TestCase):
+    class __Data:
+        """Stand-in for a Data object, only its identity is relevant."""
+
+    def test_get_by_identity(self):
+        cache = DatabaseCache(2)
+        data = TestDatabaseCache.__Data()
+        cache.put(data, 'database')
+
+        self.assertEqual(cache.get(data), 'database')
+        self.assertIsNone(cache.get(TestDatabaseCache.__Data()))
+
+    def test_eviction(self):
+        cache = DatabaseCache(2)
+        first, second, third = TestDatabaseCache.__Data(), TestDatabaseCache.__Data(), TestDatabaseCache.__Data()
+        cache.put(first, 1)
+        cache.put(second, 2)
+        cache.get(first)
+        cache.put(third, 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(first), 1)
+        self.assertIsNone(cache.get(second))
+        self.assertEqual(cache.get(third), 3)
+
+    def test_remove_collected(self):
+        cache = DatabaseCache(2)
+        data = TestDatabaseCache.__Data()
+        cache.put(data, 'database')
+        del data
+        gc.collect()
+
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        cache = DatabaseCache(2)
+        data = TestDatabaseCache.__Data()
+        cache.put(data, 'database')
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.get(data))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from src.model.processing.Evaluation import Evaluation
+
+import unittest
+from parameterized import parameterized
+import numpy as np
+import pandas as pd
+
+
+class TestEvaluation(unittest.TestCase):
+    @staticmethod
+    def __result(values: dict[str, float]) -> pd.DataFrame:
+        return pd.DataFrame({'Value': values.values(), 'Rob. Std err': [0.1] * len(values)}, index=values.keys())
+
+    @parameterized.expand([
+        ('single', __result({'a': 1.5, 'b': -2.0}), {'a': 1.5, 'b': -2.0}),
+        ('not_finite', __result({'a': np.nan, 'b': np.inf, 'c': 3.0}), {'c': 3.0}),
+        ('no_values', pd.DataFrame({'x': [1.0]}, index=['a']), {}),
+        ('varied', pd.concat([__result({'a': 1.0}), __result({'a': 2.0})], axis=1, keys=range(2)), {'a': 1.0}),
+    ])
+    def test_start_values(self, name: str, result: pd.DataFrame, expected: dict[str, float]):
+        self.assertDictEqual(Evaluation(result).start_values(), expected)
+
+    def test_component(self):
+        result = pd.concat([TestEvaluation.__result({'a': 1.0}), TestEvaluation.__result({'a': 2.0})], axis=1,
+                           keys=range(2))
+        evaluation = Evaluation(result, iterations=30, saved_iterations=10)
+
+        self.assertEqual(evaluation.estimations, 2)
+        component = evaluation.component(1)
+        self.assertDictEqual(component.start_values(), {'a': 2.0})
+        self.assertEqual(component.iterations, 15)
+        self.assertEqual(component.saved_iterations, 5)
+        self.assertIsNone(evaluation.component(2))
+
+        single = Evaluation(TestEvaluation.__result({'a': 1.0}))
+        self.assertIs(single.component(5), single)
+
+    @parameterized.expand([
+        ('cold_reference', 20, None, 1, 5, 15),
+        ('warm_reference', 5, 15, 1, 5, 15),
+        ('more_iterations', 5, None, 1, 8, 0),
+        ('varied_reference', 40, None, 2, 5, 15),
+        ('unknown', None, None, 1, 5, None),
+    ])
+    def test_saved_iterations_by(self, name: str, iterations: int | None, saved_iterations: int | None,
+                                 estimations: int, warm_iterations: int, expected: int | None):
+        result = pd.concat([TestEvaluation.__result({'a': 1.0})] * estimations, axis=1, keys=range(estimations)) \
+            if estimations > 1 else TestEvaluation.__result({'a': 1.0})
+        evaluation = Evaluation(result, iterations=iterations, saved_iterations=saved_iterations)
+        self.assertEqual(evaluation.saved_iterations_by(warm_iterations), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+import pickle
+
+from src.model.processing.SharedDataFrame import SharedDataFrame
+
+import unittest
+from parameterized import parameterized
+import numpy as np
+import pandas as pd
+
+
+class TestSharedDataFrame(unittest.TestCase):
+    @parameterized.expand([
+        ('numeric', pd.DataFrame({'a': [1, 2, 3], 'b': [0.5, -1.0, 2.25], 'c': [True, False, True]}),
+         pd.DataFrame({'a': [1, 2, 3], 'b': [0.5, -1.0, 2.25], 'c': [True, False, True]})),
+        ('index', pd.DataFrame({'a': [1, 2], 0: [0.5, 1.5]}, index=pd.Index([3, 7], name='row')),
+         pd.DataFrame({'a': [1, 2], 0: [0.5, 1.5]}, index=pd.Index([3, 7], name='row'))),
+        ('range_index', pd.DataFrame({'a': [1, 2]}, index=pd.RangeIndex(2, 6, 2)),
+         pd.DataFrame({'a': [1, 2]}, index=pd.RangeIndex(2, 6, 2))),
+        ('datetime', pd.DataFrame({'a': pd.to_datetime(['2024-01-01', '2024-01-02'])}),
+         pd.DataFrame({'a': pd.to_datetime(['2024-01-01', '2024-01-02'])})),
+        ('empty', pd.DataFrame({'a': pd.Series([], dtype=np.float64)}),
+         pd.DataFrame({'a': pd.Series([], dtype=np.float64)})),
+    ])
+    def test_attach(self, name: str, frame: pd.DataFrame, expected: pd.DataFrame):
+        with SharedDataFrame(frame) as shared:
+            received = pickle.loads(pickle.dumps(shared))
+            pd.testing.assert_frame_equal(received.attach(), expected)
+            received.close()
+
+    @parameterized.expand([
+        ('text', pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']})),
+        ('category', pd.DataFrame({'a': pd.Categorical(['x', 'y'])})),
+        ('nullable', pd.DataFrame({'a': pd.array([1, 2], dtype='Int64')})),
+        ('text_index', pd.DataFrame({'a': [1, 2]}, index=['x', 'y'])),
+    ])
+    def test_not_shareable(self, name: str, frame: pd.DataFrame):
+        self.assertEqual(SharedDataFrame.is_shareable(frame), False)
+        self.assertRaises(TypeError, SharedDataFrame, frame)
+
+    def test_attach_without_copy(self):
+        with SharedDataFrame(pd.DataFrame({'a': [1.0, 2.0], 'b': [3, 4]})) as shared:
+            first = pickle.loads(pickle.dumps(shared))
+            second = pickle.loads(pickle.dumps(shared))
+            for label in ('a', 'b'):
+                # writing through one attachment is visible in the other, so both use the same memory
+                first.attach()[label].to_numpy()[0] = 7
+                self.assertEqual(second.attach()[label].iloc[0], 7)
+            first.close()
+            second.close()
+
+    def test_unlink_on_error(self):
+        with self.assertRaises(ValueError):
+            with SharedDataFrame(pd.DataFrame({'a': [1, 2]})) as shared:
+                received = pickle.loads(pickle.dumps(shared))
+                raise ValueError
+
+        with self.assertRaises(FileNotFoundError):
+            received.attach()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,18 +1,47 @@
 from __future__ import annotations
+from concurrent.futures import CancelledError
 import os
+import pickle
+import tempfile
+import time
 
 from src.model.processing.VariedLogitBiogemeConfig import VariedLogitBiogemeConfig
+from src.model.processing.SingleLogitBiogemeConfig import SingleLogitBiogemeConfig
 from src.model.processing.Evaluation import Evaluation
+from src.model.processing.SharedDataFrame import SharedDataFrame
 from src.model.data.Data import Data
 from src.model.data.Model import Model
 from src.model.data.Alternative import Alternative
 from src.model.data.functions.FunctionalExpression import FunctionalExpression
 
 import unittest
+from unittest.mock import patch
 from parameterized import parameterized
 import pandas as pd
 
 
+class _FailingComponent:
+    """
+    Component whose estimation fails in the worker process.
+    """
+    def process(self, model, warm_start, estimation_data):
+        raise ValueError('estimation failed')
+
+
+class _RecordingComponent:
+    """
+    Component which records its estimation in a directory, so estimations in worker processes can be counted.
+    """
+    def __init__(self, directory: str, idx: int):
+        self.directory = directory
+        self.idx = idx
+
+    def process(self, model, warm_start, estimation_data):
+        open(os.path.join(self.directory, str(self.idx)), 'w').close()
+        time.sleep(0.5)
+        return Evaluation(pd.DataFrame())
+
+
 class TestVariedLogitBiogemeConfig(unittest.TestCase):
     @staticmethod
     def __swissmetro_raw_data():
@@ -25,6 +54,36 @@ class TestVariedLogitBiogemeConfig(unittest.TestCase):
     def __ifvrabus_raw_data():
         return pd.read_csv(f'{os.path.dirname(__file__)}/../../resources/Choicedata.csv', sep=';')
 
+    @staticmethod
+    def __b01logit_model() -> Model:
+        raw_data = TestVariedLogitBiogemeConfig.__swissmetro_raw_data().head(3000)
+        return Model(Data(raw_data=raw_data, raw_data_path=None,
+                          derivatives={
+                              'SM_COST': FunctionalExpression('SM_CO * (GA == 0)'),
+                              'TRAIN_COST': FunctionalExpression('TRAIN_CO * (GA == 0)'),
+                              'CAR_AV_SP': FunctionalExpression('CAR_AV * (SP != 0)'),
+                              'TRAIN_AV_SP': FunctionalExpression('TRAIN_AV * (SP != 0)'),
+                              'TRAIN_TT_SCALED': FunctionalExpression('TRAIN_TT / 100'),
+                              'TRAIN_COST_SCALED': FunctionalExpression('TRAIN_COST / 100'),
+                              'SM_TT_SCALED': FunctionalExpression('SM_TT / 100'),
+                              'SM_COST_SCALED': FunctionalExpression('SM_COST / 100'),
+                              'CAR_TT_SCALED': FunctionalExpression('CAR_TT / 100'),
+                              'CAR_CO_SCALED': FunctionalExpression('CAR_CO / 100'),
+                          }), alternatives={
+            'alt1': Alternative(
+                FunctionalExpression('ASC_TRAIN + B_TIME * TRAIN_TT_SCALED + B_COST * TRAIN_COST_SCALED'),
+                availability_condition=FunctionalExpression('TRAIN_AV_SP'),
+                choice_idx=1),
+            'alt2': Alternative(
+                FunctionalExpression('B_TIME * SM_TT_SCALED + B_COST * SM_COST_SCALED'),
+                availability_condition=FunctionalExpression('SM_AV'),
+                choice_idx=2),
+            'alt3': Alternative(
+                FunctionalExpression('ASC_CAR + B_TIME * CAR_TT_SCALED + B_COST * CAR_CO_SCALED'),
+                availability_condition=FunctionalExpression('CAR_AV_SP'),
+                choice_idx=3)
+        }, choice=FunctionalExpression('CHOICE'))
+
     @parameterized.expand([
         ('b01logit', {'x': 'range(2)', 'y': '0'},
          Model(Data(raw_data=__swissmetro_raw_data(), raw_data_path=None,
@@ -67,6 +126,125 @@ class TestVariedLogitBiogemeConfig(unittest.TestCase):
         variations_count = len(set(evaluation.result.columns.get_level_values(0)))
         self.assertEqual(variations_count, expected_variations)
 
+    @parameterized.expand([
+        ('fewer_workers', {'x': 'range(3)'}, 2),
+        ('more_workers', {'x': 'range(2)'}, 4),
+    ])
+    def test_process_parallel(self, name: str, settings: dict[str, str], max_workers: int):
+        model = TestVariedLogitBiogemeConfig.__b01logit_model()
+        settings = {k: FunctionalExpression(v) for k, v in settings.items()}
+
+        serial = VariedLogitBiogemeConfig(settings, 1).process(model).result
+        parallel = VariedLogitBiogemeConfig(settings, max_workers).process(model).result
+
+        self.assertListEqual(parallel.columns.tolist(), serial.columns.tolist())
+        self.assertListEqual(parallel.index.tolist(), serial.index.tolist())
+        pd.testing.assert_frame_equal(parallel, serial)
+
+    @parameterized.expand([
+        ('serial', 1),
+        ('parallel', 2),
+    ])
+    def test_process_warm_start(self, name: str, max_workers: int):
+        model = TestVariedLogitBiogemeConfig.__b01logit_model()
+        config = VariedLogitBiogemeConfig({'x': FunctionalExpression('range(2)')}, max_workers)
+
+        cold = config.process(model)
+        warm = config.process(model, cold)
+
+        self.assertIsNone(cold.saved_iterations)
+        self.assertLess(warm.iterations, cold.iterations)
+        self.assertEqual(warm.saved_iterations, cold.iterations - warm.iterations)
+
+    @parameterized.expand([
+        ('serial', 1),
+        ('parallel', 2),
+    ])
+    def test_process_progress(self, name: str, max_workers: int):
+        model = TestVariedLogitBiogemeConfig.__b01logit_model()
+        config = VariedLogitBiogemeConfig({'x': FunctionalExpression('range(3)')}, max_workers)
+        progress = []
+
+        config.process(model, progress=lambda finished, total: progress.append((finished, total)))
+        self.assertListEqual(progress, [(1, 3), (2, 3), (3, 3)])
+
+    @parameterized.expand([
+        ('serial', 1),
+        ('parallel', 2),
+    ])
+    def test_process_cancelled(self, name: str, max_workers: int):
+        model = TestVariedLogitBiogemeConfig.__b01logit_model()
+        config = VariedLogitBiogemeConfig({'x': FunctionalExpression('range(3)')}, max_workers)
+        progress = []
+
+        with self.assertRaises(CancelledError):
+            config.process(model, progress=lambda finished, total: progress.append(finished),
+                           cancelled=lambda: len(progress) > 0)
+        self.assertLess(len(progress), 3)
+
+    def test_process_parallel_failed(self):
+        model = TestVariedLogitBiogemeConfig.__b01logit_model()
+        config = VariedLogitBiogemeConfig({'x': FunctionalExpression('range(2)')}, 2)
+
+        with tempfile.TemporaryDirectory() as directory:
+            components = [_FailingComponent(), *(_RecordingComponent(directory, idx) for idx in range(8))]
+            with patch.object(VariedLogitBiogemeConfig, 'components', components):
+                with self.assertRaises(ValueError):
+                    config.process(model)
+            # pending estimations are cancelled instead of being awaited
+            self.assertLess(len(os.listdir(directory)), 8)
+
+    def test_process_database_reuse(self):
+        import biogeme.database
+        model = TestVariedLogitBiogemeConfig.__b01logit_model()
+        config = VariedLogitBiogemeConfig({'x': FunctionalExpression('range(2)')}, 1)
+        SingleLogitBiogemeConfig.clear_database_cache()
+
+        with patch('biogeme.database.Database', wraps=biogeme.database.Database) as database:
+            config.process(model)
+            config.process(model.set_alternative('alt2', model.alternatives['alt2']))
+            self.assertEqual(database.call_count, 1)
+
+    def test_parallel_estimation_data(self):
+        model = TestVariedLogitBiogemeConfig.__b01logit_model()
+        serial = SingleLogitBiogemeConfig.estimation_data(model)
+
+        with SharedDataFrame(serial) as shared:
+            received = pickle.loads(pickle.dumps(shared))  # as received by a worker process
+            pd.testing.assert_frame_equal(received.attach(), serial)
+            received.close()
+
+    def test_process_not_shareable(self):
+        model = TestVariedLogitBiogemeConfig.__b01logit_model()
+        raw_data = model.data.raw_data.set_axis([f'row {idx}' for idx in model.data.raw_data.index])
+        model = Model(Data(raw_data, None, model.data.derivatives), model.alternatives, model.choice)
+        config = VariedLogitBiogemeConfig({'x': FunctionalExpression('range(2)')}, 2)
+
+        with patch('src.model.processing.VariedLogitBiogemeConfig.SharedDataFrame', wraps=SharedDataFrame) as shared:
+            shared.is_shareable = SharedDataFrame.is_shareable
+            result = config.process(model).result
+            shared.assert_not_called()
+        pd.testing.assert_frame_equal(result, VariedLogitBiogemeConfig(config.settings, 1).process(model).result)
+
+    def test_process_parallel_cleanup(self):
+        model = TestVariedLogitBiogemeConfig.__b01logit_model()
+        config = VariedLogitBiogemeConfig({'x': FunctionalExpression('range(2)')}, 2)
+
+        with tempfile.TemporaryDirectory() as directory:
+            with patch.dict(os.environ, {'TMPDIR': directory}):  # temporary directory of the spawned workers
+                config.process(model)
+            self.assertListEqual(os.listdir(directory), [])
+
+    def test_set_settings(self):
+        config = VariedLogitBiogemeConfig({}, 3).set_settings({'x': FunctionalExpression('range(2)')})
+        self.assertEqual(config.max_workers, 3)
+
+    def test_set_max_workers(self):
+        settings = {'x': FunctionalExpression('range(2)')}
+        config = VariedLogitBiogemeConfig(settings, 3).set_max_workers(1)
+        self.assertEqual(config.max_workers, 1)
+        self.assertIs(config.settings, settings)
+
 
 if __name__ == '__main__':
     unittest.main()
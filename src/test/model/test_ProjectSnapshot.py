@@ -112,6 +112,38 @@ class TestProjectSnapshot(unittest.TestCase):
         self.assertEqual(type(snapshot.get_evaluation()), pd.DataFrame)
         print(snapshot.get_evaluation())
 
+    def test_evaluation_warm_start(self):
+        derivatives = {
+            'TRAIN_TT_SCALED': FunctionalExpression('TRAIN_TT / 100'),
+            'SM_TT_SCALED': FunctionalExpression('SM_TT / 100'),
+            'CAR_TT_SCALED': FunctionalExpression('CAR_TT / 100'),
+        }
+        alternatives = {
+            'alt1': Alternative(FunctionalExpression('ASC_TRAIN + B_TIME * TRAIN_TT_SCALED'),
+                                availability_condition=FunctionalExpression('TRAIN_AV'), choice_idx=1),
+            'alt2': Alternative(FunctionalExpression('B_TIME * SM_TT_SCALED'),
+                                availability_condition=FunctionalExpression('SM_AV'), choice_idx=2),
+            'alt3': Alternative(FunctionalExpression('ASC_CAR + B_TIME * CAR_TT_SCALED'),
+                                availability_condition=FunctionalExpression('CAR_AV'), choice_idx=3)
+        }
+        raw_data = pd.read_csv(f'{os.path.dirname(__file__)}/processing/../../resources/swissmetro.csv', sep='\t')
+        raw_data = raw_data[raw_data['CHOICE'] != 0]
+        model = Model(Data(raw_data, None, derivatives), alternatives, FunctionalExpression('CHOICE'))
+        snapshot = ProjectSnapshot(model=model, processing_configs=[SingleLogitBiogemeConfig()],
+                                   selected_config_index=0)
+
+        snapshot.evaluate()
+        cold = snapshot.get_evaluation()
+        cold_iterations, cold_saved_iterations = snapshot.get_evaluation_iterations()
+        self.assertGreater(cold_iterations, 0)
+        self.assertIsNone(cold_saved_iterations)
+
+        snapshot.evaluate(warm_start=True)
+        warm_iterations, warm_saved_iterations = snapshot.get_evaluation_iterations()
+        self.assertLess(warm_iterations, cold_iterations)
+        self.assertEqual(warm_saved_iterations, cold_iterations - warm_iterations)
+        self.assertListEqual(snapshot.get_evaluation().index.tolist(), cold.index.tolist())
+
     def test_optimization(self):
         raise NotImplementedError
 
@@ -6,6 +6,8 @@ import unittest
 import pandas as pd
 
 from src.config import ConfigExpressionErrors as Config
+from src.config import ConfigHistory
+from src.model.ProjectChange import ProjectChange
 from src.model.ProjectSnapshot import ProjectSnapshot
 from src.model.ProxyProject import ProxyProject
 from src.model.SnapshotError import SnapshotError
@@ -143,6 +145,116 @@ class TestProxyProject(unittest.TestCase):
         self.assertEqual(type(proxy.get_evaluation()), pd.DataFrame)
         print(proxy.get_evaluation())
 
+    def test_calculate_evaluation(self):
+        raw_data = pd.DataFrame({'CHOICE': [1, 2, 1, 2, 2], 'x': [0.5, 1.0, 0.2, 2.0, 1.5]})
+        model = Model(Data(raw_data, None, {}), {
+            'alt1': Alternative(FunctionalExpression('0'), FunctionalExpression('1'), 1),
+            'alt2': Alternative(FunctionalExpression('ASC + B * x'), FunctionalExpression('1'), 2)
+        }, FunctionalExpression('CHOICE'))
+        proxy = ProxyProject(ProjectSnapshot(model=model, processing_configs=[SingleLogitBiogemeConfig()]))
+        progress = []
+
+        evaluation = proxy.calculate_evaluation(progress=lambda finished, total: progress.append((finished, total)))
+        self.assertEqual(proxy.get_evaluation(), None)  # calculating does not change the project
+        self.assertEqual(proxy.can_undo(), False)
+        self.assertListEqual(progress, [(1, 1)])
+
+        proxy.set_evaluation(evaluation)
+        self.assertEqual(proxy.get_evaluation().equals(evaluation.result), True)
+        proxy.undo()
+        self.assertEqual(proxy.get_evaluation(), None)
+
+    def test_outdated_evaluation(self):
+        raw_data = pd.DataFrame({'CHOICE': [1, 2, 1, 2, 2], 'x': [0.5, 1.0, 0.2, 2.0, 1.5]})
+        model = Model(Data(raw_data, None, {}), {
+            'alt1': Alternative(FunctionalExpression('0'), FunctionalExpression('1'), 1),
+            'alt2': Alternative(FunctionalExpression('ASC + B * x'), FunctionalExpression('1'), 2)
+        }, FunctionalExpression('CHOICE'))
+        proxy = ProxyProject(ProjectSnapshot(model=model, processing_configs=[SingleLogitBiogemeConfig()]))
+
+        basis = proxy.get_evaluation_basis()
+        proxy.set_derivatives(y=FunctionalExpression('x * 2'))  # changed while calculating
+        evaluation = proxy.calculate_evaluation(basis=basis)
+        self.assertRaises(SnapshotError, proxy.set_evaluation, evaluation, basis)
+        self.assertEqual(proxy.get_evaluation(), None)
+
+        proxy.undo()  # the evaluation belongs to the model again
+        proxy.set_evaluation(evaluation, basis)
+        self.assertEqual(proxy.get_evaluation().equals(evaluation.result), True)
+
+    def test_history_length(self):
+        proxy = ProxyProject(max_snapshots=3)
+        for idx in range(5):
+            proxy.set_derivatives(**{f'd{idx}': FunctionalExpression(str(idx))})
+
+        proxy.undo()
+        self.assertEqual(proxy.can_undo(), True)
+        proxy.undo()
+        self.assertEqual(proxy.can_undo(), False)  # the two oldest of six snapshots are removed
+        self.assertSetEqual(set(proxy.get_derivatives()), {'d0', 'd1', 'd2'})
+
+        proxy.set_derivatives(d5=FunctionalExpression('5'))
+        proxy.undo()
+        self.assertEqual(proxy.can_undo(), False)
+        self.assertEqual(proxy.can_redo(), True)
+
+    def test_history_memory(self):
+        raw_data = pd.DataFrame({'col1': range(1000)})
+        proxy = ProxyProject(max_memory=3 * raw_data.memory_usage(index=True).sum())
+        for _ in range(3):
+            proxy.set_raw_data(raw_data.copy(), None)
+        proxy.set_derivatives(d=FunctionalExpression('col1 * 2'))
+        proxy.undo()
+        proxy.undo()
+        self.assertEqual(proxy.can_undo(), True)  # tables shared between snapshots are counted once
+        proxy.redo()
+        proxy.redo()
+
+        proxy.get_raw_data(with_derivatives=True)  # calculated derivative columns are counted
+        proxy.set_choice(FunctionalExpression('col1'))
+        for _ in range(3):
+            proxy.undo()
+        self.assertEqual(proxy.can_undo(), False)
+
+    def test_history_clear_caches(self):
+        data = Data(pd.DataFrame({'col1': [1, 2]}), None, {'d': FunctionalExpression('col1 * 2')})
+        proxy = ProxyProject(ProjectSnapshot(model=Model(data, {}, FunctionalExpression(''))))
+        proxy.get_raw_data(with_derivatives=True)
+
+        proxy.set_choice(FunctionalExpression('col1'))  # data is shared with the new snapshot
+        self.assertIn('complete_data', data.__dict__)
+        proxy.set_derivatives(e=FunctionalExpression('d + 1'))
+        self.assertNotIn('complete_data', data.__dict__)
+
+    def test_changes(self):
+        proxy = ProxyProject()
+        initial = proxy.get_version()
+        self.assertEqual(proxy.get_changes(initial), ProjectChange())
+        proxy.set_derivatives(a=FunctionalExpression('1'), b=FunctionalExpression('a + 1'), c=FunctionalExpression('2'))
+        proxy.set_alternatives(alt=Alternative(FunctionalExpression('b'), FunctionalExpression('1'), 1))
+        version = proxy.get_version()
+
+        proxy.set_derivatives(a=FunctionalExpression('3'))  # dependents of a are affected as well
+        self.assertEqual(proxy.get_changes(version), ProjectChange(frozenset({'a', 'b'}), frozenset({'alt'})))
+        proxy.remove_derivatives('c')
+        self.assertEqual(proxy.get_changes(version), ProjectChange(frozenset({'a', 'b', 'c'}), frozenset({'alt'})))
+        self.assertEqual(proxy.get_changes(initial),
+                         ProjectChange(frozenset({'a', 'b', 'c'}), frozenset({'alt'})))
+
+        version = proxy.get_version()
+        proxy.undo()
+        self.assertEqual(proxy.get_changes(version), ProjectChange(frozenset({'c'})))
+        version = proxy.get_version()
+        proxy.set_raw_data(pd.DataFrame({'col1': [1]}), None)
+        self.assertEqual(proxy.get_changes(version).complete, True)
+
+        self.assertEqual(proxy.get_changes(ProxyProject().get_version()), None)  # version of another project
+        proxy = ProxyProject()
+        version = proxy.get_version()
+        for idx in range(ConfigHistory.MAX_CHANGES + 1):
+            proxy.set_choice(FunctionalExpression(str(idx)))
+        self.assertEqual(proxy.get_changes(version), None)  # the first change is not recorded anymore
+
     def test_optimization(self):
         raise NotImplementedError
 
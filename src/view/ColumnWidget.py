@@ -72,120 +72,178 @@ class ColumnWidget(QWidget):
             parent=self.__table)
         self.__table.setItemDelegate(self.__highlighting_delegate)
         self.__number_variables = 0
+        self.__labels: list[str] = []
+        self.__version: int | None = None  # version of the project displayed in the table
         self.__model.dataChanged.connect(self.change)
 
         self.update()
 
     def update(self):
-        """Function that gets the current Data from the model via the controller and puts the derivatives and data in the table"""
+        """Function that gets the current Data from the model via the controller and puts the derivatives and data in the table.
+        Only the rows of derivatives affected by the changes since the last update are replaced, all rows are
+        rebuilt if the raw data or the processing configuration changed."""
+        changes = self.__controller.get_changes(self.__version)
+        self.__version = self.__controller.get_version()
+        derivative_dict = self.__controller.get_derivatives()
+
+        if changes is None or changes.complete or not self.__update_rows(changes.derivatives, derivative_dict):
+            self.__rebuild(derivative_dict)
+
+        super().update()
 
+    def __rebuild(self, derivative_dict: dict[str, FunctionalExpression]):
+        """Clears the table and adds all variables of the raw data and all derivatives again.
+
+        Args:
+            derivative_dict (dict[str, FunctionalExpression]): All derivatives of the project.
+        """
         # get column widths
         column_widths = [self.__table.columnWidth(i) for i in range(self.__model.columnCount())]
-        
-        def _apply_error_report(function: FunctionalExpression, label: str) -> QStandardItem:
-            """Adds the highlights of the mistakes found in the definition of functions to the item displayed in the table.
-            The error messages are put into a ToolTip and the string markers are applied as highlights.
-
-            Args:
-                label (str): Label
-                function (FunctionalExpression): Functional expression to be put into the item.
-
-            Returns:
-                QStandardItem: The item containing the functional expression with its mistakes highlighted.
-            """
-            item = QStandardItem(function.expression)
-            error_report = self.__controller.get_error_report(label)
-
-            if error_report.valid:
-                return item
-
-            # set the highlighting of the errors on the item in the table
-            error_text = ConfigFunctionHighlighting.MISTAKE_TOOLTIP_START
-            highlights = []  # highlight format is [(start, end, "#FF00AA")]
-            for single_marker in error_report.marker:
-                highlights.append(
-                    (single_marker.begin, single_marker.end, single_marker.color_hex))
-                error_text += ConfigFunctionHighlighting.LIST_CHARACTER_MISTAKES_TOOLTIP + \
-                    function.expression[single_marker.begin: single_marker.end] + ": " + single_marker.message
-            item.setData(highlights, Qt.UserRole + 1)
-            item.setToolTip(error_text)
-            
-            # a faint background color to indicate mistakes even if they are not visible
-            background_color = QColor(150, 50, 50, 50)
-            item.setBackground(QBrush(background_color))
-            
-            return item
 
         # clear the model for the tree view to add updated data
         self.__labels = []
         self.__model.clear()
         self.__model.setHorizontalHeaderLabels(ConfigColumnWidget.HEADERS)
 
-        def datatype_to_string(datatype: type) -> str:
-            """Transforms a datatype to the string that will be displayed.
-            Either the <class> brackets will be removed or the numbers of the pandas datatypes will be removed.
-
-            Args:
-                datatype (type): The Datatype to be displayed.
-
-            Returns:
-                str: The String that will be put in the table.
-            """
-            if datatype is None:
-                return ConfigColumnWidget.FILLER_UNDETERMINED_DATATYPE
-
-            d_type_splitted = str(datatype).split(
-                "'")  # Python format is e.g. <class 'bool'>
-            if len(d_type_splitted) > 2 and re.fullmatch(ConfigRegexPatterns.PATTERN_DATATYPES, d_type_splitted[-2]):
-                return d_type_splitted[-2]
-            else:
-                # pandas datatypes shown as regular datatypes without bit number
-                d_type = str(datatype).split(".")[-1]# numpy datatypes may have format numpy.<datatype><number>
-                search = re.search(
-                    ConfigRegexPatterns.PATTERN_DATATYPES, d_type)
-                return d_type[search.start(): search.end()]
-
-        def make_uneditable_item(content: str) -> QStandardItem:
-            """Makes the grayed out standard items for the uneditable variables shown.
-
-            Args:
-                content (str): The content in the cell.
-
-            Returns:
-                QStandardItem: The item to be placed in the table.
-            """
-            item = QStandardItem(content)
-            item.setEditable(False)
-            item.setEnabled(False)
-            return item
-
         # get the data from the model and add it uneditable to the table
         raw_data_variables = self.__controller.get_variables()
         self.__number_variables = len(raw_data_variables)
 
         # set the variables once into the table but uneditable and unselectable
         for variable in raw_data_variables:
-            self.__model.appendRow([make_uneditable_item(variable), make_uneditable_item(datatype_to_string(
-                raw_data_variables[variable])), make_uneditable_item(ConfigColumnWidget.FILLER_EMPTY_DEFINITION)])
-
-        # display derivatives
-        derivative_dict = self.__controller.get_derivatives()
+            self.__model.appendRow([self.__make_uneditable_item(variable), self.__make_uneditable_item(
+                self.__datatype_to_string(raw_data_variables[variable])),
+                self.__make_uneditable_item(ConfigColumnWidget.FILLER_EMPTY_DEFINITION)])
 
         # iterate through all the derivative to be displayed.
         for label, derivative in derivative_dict.items():
-            row = [QStandardItem(label), make_uneditable_item(
-                datatype_to_string(self.__controller.get_derivative_type(label))), _apply_error_report(derivative, label)]
             self.__labels.append(label)
-            self.__model.appendRow(row)
+            self.__model.appendRow(self.__make_derivative_row(label, derivative))
 
-        super().update()
-        
         # add back column width
         for i, width in enumerate(column_widths):
             self.__table.setColumnWidth(i, width)
 
         self.__table.scrollToBottom()
 
+    def __update_rows(self, labels: frozenset[str], derivative_dict: dict[str, FunctionalExpression]) -> bool:
+        """Replaces, removes and appends the rows of the given derivatives. The other rows are kept.
+
+        Args:
+            labels (frozenset[str]): Labels of the derivatives whose rows changed.
+            derivative_dict (dict[str, FunctionalExpression]): All derivatives of the project.
+
+        Returns:
+            bool: False if the rows are not in the order of the derivatives afterwards, so the table has to be rebuilt.
+        """
+        appended = False
+        for label in labels:
+            if label in self.__labels:
+                row = self.__number_variables + self.__labels.index(label)
+                self.__model.removeRow(row)
+                if label in derivative_dict:
+                    self.__model.insertRow(row, self.__make_derivative_row(label, derivative_dict[label]))
+                else:
+                    self.__labels.remove(label)
+            elif label in derivative_dict:
+                self.__labels.append(label)
+                self.__model.appendRow(self.__make_derivative_row(label, derivative_dict[label]))
+                appended = True
+
+        if self.__labels != list(derivative_dict):
+            return False
+        if appended:
+            self.__table.scrollToBottom()
+        return True
+
+    def __make_derivative_row(self, label: str, derivative: FunctionalExpression) -> list[QStandardItem]:
+        """Makes the items of the row of a derivative, validating the derivative.
+
+        Args:
+            label (str): Label of the derivative.
+            derivative (FunctionalExpression): Functional expression of the derivative.
+
+        Returns:
+            list[QStandardItem]: The items of the row.
+        """
+        return [QStandardItem(label), self.__make_uneditable_item(
+            self.__datatype_to_string(self.__controller.get_derivative_type(label))),
+            self.__apply_error_report(derivative, label)]
+
+    def __apply_error_report(self, function: FunctionalExpression, label: str) -> QStandardItem:
+        """Adds the highlights of the mistakes found in the definition of functions to the item displayed in the table.
+        The error messages are put into a ToolTip and the string markers are applied as highlights.
+
+        Args:
+            label (str): Label
+            function (FunctionalExpression): Functional expression to be put into the item.
+
+        Returns:
+            QStandardItem: The item containing the functional expression with its mistakes highlighted.
+        """
+        item = QStandardItem(function.expression)
+        error_report = self.__controller.get_error_report(label)
+
+        if error_report.valid:
+            return item
+
+        # set the highlighting of the errors on the item in the table
+        error_text = ConfigFunctionHighlighting.MISTAKE_TOOLTIP_START
+        highlights = []  # highlight format is [(start, end, "#FF00AA")]
+        for single_marker in error_report.marker:
+            highlights.append(
+                (single_marker.begin, single_marker.end, single_marker.color_hex))
+            error_text += ConfigFunctionHighlighting.LIST_CHARACTER_MISTAKES_TOOLTIP + \
+                function.expression[single_marker.begin: single_marker.end] + ": " + single_marker.message
+        item.setData(highlights, Qt.UserRole + 1)
+        item.setToolTip(error_text)
+
+        # a faint background color to indicate mistakes even if they are not visible
+        background_color = QColor(150, 50, 50, 50)
+        item.setBackground(QBrush(background_color))
+
+        return item
+
+    @staticmethod
+    def __datatype_to_string(datatype: type) -> str:
+        """Transforms a datatype to the string that will be displayed.
+        Either the <class> brackets will be removed or the numbers of the pandas datatypes will be removed.
+
+        Args:
+            datatype (type): The Datatype to be displayed.
+
+        Returns:
+            str: The String that will be put in the table.
+        """
+        if datatype is None:
+            return ConfigColumnWidget.FILLER_UNDETERMINED_DATATYPE
+
+        d_type_splitted = str(datatype).split(
+            "'")  # Python format is e.g. <class 'bool'>
+        if len(d_type_splitted) > 2 and re.fullmatch(ConfigRegexPatterns.PATTERN_DATATYPES, d_type_splitted[-2]):
+            return d_type_splitted[-2]
+        else:
+            # pandas datatypes shown as regular datatypes without bit number
+            d_type = str(datatype).split(".")[-1]# numpy datatypes may have format numpy.<datatype><number>
+            search = re.search(
+                ConfigRegexPatterns.PATTERN_DATATYPES, d_type)
+            return d_type[search.start(): search.end()]
+
+    @staticmethod
+    def __make_uneditable_item(content: str) -> QStandardItem:
+        """Makes the grayed out standard items for the uneditable variables shown.
+
+        Args:
+            content (str): The content in the cell.
+
+        Returns:
+            QStandardItem: The item to be placed in the table.
+        """
+        item = QStandardItem(content)
+        item.setEditable(False)
+        item.setEnabled(False)
+        return item
+
     def initiate_update(self):
         """Function used to send the signal to the Main window so that everything gets updated
         """
@@ -1,3 +1,4 @@
+import numpy as np
 from PyQt5.QtCore import QAbstractTableModel, Qt
 from PyQt5.QtGui import QColor
 
@@ -6,7 +7,11 @@ class DataFrameToTableModel(QAbstractTableModel):
     """
     This class is used to create a table model from a DataFrame(Evaluation), so
     it can be inserted into QTableView in EvaluationWidget GUI.
+    The values, the threshold mask and the header labels are precomputed once per model,
+    the text of a cell is only created when the cell is displayed for the first time.
     """
+    __HIGHLIGHT_COLOR = QColor(128, 128, 128, alpha=128)
+
     def __init__(self, data, thresholds: dict):
         """
         Initializes a new table model
@@ -14,11 +19,15 @@ class DataFrameToTableModel(QAbstractTableModel):
         @type data: DataFrame
         @param thresholds: the thresholds to be applied on the evaluation
         @type thresholds: dictionary, where the columns (string) are the keys
-            and the thresholds (float) are the thresholds
+            and the thresholds (float) are the thresholds, in the order of the columns
         """
         super().__init__()
-        self.data = data
-        self.thresholds = thresholds
+        self.__values = data.to_numpy()
+        self.__above_threshold = np.asarray(self.__values > np.array(list(thresholds.values()), dtype=float),
+                                            dtype=bool)
+        self.__texts = np.full(self.__values.shape, None, dtype=object)  # filled when a cell is displayed
+        self.__column_labels = [str(label) for label in data.columns]
+        self.__row_labels = [str(label) for label in data.index]
 
     def rowCount(self, parent=None):
         """
@@ -28,7 +37,7 @@ class DataFrameToTableModel(QAbstractTableModel):
         @return: numer of rows
         @rtype: int
         """
-        return self.data.shape[0]
+        return self.__values.shape[0]
 
     def columnCount(self, parent=None):
         """
@@ -38,7 +47,7 @@ class DataFrameToTableModel(QAbstractTableModel):
         @return: number of columns
         @rtype: int
         """
-        return self.data.shape[1]
+        return self.__values.shape[1]
 
     def data(self, index, role=Qt.DisplayRole):
         """
@@ -49,24 +58,23 @@ class DataFrameToTableModel(QAbstractTableModel):
         @param role: Qt.DisplayRole stands for the item's element's role.
                     An element with this role contains the key data to be rendered in from of a text
         @type role: int
-        @return: The value to be displayed and the cell's color
-        @rtype:
+        @return: The value to be displayed and the cell's color, None for other roles
+        @rtype: dict
         """
+        if role != Qt.DisplayRole:
+            return None
+
         row = index.row()
         column = index.column()
-        cell_value = self.data.iloc[row, column]
-        threshold = list(self.thresholds.values())[column]
+        text = self.__texts[row, column]
+        if text is None:
+            text = self.__texts[row, column] = str(self.__values[row, column])
 
-        if cell_value > threshold:
-            return {
-                    'value': str(cell_value),
-                    'background_color': QColor(128, 128, 128, alpha=128)
-            }
-        else:
-            return {
-                'value': str(cell_value),
-                'background_color': None
-            }
+        return {
+            'value': text,
+            'background_color': DataFrameToTableModel.__HIGHLIGHT_COLOR if self.__above_threshold[row, column]
+            else None
+        }
 
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         """
@@ -83,6 +91,6 @@ class DataFrameToTableModel(QAbstractTableModel):
         """
         if role == Qt.DisplayRole:
             if orientation == Qt.Horizontal:
-                return str(self.data.columns[section])
+                return self.__column_labels[section]
             else:
-                return str(self.data.index[section])
\ No newline at end of file
+                return self.__row_labels[section]
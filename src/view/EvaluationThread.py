@@ -0,0 +1,67 @@
+from __future__ import annotations
+import threading
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from src.controller.calculation.EvaluationController import EvaluationController
+
+
+class EvaluationThread(QThread):
+    """
+    This class calculates an evaluation in the background, so the user interface stays responsive.
+    The calculated evaluation is not stored by this thread, it is emitted and has to be stored in the thread of the
+    user interface. After a cancellation nothing is emitted anymore, even if a running estimation finishes.
+    """
+
+    progress_signal = pyqtSignal(int, int)
+    evaluation_signal = pyqtSignal(object)
+    error_signal = pyqtSignal(object)
+
+    def __init__(self, controller: EvaluationController, warm_start: bool = False, parent=None):
+        """
+        Initializes a new evaluation thread.
+        The model and the processing configuration are fixed when the thread is created,
+        later changes of the project do not affect the calculation.
+        @param controller: The controller calculating the evaluation
+        @type controller: EvaluationController
+        @param warm_start: Whether the calculation starts from the results of the current evaluation
+        @type warm_start: bool
+        @param parent: The parent of the thread
+        @type parent: QObject
+        """
+        super().__init__(parent)
+        self.__controller = controller
+        self.__warm_start = warm_start
+        self.__cancelled = threading.Event()
+        self.basis = controller.get_evaluation_basis()
+
+    def run(self):
+        """
+        Calculates the evaluation and emits the result or the occurred error, if not cancelled.
+        """
+        try:
+            evaluation = self.__controller.calculate_evaluation(self.__warm_start, self.__progress,
+                                                                self.__cancelled.is_set, self.basis)
+        except Exception as e:
+            if not self.is_cancelled():
+                self.error_signal.emit(e)
+            return
+        if not self.is_cancelled():
+            self.evaluation_signal.emit(evaluation)
+
+    def __progress(self, finished: int, total: int):
+        if not self.is_cancelled():
+            self.progress_signal.emit(finished, total)
+
+    def cancel(self):
+        """
+        Cancels the calculation. Estimations which are not started yet are skipped.
+        """
+        self.__cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        """
+        @return: Whether the calculation has been cancelled
+        @rtype: bool
+        """
+        return self.__cancelled.is_set()
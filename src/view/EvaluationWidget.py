@@ -1,11 +1,12 @@
 from __future__ import annotations
 import os
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QWidget, QPushButton, QToolButton, QTableView, QMessageBox
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtWidgets import QWidget, QPushButton, QToolButton, QTableView, QProgressDialog
 from PyQt5 import uic
 
 from src.controller.calculation.EvaluationController import EvaluationController
+from src.view.EvaluationThread import EvaluationThread
 from src.view.ThresholdWindow import ThresholdWindow
 from src.view.DataFrameToTableModel import DataFrameToTableModel
 from src.view.CellColoringDelegate import CellColoringDelegate
@@ -19,8 +20,11 @@ class EvaluationWidget(QWidget):
     This class represents the evaluation widget in the GUI,
     where the user can request to evaluate the functions and export them.
     The user can also set thresholds or optimize the model
+    The evaluation is calculated in the background, the evaluation_update_signal is emitted, when it has been stored.
     """
 
+    evaluation_update_signal = pyqtSignal()
+
     def __init__(self, parent=None):
         """
         Initializes a new evaluation widget.
@@ -34,6 +38,9 @@ class EvaluationWidget(QWidget):
         uic.loadUi(f'{os.path.dirname(__file__)}/ui/evaluation.ui', self)  # load ui file created with Qt Creator
 
         self.__controller: EvaluationController = EvaluationController()
+        self.__thread: EvaluationThread | None = None
+        self.__running_threads: set[EvaluationThread] = set()  # including cancelled threads, which did not finish yet
+        self.__progress_dialog: QProgressDialog | None = None
 
         self.table = self.findChild(QTableView, "table")
 
@@ -88,29 +95,105 @@ class EvaluationWidget(QWidget):
             self.__controller.set_thresholds(thresholds)
             self.display_evaluation()
 
-    @display_exceptions
     def evaluate(self):
         """
-        This function sends a request for evaluation to the controller.
-        Then it gets the results and displays them to the user.
-        The displaying occurs by automatically calling update()
-        """
-        
-        # Info window that calculation is happening
-        progress_dialog = QMessageBox(self)
-        progress_dialog.setWindowTitle(Cfg.TEXT_CALCULATION)
-        progress_dialog.setStandardButtons(QMessageBox.NoButton) 
-        progress_dialog.setText(Cfg.TEXT_CALCULATION)
-        progress_dialog.open()
-        
-        try:
-            self.__controller.evaluate()
-            self.optimize_button.setEnabled(self.__controller.is_optimizable())
-            self.display_evaluation()
-            progress_dialog.hide()
-        except Exception as e:
-            progress_dialog.hide()
-            raise e
+        This function starts the calculation of the evaluation in the background.
+        A progress dialog informs about the finished estimations and allows to cancel the calculation.
+        The rest of the application can be used during the calculation.
+        When the calculation is finished, the evaluation is stored in the project and displayed.
+        """
+        if self.__thread is not None:
+            return  # only one calculation at a time
+
+        thread = EvaluationThread(self.__controller, parent=self)
+        thread.progress_signal.connect(self.__show_progress)
+        thread.evaluation_signal.connect(self.__set_evaluation)
+        thread.error_signal.connect(self.show_evaluation_error)
+        thread.finished.connect(self.__thread_finished)
+        self.__thread = thread
+        self.__running_threads.add(thread)
+
+        # non-modal info window that calculation is happening
+        self.__progress_dialog = QProgressDialog(Cfg.TEXT_CALCULATION, Cfg.TEXT_CANCEL, 0, 0, self)
+        self.__progress_dialog.setWindowTitle(Cfg.TEXT_CALCULATION)
+        self.__progress_dialog.setWindowModality(Qt.NonModal)
+        self.__progress_dialog.setMinimumDuration(0)
+        self.__progress_dialog.setAutoClose(False)
+        self.__progress_dialog.setAutoReset(False)
+        self.__progress_dialog.canceled.connect(self.cancel_evaluation)
+        self.__progress_dialog.show()
+
+        self.calculate_button.setEnabled(False)
+        self.__thread.start()
+
+    def cancel_evaluation(self):
+        """
+        This function cancels a running calculation. Its result is discarded.
+        """
+        if self.__thread is not None:
+            self.__thread.cancel()
+        self.__finish_evaluation()
+
+    def wait_for_evaluation(self):
+        """
+        This function blocks until all calculations in the background, including cancelled ones, have finished.
+        A cancelled calculation finishes after its running estimation.
+        """
+        for thread in list(self.__running_threads):
+            thread.wait()
+
+    def __thread_finished(self):
+        thread = self.sender()
+        self.__running_threads.discard(thread)
+        thread.deleteLater()
+
+    def __is_current(self, thread) -> bool:
+        # signals of a cancelled or replaced thread may still be queued
+        return thread is not None and thread is self.__thread and not thread.is_cancelled()
+
+    def __show_progress(self, finished: int, total: int):
+        if self.__is_current(self.sender()) and self.__progress_dialog is not None:
+            self.__progress_dialog.setMaximum(total)
+            self.__progress_dialog.setValue(finished)
+            self.__progress_dialog.setLabelText(Cfg.TEXT_PROGRESS % (finished, total))
+
+    def __set_evaluation(self, evaluation):
+        thread = self.sender()
+        if not self.__is_current(thread):
+            return
+        self.__finish_evaluation()
+        self.__store_evaluation(evaluation, thread.basis)
+
+    @display_exceptions
+    def __store_evaluation(self, evaluation, basis):
+        self.__controller.set_evaluation(evaluation, basis)  # fails, if the model has been changed meanwhile
+        self.optimize_button.setEnabled(self.__controller.is_optimizable())
+        self.display_evaluation()
+        self.evaluation_update_signal.emit()
+
+    def show_evaluation_error(self, error: Exception):
+        """
+        This function displays an error, which occurred during the calculation in the background.
+        Errors of cancelled calculations are ignored.
+        @param error: The occurred error
+        @type error: Exception
+        """
+        if not self.__is_current(self.sender()):
+            return
+        self.__finish_evaluation()
+        self.__show_error(error)
+
+    @display_exceptions
+    def __show_error(self, error: Exception):
+        raise error
+
+    def __finish_evaluation(self):
+        self.__thread = None  # a cancelled thread finishes in the background and is deleted afterwards
+        if self.__progress_dialog is not None:
+            self.__progress_dialog.canceled.disconnect(self.cancel_evaluation)
+            self.__progress_dialog.close()
+            self.__progress_dialog = None
+        self.calculate_button.setEnabled(True)
 
     def optimize(self):
         """
@@ -123,7 +206,7 @@ class EvaluationWidget(QWidget):
         """
         This enables the user to export the results to a path of his/her choice
         """
-        path = FileManagementWindow().save_file(Cfg.EXPORT_DIALOG_TITLE, Cfg.CSV_FILE_FORMAT)
+        path = FileManagementWindow().save_file(Cfg.EXPORT_DIALOG_TITLE, Cfg.EXPORT_FILE_FORMATS)
         if path:
             self.__controller.export(path)
 
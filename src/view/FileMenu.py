@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from PyQt5.QtCore import pyqtSignal
-from PyQt5.QtWidgets import QMenu, QFileDialog, QMenuBar
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtWidgets import QMenu, QFileDialog, QMenuBar, QProgressDialog
 
 from src.view.UIUtil import get_action, display_exceptions
 from src.view.Menu import Menu
@@ -130,12 +130,25 @@ class FileMenu(Menu):
     @display_exceptions
     def import_data(self):  # TODO Empfehlung
         """
-        Using this option in FileMenu, the user can import the survey data, which are stored in a csv file.
+        Using this option in FileMenu, the user can import the survey data, which are stored in a csv, Parquet or
+        Feather file.
         """
         path = FileManagementWindow().open_file(Cfg.IMPORT_DATA_DIALOG_TITLE,
-                                                QFileDialog.ExistingFile, Cfg.CSV_FILE_FORMAT)
+                                                QFileDialog.ExistingFile, Cfg.DATA_FILE_FORMATS)
         if path:
-            self.__project_manager.import_raw_data(path)
+            progress_dialog = QProgressDialog(Cfg.IMPORT_DATA_PROGRESS_TEXT, None, 0, 0, self.parent())
+            progress_dialog.setWindowTitle(Cfg.IMPORT_DATA_DIALOG_TITLE)
+            progress_dialog.setWindowModality(Qt.WindowModal)  # setValue keeps the window responsive while reading
+            progress_dialog.setMinimumDuration(Cfg.IMPORT_DATA_PROGRESS_DELAY)
+
+            def progress(read: int, size: int):
+                progress_dialog.setMaximum(max(size, 1))
+                progress_dialog.setValue(min(read, size))
+
+            try:
+                self.__project_manager.import_raw_data(path, progress)
+            finally:
+                progress_dialog.close()
             self.new_file_signal.emit()
 
     def export_data(self):  # TODO how to specify file type? csv, JSON?
@@ -154,7 +167,7 @@ class FileMenu(Menu):
             if not continue_import:
                 return
         
-        path = FileManagementWindow().save_file(Cfg.EXPORT_DATA_DIALOG_TITLE, Cfg.CSV_FILE_FORMAT)
+        path = FileManagementWindow().save_file(Cfg.EXPORT_DATA_DIALOG_TITLE, Cfg.DATA_FILE_FORMATS)
         if path:
             self.__project_manager.export_raw_data(path)
 
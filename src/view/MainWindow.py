@@ -48,8 +48,10 @@ class MainWindow(QMainWindow):
         self.__evaluation: EvaluationWidget = EvaluationWidget()
         self.layout_page_eval.setContentsMargins(0, 0, 0, 0)
         self.layout_page_eval.addWidget(self.__evaluation)
+        self.__evaluation.evaluation_update_signal.connect(self.update)
 
         self.__file_menu: FileMenu = FileMenu(parent=self.menuBar())
+        self.__file_menu.new_file_signal.connect(self.__evaluation.cancel_evaluation)  # evaluation of another data
         self.__file_menu.new_file_signal.connect(self.update)
         self.__edit_menu: EditMenu = EditMenu(parent=self.menuBar())
         self.__edit_menu.refresh_project_signal.connect(self.update)
@@ -66,4 +68,6 @@ class MainWindow(QMainWindow):
         self.__evaluation.update()
 
     def closeEvent(self, event) -> None:
+        self.__evaluation.cancel_evaluation()
+        self.__evaluation.wait_for_evaluation()  # a running thread must not be destroyed with the window
         self.__file_menu.close_project()
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import bisect
 import os
 
 from PyQt5.QtWidgets import (
@@ -15,6 +16,7 @@ from PyQt5.QtGui import QStandardItemModel, QStandardItem, QColor, QBrush
 from PyQt5 import uic
 
 from src.controller.functions.AlternativeController import AlternativeController
+from src.model.data.Alternative import Alternative
 from src.model.data.functions.FunctionalExpression import FunctionalExpression
 from src.view.FileManagementWindow import FileManagementWindow
 from src.view.UserInputDialog import UserInputDialog
@@ -71,60 +73,36 @@ class ModelWidget(QWidget):
         self.__table.setItemDelegate(self.__delegate)
         self.__table.doubleClicked.connect(self._handle_data_changed)
 
+        self.__labels: list[str] = []
+        self.__version: int | None = None  # version of the project displayed in the table
         self.update()
 
     def update(self):
         """Gets the current information from the model and displays it.
+        Only the rows of alternatives affected by the changes since the last update are replaced, all rows are
+        rebuilt if the raw data or the processing configuration changed.
         """
-        
-        column_widths = [self.__table.columnWidth(i) for i in range(self.__model.columnCount())]
-        
         super().update()
 
-        def _apply_error_report(label: str, function: FunctionalExpression, availability: bool = False) -> QStandardItem:
-            """Adds the highlights of the mistakes found in the definition of functions to the item displayed in the table.
-            The error messages are put into a ToolTip and the string markers are applied as highlights.
-
-            Args:
-                label (str): Label of the Alternative
-                function (FunctionalExpression): Functional expression to be put into the item.
-
-            Returns:
-                QStandardItem: The item containing the functional expression with its mistakes highlighted.
-            """
-            item = QStandardItem(function.expression)
-
-            if availability:
-                error_report = self.__controller.get_availability_condition_error_report(
-                    label)
-            else:
-                error_report = self.__controller.get_error_report(label)
-
-            if error_report.valid:
-                return item
-
-            # set the highlighting of the errors on the item in the table
-            error_text = ConfigFunctionHighlighting.MISTAKE_TOOLTIP_START
-            # format is [(1, 3, "#FF00F0"), (4, 9, "#0000F0")]
-            highlights = []
-
-            for single_marker in error_report.marker:
-                highlights.append(
-                    (single_marker.begin, single_marker.end, single_marker.color_hex))
-                error_text += ConfigFunctionHighlighting.LIST_CHARACTER_MISTAKES_TOOLTIP + \
-                    single_marker.message
-            item.setData(highlights, Qt.UserRole + 1)
-            item.setToolTip(error_text)
-            
-            # a faint background color to indicate mistakes even if they are not visible
-            background_color = QColor(150, 50, 50, 50)
-            item.setBackground(QBrush(background_color))
-
-            return item
+        changes = self.__controller.get_changes(self.__version)
+        self.__version = self.__controller.get_version()
 
         # get the data from the model and make a list out of it
         alternative_dict = self.__controller.get_alternatives()
 
+        if changes is None or changes.complete:
+            self.__rebuild(alternative_dict)
+        else:
+            self.__update_rows(changes.alternatives, alternative_dict)
+
+    def __rebuild(self, alternative_dict: dict[str, Alternative]):
+        """Clears the table and adds all alternatives again.
+
+        Args:
+            alternative_dict (dict[str, Alternative]): All alternatives of the project.
+        """
+        column_widths = [self.__table.columnWidth(i) for i in range(self.__model.columnCount())]
+
         # label need to be saved to know them after they have been changed
         self.__labels = []
 
@@ -135,16 +113,89 @@ class ModelWidget(QWidget):
 
         # iterate through all the alternatives to be displayed.
         for label, alternative in sorted(alternative_dict.items(), key=lambda a: a[0]):
-            row = [QStandardItem(label), _apply_error_report(label,
-                                                             alternative.function), _apply_error_report(label, alternative.availability_condition, availability=True), QStandardItem(str(alternative.choice_idx))]
             self.__labels.append(label)
-            self.__model.appendRow(row)
-        
+            self.__model.appendRow(self.__make_row(label, alternative))
+
         # add back column width
         for i, width in enumerate(column_widths):
             self.__table.setColumnWidth(i, width)
 
-            
+    def __update_rows(self, labels: frozenset[str], alternative_dict: dict[str, Alternative]):
+        """Replaces, removes and inserts the rows of the given alternatives. The other rows are kept.
+        The rows stay sorted by the labels.
+
+        Args:
+            labels (frozenset[str]): Labels of the alternatives whose rows changed.
+            alternative_dict (dict[str, Alternative]): All alternatives of the project.
+        """
+        for label in sorted(labels):
+            row = bisect.bisect_left(self.__labels, label)
+            exists = row < len(self.__labels) and self.__labels[row] == label
+            if exists:
+                self.__model.removeRow(row)
+            if label in alternative_dict:
+                self.__model.insertRow(row, self.__make_row(label, alternative_dict[label]))
+                if not exists:
+                    self.__labels.insert(row, label)
+            elif exists:
+                self.__labels.pop(row)
+
+    def __make_row(self, label: str, alternative: Alternative) -> list[QStandardItem]:
+        """Makes the items of the row of an alternative, validating the alternative.
+
+        Args:
+            label (str): Label of the alternative.
+            alternative (Alternative): The alternative.
+
+        Returns:
+            list[QStandardItem]: The items of the row.
+        """
+        return [QStandardItem(label), self.__apply_error_report(label, alternative.function),
+                self.__apply_error_report(label, alternative.availability_condition, availability=True),
+                QStandardItem(str(alternative.choice_idx))]
+
+    def __apply_error_report(self, label: str, function: FunctionalExpression,
+                             availability: bool = False) -> QStandardItem:
+        """Adds the highlights of the mistakes found in the definition of functions to the item displayed in the table.
+        The error messages are put into a ToolTip and the string markers are applied as highlights.
+
+        Args:
+            label (str): Label of the Alternative
+            function (FunctionalExpression): Functional expression to be put into the item.
+
+        Returns:
+            QStandardItem: The item containing the functional expression with its mistakes highlighted.
+        """
+        item = QStandardItem(function.expression)
+
+        if availability:
+            error_report = self.__controller.get_availability_condition_error_report(
+                label)
+        else:
+            error_report = self.__controller.get_error_report(label)
+
+        if error_report.valid:
+            return item
+
+        # set the highlighting of the errors on the item in the table
+        error_text = ConfigFunctionHighlighting.MISTAKE_TOOLTIP_START
+        # format is [(1, 3, "#FF00F0"), (4, 9, "#0000F0")]
+        highlights = []
+
+        for single_marker in error_report.marker:
+            highlights.append(
+                (single_marker.begin, single_marker.end, single_marker.color_hex))
+            error_text += ConfigFunctionHighlighting.LIST_CHARACTER_MISTAKES_TOOLTIP + \
+                single_marker.message
+        item.setData(highlights, Qt.UserRole + 1)
+        item.setToolTip(error_text)
+
+        # a faint background color to indicate mistakes even if they are not visible
+        background_color = QColor(150, 50, 50, 50)
+        item.setBackground(QBrush(background_color))
+
+        return item
+
     def initiate_update(self):
         """Function used to send the signal to the Main window so that everything gets updated.
         """